@@ -0,0 +1,144 @@
+# backend/core/auth_cache.py
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from backend.core.cache import VersionedCache
+from backend.core.config import settings
+from backend.models.user import User
+from backend.models.institution_admin import InstitutionAdmin
+
+# ✅ 인증용 사용자 / 기관 관리자 레코드 캐시 (세션에서 분리된 인스턴스 보관)
+user_cache = VersionedCache(
+    "auth_user",
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+)
+institution_admin_cache = VersionedCache(
+    "auth_institution_admin",
+    ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+)
+
+
+def _role_value(role) -> str:
+    return getattr(role, "value", role)
+
+
+# ✅ 액세스 토큰에 서명해 넣을 권한 클레임 (발급 시점 기준)
+def build_token_claims(db: Session, user: User) -> Dict[str, Any]:
+    """
+    - role / act(활성 여부) / inst(승인된 기관 관리자 소속 목록)
+    - 권한이 바뀌면 get_current_user 가 클레임과 현재 레코드 불일치로 토큰을 거부 → 재발급 필요
+    """
+    admins = db.query(InstitutionAdmin).filter(
+        InstitutionAdmin.user_id == user.user_id,
+        InstitutionAdmin.approved == True
+    ).all()
+    return {
+        "sub": str(user.user_id),
+        "role": _role_value(user.role),
+        "act": bool(user.is_active),
+        "inst": [{"type": a.institution_type, "name": a.institution_name} for a in admins],
+    }
+
+
+# ✅ 토큰 클레임과 현재 사용자 레코드 비교 (클레임 없는 이전 토큰은 통과)
+def claims_match(payload: Dict[str, Any], user: User) -> bool:
+    if "role" in payload and payload["role"] != _role_value(user.role):
+        return False
+    if "act" in payload and payload["act"] != bool(user.is_active):
+        return False
+    return True
+
+
+# ✅ 토큰의 기관 관리자 클레임 확인 (None: 클레임 없는 이전 토큰 → DB 확인 필요)
+def claims_institution(payload: Dict[str, Any], institution_type: str) -> Optional[List[str]]:
+    if "inst" not in payload:
+        return None
+    return [i["name"] for i in payload["inst"] if i.get("type") == institution_type]
+
+
+# ✅ 캐시된 사용자 조회 (적중 시 SELECT 없이 현재 세션에 병합)
+def get_cached_user(db: Session, user_id: str) -> Optional[User]:
+    """
+    캐시에는 세션에서 분리(expunge)된 User 를 보관하고, 요청마다 db.merge(load=False) 로 현재 세션에 붙입니다.
+    - 요청마다 캐시 조회 + merge 는 항상 수행 (SELECT 만 생략) → 토큰 클레임은 DB 가 아니라 이 캐시 값과 비교됨
+    - 병합된 인스턴스는 일반 ORM 객체처럼 lazy load / 수정 / 삭제 가능
+    - 역할 변경 / 비활성화 / 탈퇴 시 invalidate_user_auth() 로 즉시 무효화 (다른 워커는 TTL 안에 반영)
+    """
+    def load(version):
+        user = db.query(User).filter(User.user_id == user_id).first()
+        if user is not None:
+            db.expunge(user)
+        return user
+
+    cached = user_cache.get(str(user_id), load)
+    if cached is None:
+        return None
+    return db.merge(cached, load=False)
+
+
+# ✅ 캐시된 기관 관리자 조회 (승인된 관리자만)
+def get_cached_institution_admin(db: Session, user_id: str, institution_type: str) -> Optional[InstitutionAdmin]:
+    def load(version):
+        admin = db.query(InstitutionAdmin).filter(
+            InstitutionAdmin.user_id == user_id,
+            InstitutionAdmin.institution_type == institution_type,
+            InstitutionAdmin.approved == True
+        ).first()
+        if admin is not None:
+            db.expunge(admin)
+        return admin
+
+    cached = institution_admin_cache.get((str(user_id), institution_type), load)
+    if cached is None:
+        return None
+    return db.merge(cached, load=False)
+
+
+# ✅ 역할 변경 / 비활성화 / 탈퇴 / 기관 관리자 승인 변경 시 호출
+def invalidate_user_auth(user_id) -> None:
+    user_id = str(user_id)
+    user_cache.invalidate(user_id)
+    institution_admin_cache.invalidate_many([(user_id, "school"), (user_id, "company")])
+
+
+def auth_cache_stats() -> Dict[str, Any]:
+    return {cache.name: cache.stats() for cache in (user_cache, institution_admin_cache)}
+
+
+if __name__ == "__main__":
+    # ✅ 요청당 인증 비용 측정: python -m backend.core.auth_cache [반복 횟수] [user_id]
+    # DB 의 사용자 1명(지정하지 않으면 첫 번째 사용자)으로 SELECT 조회 / 캐시 조회 + merge / JWT 디코드 포함 전체를 비교
+    import sys
+    import time
+
+    from backend.core import security
+    from backend.core.token import create_access_token
+    from backend.database.database import SessionLocal
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.user_id == sys.argv[2]).first() if len(sys.argv) > 2 else db.query(User).first()
+        if user is None:
+            sys.exit("❌ 측정할 사용자가 없습니다.")
+        user_id = str(user.user_id)
+        claims = build_token_claims(db, user)
+        token = create_access_token(claims)
+        db.expunge_all()
+
+        def measure(label, fn):
+            started = time.perf_counter()
+            for _ in range(count):
+                fn()
+                db.expunge_all()  # ✅ 요청마다 새 세션인 것처럼 identity map 비움
+            elapsed = time.perf_counter() - started
+            print(f"✅ {label:<32} {elapsed:.3f}s ({elapsed / count * 1e6:.1f} µs/request)")
+
+        measure("SELECT (캐시 없음)", lambda: claims_match(claims, db.query(User).filter(User.user_id == user_id).first()))
+        measure("get_cached_user (조회 + merge)", lambda: claims_match(claims, get_cached_user(db, user_id)))
+        measure("get_current_user (JWT + 캐시)", lambda: security.get_current_user(token, db))
+    finally:
+        db.close()
@@ -0,0 +1,53 @@
+# backend/core/blind_index.py
+
+import hashlib
+import hmac
+import re
+from typing import Set
+
+from backend.core.config import settings
+
+# ✅ 블라인드 인덱스 키 (별도 키 권장, 없으면 AES 키에서 용도 분리하여 파생)
+_KEY = hmac.new(
+    (settings.BLIND_INDEX_KEY or settings.AES_SECRET_KEY or "").encode(),
+    b"narulab-blind-index-v1",
+    hashlib.sha256
+).digest()
+
+# ✅ 검색 토큰 n-gram 길이 / 저장 길이 (64비트로 잘라 저장 → 원문 추측 어렵게, 충돌은 AND 조건으로 상쇄)
+NGRAM_SIZE = 3
+SEARCH_TOKEN_LENGTH = 16
+
+_NON_DIGIT = re.compile(r"\D")
+
+
+def normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def normalize_phone(phone: str) -> str:
+    return _NON_DIGIT.sub("", phone or "")
+
+
+def _hmac(label: str, value: str) -> str:
+    return hmac.new(_KEY, f"{label}:{value}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+# ✅ 동등 비교용 블라인드 인덱스 (users.email_bidx / phone_bidx)
+def email_index(email: str) -> str:
+    return _hmac("email", normalize_email(email))
+
+
+def phone_index(phone: str) -> str:
+    return _hmac("phone", normalize_phone(phone))
+
+
+# ✅ 부분 검색용 n-gram 블라인드 토큰 (user_search_tokens)
+def search_tokens(field: str, value: str) -> Set[str]:
+    """
+    - field: "email" / "phone" (정규화 방식과 HMAC 라벨 구분)
+    - 값의 모든 3-gram 을 HMAC 하여 반환, 3자 미만이면 빈 집합
+    """
+    value = normalize_phone(value) if field == "phone" else normalize_email(value)
+    grams = {value[i:i + NGRAM_SIZE] for i in range(len(value) - NGRAM_SIZE + 1)}
+    return {_hmac(f"{field}-ngram", gram)[:SEARCH_TOKEN_LENGTH] for gram in grams}
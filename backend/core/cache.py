@@ -0,0 +1,122 @@
+# backend/core/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# ✅ 검사 단위(scope="test") 캐시 목록
+_test_caches: List["VersionedCache"] = []
+
+# ✅ 검사 목록(scope="catalog") 캐시 목록 — 검사 생성/수정/삭제 시 무효화
+_catalog_caches: List["VersionedCache"] = []
+
+
+# ✅ 검사(test_id) 단위 인프로세스 캐시
+class VersionedCache:
+    """
+    키(주로 test_id)별로 값을 보관하는 프로세스 내 캐시입니다.
+    - 키마다 버전 번호를 두고, invalidate() 시 버전을 올려 진행 중인 로드 결과가 저장되지 않도록 함
+    - hit / miss / invalidation 횟수를 기록하여 stats() 로 노출
+    - uvicorn 워커마다 별도 인스턴스이므로, 다른 워커의 캐시는 무효화되지 않음
+    - scope="test" 로 생성하면 invalidate_test_caches() 로 함께 무효화됨
+    - scope="catalog" 로 생성하면 invalidate_test_catalog() 로 함께 무효화됨
+    - ttl_seconds: 지정 시 만료된 항목은 다시 로드 (다른 워커의 변경을 최대 TTL 안에 반영)
+    - max_entries: 지정 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+    """
+
+    def __init__(self, name: str, scope: str = None, ttl_seconds: Optional[float] = None, max_entries: Optional[int] = None):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._values: "OrderedDict[Hashable, Tuple[int, Any, Optional[float]]]" = OrderedDict()
+        self._versions: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        if scope == "test":
+            _test_caches.append(self)
+        elif scope == "catalog":
+            _catalog_caches.append(self)
+
+    def version(self, key: Hashable) -> int:
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def get(self, key: Hashable, loader: Callable[[int], Any]) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader(version)를 호출해 채웁니다.
+        - loader 실행 중 invalidate 가 발생하면 결과는 반환만 하고 저장하지 않음
+        - loader 가 None 을 반환하면 (예: 존재하지 않는 검사) 저장하지 않음
+        """
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and (entry[2] is None or entry[2] > time.monotonic()):
+                self._values.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            version = self._versions.get(key, 0)
+
+        value = loader(version)
+
+        with self._lock:
+            if value is not None and self._versions.get(key, 0) == version:
+                expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+                self._values[key] = (version, value, expires_at)
+                self._values.move_to_end(key)
+                if self.max_entries:
+                    while len(self._values) > self.max_entries:
+                        self._values.popitem(last=False)
+                        self.evictions += 1
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+            self._versions[key] = self._versions.get(key, 0) + 1
+            self.invalidations += 1
+
+    def invalidate_many(self, keys) -> None:
+        for key in keys:
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._values.keys()):
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._values.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._values),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+            }
+
+
+# ✅ 검사 구성(문항/선택지/연결)이 바뀌었을 때 검사 단위 캐시 일괄 무효화
+def invalidate_test_caches(test_ids: Iterable[str]) -> None:
+    test_ids = [str(test_id) for test_id in test_ids if test_id]
+    for cache in _test_caches:
+        cache.invalidate_many(test_ids)
+
+
+# ✅ 검사가 생성/수정(이름·버전)/삭제되었을 때 검사 목록 캐시 무효화
+def invalidate_test_catalog() -> None:
+    for cache in _catalog_caches:
+        cache.clear()
+
+
+# ✅ 검사 단위 + 검사 목록 캐시 통계
+def test_cache_stats() -> Dict[str, Any]:
+    return {cache.name: cache.stats() for cache in _test_caches + _catalog_caches}
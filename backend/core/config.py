@@ -1,6 +1,7 @@
 # backend/core/config.py
 
 import os
+import tempfile
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -12,10 +13,82 @@ env_file = BASE_DIR / (".env.production" if env_name == "production" else ".env"
 load_dotenv(dotenv_path=env_file)  # ✅ 명시적으로 절대경로 지정
 
 class Settings:
+    ENV: str = env_name  # ✅ development / production (reports 라우터에서 PDF/HTML 분기에 사용)
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY")
     AES_SECRET_KEY: str = os.getenv("AES_SECRET_KEY")
+    BLIND_INDEX_KEY: str = os.getenv("BLIND_INDEX_KEY")  # ✅ 이메일/전화번호 블라인드 인덱스 HMAC 키 (미설정 시 AES 키에서 파생)
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL")  # ✅ 비동기 엔진 URL (미설정 시 DATABASE_URL 의 드라이버를 aiomysql 로 교체)
+
+    # ✅ DB 커넥션 풀 (동기 / 비동기 엔진 각각 워커 프로세스별로 적용)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT_SECONDS: float = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", 30))
+    DB_POOL_RECYCLE_SECONDS: int = int(os.getenv("DB_POOL_RECYCLE_SECONDS", 1800))  # ✅ MySQL wait_timeout 보다 짧게
+    DB_POOL_PRE_PING: str = os.getenv("DB_POOL_PRE_PING", "always").lower()  # ✅ always / idle / never
+    DB_POOL_PING_IDLE_SECONDS: float = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", 60))  # ✅ idle: 이 시간 이상 쉰 커넥션만 ping
+    DB_POOL_SLOW_CHECKOUT_MS: float = float(os.getenv("DB_POOL_SLOW_CHECKOUT_MS", 200))  # ✅ 이보다 오래 기다린 체크아웃은 로그 출력
     JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+    REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 30))
+    REVOKED_JTI_CACHE_SIZE: int = int(os.getenv("REVOKED_JTI_CACHE_SIZE", 100000))  # ✅ 폐기된 리프레시 토큰 jti 메모리 LRU
+
+    # ✅ 문항 통계 백그라운드 집계 (write-behind)
+    STATS_AGGREGATOR_ENABLED: bool = os.getenv("STATS_AGGREGATOR_ENABLED", "true").lower() == "true"
+    STATS_AGGREGATOR_INTERVAL_SECONDS: int = int(os.getenv("STATS_AGGREGATOR_INTERVAL_SECONDS", 30))
+    STATS_AGGREGATOR_BATCH_SIZE: int = int(os.getenv("STATS_AGGREGATOR_BATCH_SIZE", 5000))
+
+    # ✅ 검사 그룹 통계 / STEN 분포 증분 집계
+    ANALYTICS_MATERIALIZER_ENABLED: bool = os.getenv("ANALYTICS_MATERIALIZER_ENABLED", "true").lower() == "true"
+    ANALYTICS_MATERIALIZER_INTERVAL_SECONDS: int = int(os.getenv("ANALYTICS_MATERIALIZER_INTERVAL_SECONDS", 60))
+    ANALYTICS_MATERIALIZER_BATCH_SIZE: int = int(os.getenv("ANALYTICS_MATERIALIZER_BATCH_SIZE", 2000))
+
+    # ✅ PDF 렌더링 워커 풀
+    PDF_RENDER_WORKERS: int = int(os.getenv("PDF_RENDER_WORKERS", 2))
+    PDF_RENDER_QUEUE_SIZE: int = int(os.getenv("PDF_RENDER_QUEUE_SIZE", 8))  # 실행 중 외 대기 가능 작업 수
+    PDF_RENDER_TIMEOUT_SECONDS: float = float(os.getenv("PDF_RENDER_TIMEOUT_SECONDS", 60))
+    PDF_RENDER_ACQUIRE_TIMEOUT_SECONDS: float = float(os.getenv("PDF_RENDER_ACQUIRE_TIMEOUT_SECONDS", 2))  # 대기열 가득 시 503 까지 대기
+
+    # ✅ 렌더링된 PDF 디스크 캐시 (내용 주소 기반 LRU)
+    PDF_STORE_DIR: str = os.getenv("PDF_STORE_DIR", os.path.join(tempfile.gettempdir(), "narulab_pdf_cache"))
+    PDF_STORE_MAX_BYTES: int = int(os.getenv("PDF_STORE_MAX_MB", 1024)) * 1024 * 1024
+
+    # ✅ 기관 관리자 일괄 PDF 내보내기 작업
+    PDF_EXPORT_ENABLED: bool = os.getenv("PDF_EXPORT_ENABLED", "true").lower() == "true"
+    PDF_EXPORT_INTERVAL_SECONDS: int = int(os.getenv("PDF_EXPORT_INTERVAL_SECONDS", 5))
+
+    # ✅ 제출 직후 리포트 PDF 사전 렌더링 (검사별 tests.prerender_reports 와 함께 적용)
+    REPORT_PRERENDER_ENABLED: bool = os.getenv("REPORT_PRERENDER_ENABLED", "true").lower() == "true"
+    REPORT_PRERENDER_WORKERS: int = int(os.getenv("REPORT_PRERENDER_WORKERS", 1))
+    REPORT_PRERENDER_QUEUE_SIZE: int = int(os.getenv("REPORT_PRERENDER_QUEUE_SIZE", 1000))
+
+    # ✅ 검사 단위 / 검사 목록 캐시 TTL (무효화는 요청을 처리한 워커에만 즉시 반영 → 다른 워커는 TTL 안에 반영)
+    TEST_CACHE_TTL_SECONDS: int = int(os.getenv("TEST_CACHE_TTL_SECONDS", 30))
+
+    # ✅ 인증 사용자 / 기관 관리자 레코드 캐시 (워커 프로세스별)
+    AUTH_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_CACHE_TTL_SECONDS", 30))
+    AUTH_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", 10000))
+
+    # ✅ 비밀번호 해시 (bcrypt 작업 계수 + 전용 스레드 풀)
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", max(1, (os.cpu_count() or 2) // 2)))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", 32))  # 실행 중 외 대기 가능 작업 수
+    PASSWORD_HASH_ACQUIRE_TIMEOUT_SECONDS: float = float(os.getenv("PASSWORD_HASH_ACQUIRE_TIMEOUT_SECONDS", 3))
+
+    # ✅ 로그인 / 회원가입 요청 제한 (토큰 버킷: 버스트 허용량, 초당 보충량)
+    # 🔧 IP 별 한도는 학교/기관 단위 응시(수백 명이 같은 NAT 공인 IP 로 동시 로그인)를 수용하도록 넉넉하게 설정
+    #    → 무차별 대입 방어는 계정별 한도가 담당
+    LOGIN_RATE_PER_IP_BURST: int = int(os.getenv("LOGIN_RATE_PER_IP_BURST", 500))
+    LOGIN_RATE_PER_IP_PER_SECOND: float = float(os.getenv("LOGIN_RATE_PER_IP_PER_SECOND", 20))
+    LOGIN_RATE_PER_ACCOUNT_BURST: int = int(os.getenv("LOGIN_RATE_PER_ACCOUNT_BURST", 5))
+    LOGIN_RATE_PER_ACCOUNT_PER_SECOND: float = float(os.getenv("LOGIN_RATE_PER_ACCOUNT_PER_SECOND", 0.1))
+    SIGNUP_RATE_PER_IP_BURST: int = int(os.getenv("SIGNUP_RATE_PER_IP_BURST", 200))
+    SIGNUP_RATE_PER_IP_PER_SECOND: float = float(os.getenv("SIGNUP_RATE_PER_IP_PER_SECOND", 2))
+
+    # ✅ 신뢰하는 리버스 프록시 주소 (쉼표 구분, 예: "10.0.0.1,10.0.0.2")
+    # 요청이 이 주소에서 왔을 때만 X-Forwarded-For 를 오른쪽부터 읽어 첫 번째 비신뢰 주소를 클라이언트 IP 로 사용
+    TRUSTED_PROXIES: frozenset = frozenset(
+        ip.strip() for ip in os.getenv("TRUSTED_PROXIES", "").split(",") if ip.strip()
+    )
 
 settings = Settings()
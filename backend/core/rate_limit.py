@@ -0,0 +1,70 @@
+# backend/core/rate_limit.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+from fastapi import HTTPException
+
+
+# ✅ 키(IP / 계정)별 토큰 버킷 제한기 (워커 프로세스별 메모리)
+class TokenBucketLimiter:
+    """
+    키마다 capacity 개의 토큰을 두고 초당 refill_per_second 개씩 채웁니다.
+    - 요청 1건당 토큰 1개 소모, 토큰이 없으면 거부 + 다음 토큰까지 남은 초 반환
+    - 추적 키 수는 max_keys 로 제한 (가장 오래 사용되지 않은 키부터 제거 → 메모리 고정)
+    - uvicorn 워커마다 별도 버킷이므로 실제 허용량은 워커 수만큼 늘어남
+    """
+
+    def __init__(self, name: str, capacity: float, refill_per_second: float, max_keys: int = 100000):
+        self.name = name
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()  # key → (tokens, updated_at)
+        self.allowed = 0
+        self.rejected = 0
+
+    def try_acquire(self, key: Hashable) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_per_second)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                self._buckets.move_to_end(key)
+                self.allowed += 1
+                allowed, retry_after = True, 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                self._buckets.move_to_end(key)
+                self.rejected += 1
+                allowed, retry_after = False, (1 - tokens) / self.refill_per_second
+
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, retry_after
+
+    def check(self, key: Hashable, detail: str = "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.") -> None:
+        """
+        허용되지 않으면 429 + Retry-After 로 응답합니다.
+        """
+        allowed, retry_after = self.try_acquire(key)
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail=detail,
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "keys": len(self._buckets),
+                "allowed": self.allowed,
+                "rejected": self.rejected,
+            }
@@ -2,8 +2,12 @@
 
 from passlib.context import CryptContext
 from Crypto.Cipher import AES  # ✅ 변경: cryptography 대신 pycryptodome 사용
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import base64
 import hashlib
+import threading
+from typing import List, Optional
 
 from backend.core.config import settings
 
@@ -11,39 +15,139 @@ from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
-from backend.database.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database.database import get_db, get_async_db
 from backend.models.user import User
+from backend.core.auth_cache import get_cached_user, claims_match  # ✅ 인증 레코드 캐시 + 토큰 클레임 검증
 
-# 🔐 bcrypt를 활용한 비밀번호 해시 및 검증을 위한 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 🔐 bcrypt를 활용한 비밀번호 해시 및 검증을 위한 설정 (작업 계수는 BCRYPT_ROUNDS)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# ✅ bcrypt 전용 스레드 풀 (bcrypt 는 GIL 을 놓으므로 스레드로 병렬 실행, 동시 실행 수 = 워커 수)
+# ✅ 대기 포함 동시 작업 수를 제한 → 로그인 폭주 시 CPU 를 독점하지 않고 빠르게 503 반환
+_password_pool = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_password_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE)
+
+# ✅ 비동기 경로 전용 슬롯 (이벤트 루프에서 대기 → 폴링 없이 슬롯이 나면 바로 깨어남)
+# 동기 경로 슬롯과 따로 세지만 bcrypt 동시 실행 수는 공유 풀 워커 수로 제한됨
+_password_slots_async = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE)
+
+def _password_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "3"}
+    )
+
+def _run_password_task(fn, *args):
+    if not _password_slots.acquire(timeout=settings.PASSWORD_HASH_ACQUIRE_TIMEOUT_SECONDS):
+        raise _password_busy()
+    try:
+        return _password_pool.submit(fn, *args).result()
+    finally:
+        _password_slots.release()
+
+# ✅ 비동기 라우트용: 슬롯 대기 / bcrypt 실행 동안 요청 스레드를 점유하지 않음 (풀은 동기 경로와 공유)
+async def _run_password_task_async(fn, *args):
+    try:
+        await asyncio.wait_for(_password_slots_async.acquire(), settings.PASSWORD_HASH_ACQUIRE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise _password_busy()
+    try:
+        return await asyncio.wrap_future(_password_pool.submit(fn, *args))
+    finally:
+        _password_slots_async.release()
 
 # ✅ 비밀번호를 bcrypt 방식으로 해시
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _run_password_task(pwd_context.hash, password)
 
 # ✅ 해시된 비밀번호와 사용자가 입력한 비밀번호를 비교
 def verify_password(plain_password: str, password: str) -> bool:
-    return pwd_context.verify(plain_password, password)
+    return _run_password_task(pwd_context.verify, plain_password, password)
+
+# ✅ 존재하지 않는 계정도 같은 시간만큼 검증 (계정 존재 여부 타이밍 노출 방지)
+def dummy_verify_password() -> None:
+    _run_password_task(pwd_context.dummy_verify)
+
+# ✅ 비동기 라우트용 (로그인)
+async def hash_password_async(password: str) -> str:
+    return await _run_password_task_async(pwd_context.hash, password)
+
+async def verify_password_async(plain_password: str, password: str) -> bool:
+    return await _run_password_task_async(pwd_context.verify, plain_password, password)
+
+async def dummy_verify_password_async() -> None:
+    await _run_password_task_async(pwd_context.dummy_verify)
 
-# ✅ AES 암호화 키 준비 (32바이트 키로 SHA256 변환)
+# ✅ 작업 계수(BCRYPT_ROUNDS) 변경 후 기존 해시 재생성이 필요한지 여부
+def password_needs_rehash(password: str) -> bool:
+    return pwd_context.needs_update(password)
+
+# ✅ AES 암호화 키 준비 (32바이트 키로 SHA256 변환, 모듈 로드 시 한 번만 계산)
 AES_SECRET_KEY = settings.AES_SECRET_KEY  # .env에서 불러옴
+_AES_KEY = hashlib.sha256(AES_SECRET_KEY.encode()).digest()
+
+# ✅ ECB 암호 객체는 블록 간 상태가 없으므로 스레드별로 하나만 만들어 재사용
+_aes_local = threading.local()
+
+def _aes_cipher():
+    cipher = getattr(_aes_local, "cipher", None)
+    if cipher is None:
+        cipher = _aes_local.cipher = AES.new(_AES_KEY, AES.MODE_ECB)
+    return cipher
+
+def _aes_pad(plain_text: str) -> bytes:
+    data = plain_text.encode()
+    pad_len = 16 - len(data) % 16
+    return data + bytes([pad_len]) * pad_len
+
+def _aes_unpad(decrypted: bytes) -> str:
+    return decrypted[:-decrypted[-1]].decode()
 
 # ✅ Codex와 동일한 AES-256 + ECB + PKCS7 padding 방식으로 암호화
 def aes_encrypt(plain_text: str) -> str:
-    key = hashlib.sha256(AES_SECRET_KEY.encode()).digest()  # 32바이트 키로 변환
-    cipher = AES.new(key, AES.MODE_ECB)
-    pad_len = 16 - len(plain_text.encode()) % 16
-    padded = plain_text + chr(pad_len) * pad_len
-    encrypted = cipher.encrypt(padded.encode())
-    return base64.b64encode(encrypted).decode()
+    return base64.b64encode(_aes_cipher().encrypt(_aes_pad(plain_text))).decode()
 
 # ✅ Codex와 동일한 방식의 복호화
 def aes_decrypt(encrypted_text: str) -> str:
-    key = hashlib.sha256(AES_SECRET_KEY.encode()).digest()
-    cipher = AES.new(key, AES.MODE_ECB)
-    decrypted = cipher.decrypt(base64.b64decode(encrypted_text))
-    pad_len = decrypted[-1]
-    return decrypted[:-pad_len].decode()
+    return _aes_unpad(_aes_cipher().decrypt(base64.b64decode(encrypted_text)))
+
+# ✅ 목록 일괄 암호화 (None 은 그대로 유지)
+def aes_encrypt_many(values: List[Optional[str]]) -> List[Optional[str]]:
+    """
+    ECB 는 블록 단위로 독립적이므로 전체를 이어 붙여 encrypt() 한 번으로 처리한 뒤 값별로 나눕니다.
+    - 결과는 aes_encrypt() 를 값마다 호출한 것과 동일
+    """
+    padded = [_aes_pad(v) for v in values if v is not None]
+    encrypted = _aes_cipher().encrypt(b"".join(padded)) if padded else b""
+
+    result, offset, i = [], 0, 0
+    for v in values:
+        if v is None:
+            result.append(None)
+            continue
+        size = len(padded[i])
+        result.append(base64.b64encode(encrypted[offset:offset + size]).decode())
+        offset += size
+        i += 1
+    return result
+
+# ✅ 목록 일괄 복호화 (백필 / 대량 처리용, None 은 그대로 유지)
+def aes_decrypt_many(values: List[Optional[str]]) -> List[Optional[str]]:
+    chunks = [base64.b64decode(v) for v in values if v is not None]
+    decrypted = _aes_cipher().decrypt(b"".join(chunks)) if chunks else b""
+
+    result, offset, i = [], 0, 0
+    for v in values:
+        if v is None:
+            result.append(None)
+            continue
+        size = len(chunks[i])
+        result.append(_aes_unpad(decrypted[offset:offset + size]))
+        offset += size
+        i += 1
+    return result
 
 # ✅ 현재 로그인된 사용자 정보 가져오기 (JWT 기반)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")  # 🔑 토큰 경로 설정
@@ -51,21 +155,66 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")  # 🔑 토큰 경
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = "HS256"
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """
-    JWT access token을 기반으로 현재 로그인된 사용자 정보를 반환합니다.
-    유효하지 않거나 비활성화된 사용자는 예외 처리합니다.
-    """
+def _decode_access_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
-        if user_id is None:
+        if user_id is None or payload.get("type") == "refresh":  # ✅ 리프레시 토큰으로 API 접근 불가
             raise HTTPException(status_code=401, detail="Invalid token")
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user or not user.is_active:
+    # ✅ 토큰 클레임상 비활성 계정은 조회 없이 거부
+    if payload.get("act") is False:
         raise HTTPException(status_code=401, detail="Inactive user")
+    return payload
 
+def _check_current_user(payload: dict, user: User) -> User:
+    if not user or not user.is_active:
+        raise HTTPException(status_code=401, detail="Inactive user")
+    if not claims_match(payload, user):
+        raise HTTPException(status_code=401, detail="계정 권한 정보가 변경되었습니다. 다시 로그인해주세요.")
     return user
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """
+    JWT access token을 기반으로 현재 로그인된 사용자 정보를 반환합니다.
+    유효하지 않거나 비활성화된 사용자는 예외 처리합니다.
+    """
+    payload = _decode_access_token(token)
+
+    # ✅ 캐시 적중 시 DB 조회 없이 세션에 병합된 User 반환
+    return _check_current_user(payload, get_cached_user(db, payload["sub"]))
+
+# ✅ 비동기 라우트용 (응시 hot path) — 검증 규칙은 get_current_user 와 동일
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
+    payload = _decode_access_token(token)
+
+    # ✅ 캐시 적중 시 DB 조회 없음, 미스일 때만 비동기 커넥션으로 조회
+    user = await db.run_sync(get_cached_user, payload["sub"])
+    return _check_current_user(payload, user)
+
+if __name__ == "__main__":
+    # ✅ AES 호출당 비용 측정: python -m backend.core.security [개수]
+    import sys
+    import time
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    values = [f"user{i}@example.com" for i in range(count)]
+
+    def legacy_encrypt(plain_text: str) -> str:
+        key = hashlib.sha256(AES_SECRET_KEY.encode()).digest()
+        return base64.b64encode(AES.new(key, AES.MODE_ECB).encrypt(_aes_pad(plain_text))).decode()
+
+    def measure(label, fn):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        print(f"✅ {label:<24} {elapsed:.3f}s ({elapsed / count * 1e6:.2f} µs/value)")
+        return result
+
+    encrypted = measure("legacy encrypt", lambda: [legacy_encrypt(v) for v in values])
+    assert measure("aes_encrypt", lambda: [aes_encrypt(v) for v in values]) == encrypted
+    assert measure("aes_encrypt_many", lambda: aes_encrypt_many(values)) == encrypted
+    assert measure("aes_decrypt", lambda: [aes_decrypt(v) for v in encrypted]) == values
+    assert measure("aes_decrypt_many", lambda: aes_decrypt_many(encrypted)) == values
@@ -8,6 +8,7 @@ from backend.core.config import settings
 SECRET_KEY = settings.JWT_SECRET_KEY
 ALGORITHM = settings.JWT_ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
 
 # ✅ 액세스 토큰 생성
@@ -20,11 +21,11 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
-# ✅ 리프레시 토큰 생성 (유효기간 더 김)
-def create_refresh_token(data: dict):
+# ✅ 리프레시 토큰 생성 (유효기간 더 김, type=refresh 로 액세스 토큰과 구분)
+def create_refresh_token(data: dict, expire: datetime = None):
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=30)
-    to_encode.update({"exp": expire})
+    expire = expire or datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode.update({"exp": expire, "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
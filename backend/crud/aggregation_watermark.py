@@ -0,0 +1,42 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from backend.models.aggregation_watermark import AggregationWatermark
+from datetime import datetime
+
+
+# ✅ 작업별 워터마크 행을 잠금 조회 (없으면 생성)
+def lock_watermark(db: Session, job_name: str) -> AggregationWatermark:
+    """
+    SELECT ... FOR UPDATE 로 워터마크 행을 잠급니다.
+    - 같은 작업을 여러 워커가 동시에 실행해도 한 번에 하나만 진행됨
+    - 커밋/롤백 시 잠금 해제
+    """
+    watermark = (
+        db.query(AggregationWatermark)
+        .filter(AggregationWatermark.job_name == job_name)
+        .with_for_update()
+        .first()
+    )
+    if watermark:
+        return watermark
+
+    try:
+        db.add(AggregationWatermark(job_name=job_name))
+        db.commit()
+    except IntegrityError:
+        db.rollback()  # 다른 워커가 먼저 생성한 경우
+
+    return (
+        db.query(AggregationWatermark)
+        .filter(AggregationWatermark.job_name == job_name)
+        .with_for_update()
+        .one()
+    )
+
+
+# ✅ 워터마크 전진 (커밋은 호출하는 쪽에서 집계 결과와 함께 수행)
+def advance_watermark(watermark: AggregationWatermark, last_created_at: datetime, last_id: str) -> None:
+    watermark.last_created_at = last_created_at
+    watermark.last_id = last_id
+    watermark.updated_at = datetime.utcnow()
+
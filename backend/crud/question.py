@@ -0,0 +1,163 @@
+import base64
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, selectinload
+
+from backend.core.cache import VersionedCache
+from backend.models.question import Question, QuestionStatus, UsageType
+from backend.models.option import Option
+
+# ✅ 필터 조합별 문항 수 캐시 (목록 조회마다 COUNT(*) 방지, 문항 생성/수정/삭제 시 무효화)
+question_count_cache = VersionedCache("question_count", ttl_seconds=60, max_entries=256)
+
+
+# ✅ 문항 목록 필터
+class QuestionFilter(NamedTuple):
+    status: Optional[QuestionStatus] = None
+    usage_type: Optional[UsageType] = None
+    question_type: Optional[str] = None
+    name_prefix: Optional[str] = None
+
+
+# ✅ 문항 목록 한 페이지 (next_cursor 가 None 이면 마지막 페이지)
+class QuestionPage(NamedTuple):
+    items: List[Question]
+    next_cursor: Optional[str]
+    total: int
+
+
+# ✅ 커서 = "created_at|question_id" 를 URL-safe base64 로 인코딩
+def encode_cursor(question: Question) -> str:
+    raw = f"{question.created_at.isoformat()}|{question.question_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """
+    잘못된 커서는 ValueError
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, question_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), question_id
+    except Exception:
+        raise ValueError("잘못된 cursor 값입니다.")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _apply_filter(query, f: QuestionFilter):
+    if f.status:
+        query = query.filter(Question.status == f.status)
+    if f.usage_type:
+        query = query.filter(Question.usage_type == f.usage_type)
+    if f.question_type:
+        query = query.filter(Question.question_type == f.question_type)
+    if f.name_prefix:
+        query = query.filter(Question.question_name.like(f"{_escape_like(f.name_prefix)}%", escape="\\"))
+    return query
+
+
+# ✅ 캐시된 문항 수 (TTL 60초 → 다른 워커의 변경은 근사치)
+def count_questions(db: Session, f: QuestionFilter) -> int:
+    def load(version):
+        return _apply_filter(db.query(func.count(Question.question_id)), f).scalar()
+
+    return question_count_cache.get(f, load)
+
+
+# ✅ 문항 생성/수정/삭제/승인 시 호출
+def invalidate_question_counts() -> None:
+    question_count_cache.clear()
+
+
+# ✅ 문항 목록 keyset 페이지 조회 (created_at DESC, question_id DESC)
+def list_questions_page(db: Session, f: QuestionFilter, limit: Optional[int], cursor: Optional[str] = None) -> QuestionPage:
+    """
+    - OFFSET 없이 (created_at, question_id) 기준으로 다음 페이지를 이어서 조회 → 깊은 페이지도 일정한 비용
+    - 선택지는 해당 페이지 문항에 대해서만 selectinload (IN 조회 1회)
+    - limit + 1 개를 조회해 다음 페이지 존재 여부 판단 (limit=None 이면 전체 조회)
+    """
+    query = _apply_filter(db.query(Question).options(selectinload(Question.options)), f)
+
+    if cursor:
+        created_at, question_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Question.created_at < created_at,
+            and_(Question.created_at == created_at, Question.question_id < question_id)
+        ))
+
+    query = query.order_by(Question.created_at.desc(), Question.question_id.desc())
+    if limit is None:
+        items = query.all()
+        return QuestionPage(items=items, next_cursor=None, total=len(items))
+
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > limit else None
+    return QuestionPage(items=items, next_cursor=next_cursor, total=count_questions(db, f))
+
+
+# ✅ 변경된 속성만 대입 (값이 같으면 UPDATE 대상에서 제외)
+def _assign_changed(obj, values: dict) -> bool:
+    changed = False
+    for key, value in values.items():
+        if getattr(obj, key) != value:
+            setattr(obj, key, value)
+            changed = True
+    return changed
+
+
+# ✅ 문항 + 선택지 제자리 수정 (option_order 기준 diff)
+def update_question_in_place(db: Session, question: Question, request) -> bool:
+    """
+    request(QuestionCreateRequest) 와 현재 문항을 비교해 필요한 변경만 반영합니다.
+    - 문항: 달라진 열만 UPDATE
+    - 선택지: 요청 순서(0부터)를 option_order 로 보고 기존 선택지와 1:1 비교
+      → 같은 순서의 선택지는 option_id 를 유지한 채 달라진 열만 UPDATE
+      → 새로 늘어난 순서는 INSERT, 줄어든 순서는 DELETE
+    - option_id 가 유지되므로 응답(selected_option_ids) / 정답표 / 통계 테이블이 계속 유효
+    - 반환: 변경 여부 (커밋은 호출하는 쪽에서)
+    """
+    changed = _assign_changed(question, {
+        "test_id": str(request.test_id) if request.test_id else None,
+        "question_text": request.question_text,
+        "question_type": request.question_type,
+        "is_multiple_choice": request.is_multiple_choice,
+        "instruction": request.instruction,
+        "correct_explanation": request.correct_explanation,
+        "wrong_explanation": request.wrong_explanation,
+        "question_image_url": request.question_image_url,
+        "question_name": request.question_name,
+        "usage_type": UsageType(request.usage_type.value),
+        "status": QuestionStatus.approved,
+    })
+
+    existing, duplicates = {}, []
+    for o in question.options:
+        if o.option_order in existing:
+            duplicates.append(o)  # 🔧 순서가 중복된 기존 데이터는 하나만 남기고 정리
+        else:
+            existing[o.option_order] = o
+    for index, opt in enumerate(request.options):
+        values = {
+            "option_text": opt.option_text,
+            "is_correct": opt.is_correct,
+            "option_image_url": opt.option_image_url,
+        }
+        current = existing.pop(index, None)
+        if current is None:
+            question.options.append(Option(option_order=index, **values))
+            changed = True
+        elif _assign_changed(current, values):
+            changed = True
+
+    for stale in list(existing.values()) + duplicates:
+        question.options.remove(stale)  # ✅ delete-orphan → DELETE
+        changed = True
+
+    return changed
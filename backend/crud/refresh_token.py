@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from uuid import uuid4
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.core.token import create_refresh_token, decode_token
+from backend.models.refresh_token import RefreshToken
+
+
+# ✅ 폐기된 jti 메모리 LRU (DB 조회 없이 재사용 토큰을 빠르게 거부)
+class _RevokedJtiLRU:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._jtis: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            self._jtis[jti] = None
+            self._jtis.move_to_end(jti)
+            while len(self._jtis) > self.max_entries:
+                self._jtis.popitem(last=False)
+
+    def __contains__(self, jti: str) -> bool:
+        with self._lock:
+            return jti in self._jtis
+
+
+revoked_jtis = _RevokedJtiLRU(settings.REVOKED_JTI_CACHE_SIZE)
+
+
+# ✅ 폐기 jti 는 커밋이 확정된 뒤에만 LRU 에 반영 (롤백 시 버림)
+def _mark_revoked(db: Session, jti: str) -> None:
+    db.info.setdefault("pending_revoked_jtis", []).append(jti)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_revoked_jtis(session):
+    for jti in session.info.pop("pending_revoked_jtis", []):
+        revoked_jtis.add(jti)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_revoked_jtis(session):
+    session.info.pop("pending_revoked_jtis", None)
+
+
+# ✅ 리프레시 토큰 발급 (DB 기록 + JWT 생성, 커밋은 호출하는 쪽에서)
+def issue_refresh_token(db: Session, user_id: str, family_id: Optional[str] = None) -> Tuple[str, RefreshToken]:
+    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    row = RefreshToken(
+        jti=str(uuid4()),
+        user_id=str(user_id),
+        family_id=family_id or str(uuid4()),
+        expires_at=expires_at,
+    )
+    db.add(row)
+    token = create_refresh_token({"sub": str(user_id), "jti": row.jti, "fam": row.family_id}, expire=expires_at)
+    return token, row
+
+
+# ✅ 리프레시 토큰 회전 (사용된 토큰 폐기 → 같은 체인으로 새 토큰 발급)
+def rotate_refresh_token(db: Session, refresh_token: str) -> Optional[Tuple[str, str]]:
+    """
+    - 반환: (user_id, 새 리프레시 토큰) / 유효하지 않으면 None
+    - 이미 회전된 토큰이 다시 사용되면 탈취로 간주하여 체인 전체를 폐기
+    - 커밋은 호출하는 쪽에서 (새 액세스 토큰 발급과 함께)
+    """
+    payload = decode_token(refresh_token)
+    if not payload or payload.get("type") != "refresh" or not payload.get("jti"):
+        return None
+
+    jti = payload["jti"]
+    if jti in revoked_jtis:
+        # 🔧 이미 회전/폐기된 토큰의 재사용 → DB 조회 없이 체인 전체 폐기
+        if payload.get("fam"):
+            revoke_family(db, payload["fam"])
+            db.commit()
+        return None
+
+    row = db.query(RefreshToken).filter(RefreshToken.jti == jti).with_for_update().first()
+    if row is None or row.expires_at < datetime.utcnow():
+        return None
+
+    if row.revoked_at is not None:
+        # 🔧 재사용 감지 → 같은 로그인 체인의 모든 토큰 폐기
+        revoke_family(db, row.family_id)
+        db.commit()
+        return None
+
+    new_token, new_row = issue_refresh_token(db, row.user_id, family_id=row.family_id)
+    row.revoked_at = datetime.utcnow()
+    row.replaced_by = new_row.jti
+    _mark_revoked(db, jti)
+    return row.user_id, new_token
+
+
+# ✅ 로그인 체인 전체 폐기 (로그아웃 / 재사용 감지)
+def revoke_family(db: Session, family_id: str) -> int:
+    now = datetime.utcnow()
+    rows = db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None)
+    ).all()
+    for row in rows:
+        row.revoked_at = now
+        _mark_revoked(db, row.jti)
+    return len(rows)
+
+
+# ✅ 사용자의 모든 리프레시 토큰 폐기 (탈퇴 / 비활성화)
+def revoke_user_tokens(db: Session, user_id: str) -> int:
+    now = datetime.utcnow()
+    rows = db.query(RefreshToken).filter(
+        RefreshToken.user_id == str(user_id),
+        RefreshToken.revoked_at.is_(None)
+    ).all()
+    for row in rows:
+        row.revoked_at = now
+        _mark_revoked(db, row.jti)
+    return len(rows)
+
@@ -0,0 +1,311 @@
+from sqlalchemy import func, case, text, desc, and_, or_, null
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+
+from backend.models.test import Test, TestReport
+from backend.models.user import UserProfile
+from backend.models.response import UserResponse
+from backend.models.test_analytics_by_group import TestAnalyticsByGroup, GroupTypeEnum
+from backend.models.report_sten_distribution import ReportSTENDistribution
+from backend.schemas.test_analytics import (
+    TestAnalyticsSummary,
+    TestAnalyticsDetail,
+    QuestionAnalytics,
+    ResponseAnalyticsSummary,
+    GroupAnalyticsSummary
+)
+
+# ✅ 점수 히스토그램 구간 폭 (analytics_materializer 와 동일)
+SCORE_BIN_WIDTH = 10
+
+# ✅ 그룹 통계 API 가 허용하는 그룹 유형 (집계기가 적재하는 유형만 — 그 외 값은 라우터에서 400)
+GROUP_TYPES = (GroupTypeEnum.school.value, GroupTypeEnum.region.value, GroupTypeEnum.company.value)
+
+# ✅ 그룹 유형 → user_profiles 열 (overall 은 조건 없음)
+_COHORT_COLUMNS = {
+    GroupTypeEnum.school.value: UserProfile.school,
+    GroupTypeEnum.region.value: UserProfile.region,
+    GroupTypeEnum.company.value: UserProfile.current_company,
+}
+
+
+# ✅ 완료 여부 (전 문항 응답) SQL 식
+# 문항 수가 기록되지 않은 (이전) 리포트는 NULL → AVG 에서 제외
+def _completed_expr():
+    return case(
+        (TestReport.num_questions.is_(None), null()),
+        (TestReport.num_answered >= TestReport.num_questions, 1),
+        else_=0
+    )
+
+
+# ✅ 전체 검사별 통계 요약 (test_reports GROUP BY test_id 1회)
+def get_all_test_stats(db: Session) -> List[TestAnalyticsSummary]:
+    rows = (
+        db.query(
+            Test.test_id,
+            Test.test_name,
+            func.count(TestReport.report_id).label("num_participants"),
+            func.avg(TestReport.score_total).label("avg_score"),
+            func.stddev_pop(TestReport.score_total).label("std_score"),
+            func.avg(_completed_expr()).label("completion_rate"),
+        )
+        .join(TestReport, TestReport.test_id == Test.test_id)
+        .group_by(Test.test_id, Test.test_name)
+        .order_by(Test.test_name)
+        .all()
+    )
+    return [
+        TestAnalyticsSummary(
+            test_id=r.test_id,
+            test_name=r.test_name,
+            num_participants=r.num_participants,
+            avg_total_score=float(r.avg_score or 0.0),
+            std_total_score=float(r.std_score or 0.0),
+            completion_rate=float(r.completion_rate or 0.0)
+        )
+        for r in rows
+    ]
+
+
+# ✅ 특정 검사 상세 통계 (집계 쿼리 3회)
+def get_test_detail_stats(db: Session, test_id: str) -> TestAnalyticsDetail:
+    test_id = str(test_id)
+
+    totals = (
+        db.query(
+            func.sum(TestReport.score_total).label("sum_correct"),
+            func.sum(TestReport.num_questions).label("sum_questions"),
+        )
+        # 문항 수가 기록되지 않은 (이전) 리포트는 분자/분모 모두에서 제외
+        .filter(TestReport.test_id == test_id, TestReport.num_questions.isnot(None))
+        .one()
+    )
+
+    bucket = func.floor(TestReport.score_standardized / SCORE_BIN_WIDTH)
+    histogram = (
+        db.query(bucket.label("bucket"), func.count().label("cnt"))
+        .filter(TestReport.test_id == test_id, TestReport.score_standardized.isnot(None))
+        .group_by(bucket)
+        .order_by(bucket)
+        .all()
+    )
+
+    # 응시자별 응답 시간 합계 평균 (분)
+    duration = (
+        db.query(
+            (func.sum(UserResponse.response_time_sec) / func.nullif(func.count(func.distinct(UserResponse.email)), 0)).label("sec")
+        )
+        .filter(UserResponse.test_id == test_id)
+        .scalar()
+    )
+
+    sum_questions = totals.sum_questions or 0
+    return TestAnalyticsDetail(
+        test_id=test_id,
+        avg_duration_minutes=round(float(duration or 0.0) / 60, 2),
+        overall_correct_rate=float(totals.sum_correct or 0.0) / sum_questions if sum_questions else 0.0,
+        score_distribution={
+            f"{int(r.bucket) * SCORE_BIN_WIDTH}-{int(r.bucket) * SCORE_BIN_WIDTH + SCORE_BIN_WIDTH}": r.cnt
+            for r in histogram
+        }
+    )
+
+
+# ✅ 문항별 통계 (responses 집계 + JSON_TABLE 로 선택지 분포)
+def get_question_stats(db: Session, question_id: str) -> QuestionAnalytics:
+    question_id = str(question_id)
+
+    totals = (
+        db.query(
+            func.count(UserResponse.response_id).label("num_responses"),
+            func.avg(case((UserResponse.is_correct == True, 1.0), else_=0.0)).label("correct_rate"),
+            func.avg(UserResponse.response_time_sec).label("avg_response_time"),
+        )
+        .filter(UserResponse.question_id == question_id)
+        .one()
+    )
+
+    # ✅ selected_option_ids(JSON 배열)를 DB 안에서 펼쳐 선택지별 집계 (MySQL 8.0+)
+    option_rows = db.execute(
+        text(
+            "SELECT jt.option_id AS option_id, COUNT(*) AS cnt "
+            "FROM responses r, "
+            "JSON_TABLE(r.selected_option_ids, '$[*]' COLUMNS (option_id VARCHAR(36) PATH '$')) jt "
+            "WHERE r.question_id = :question_id "
+            "GROUP BY jt.option_id"
+        ),
+        {"question_id": question_id}
+    ).all()
+
+    num_responses = totals.num_responses or 0
+    return QuestionAnalytics(
+        question_id=question_id,
+        num_responses=num_responses,
+        correct_rate=float(totals.correct_rate or 0.0),
+        avg_response_time=float(totals.avg_response_time or 0.0),
+        option_distribution={
+            r.option_id: round(r.cnt * 100.0 / num_responses, 1)
+            for r in option_rows
+        } if num_responses else {}
+    )
+
+
+# ✅ 응답 기반 필터 통계 (filter: 학교명, 선택)
+def get_response_stats(db: Session, school: Optional[str] = None) -> ResponseAnalyticsSummary:
+    def scoped(query):
+        if school:
+            query = query.join(UserProfile, UserProfile.email == TestReport.email).filter(UserProfile.school == school)
+        return query
+
+    totals = scoped(
+        db.query(
+            func.count(func.distinct(TestReport.email)).label("total_users"),
+            func.avg(TestReport.score_total).label("avg_score"),
+        )
+    ).one()
+
+    dominant = (
+        scoped(db.query(TestReport.score_level, func.count().label("cnt")))
+        .filter(TestReport.score_level.isnot(None))
+        .group_by(TestReport.score_level)
+        .order_by(desc("cnt"))
+        .first()
+    )
+
+    top_schools = (
+        db.query(UserProfile.school, func.count(TestReport.report_id).label("cnt"))
+        .join(TestReport, TestReport.email == UserProfile.email)
+        .filter(UserProfile.school.isnot(None))
+        .group_by(UserProfile.school)
+        .order_by(desc("cnt"))
+        .limit(3)
+        .all()
+    )
+
+    return ResponseAnalyticsSummary(
+        total_users=totals.total_users or 0,
+        avg_score=float(totals.avg_score or 0.0),
+        dominant_level=dominant.score_level if dominant else "STEN N/A",
+        top_3_schools=[r.school for r in top_schools]
+    )
+
+
+# ✅ 그룹별 통계 (증분 집계 테이블 기반 — analytics_materializer 가 채움)
+def get_group_stats(db: Session, group_type: str, group_value: str) -> GroupAnalyticsSummary:
+    totals = (
+        db.query(
+            func.sum(TestAnalyticsByGroup.num_participants).label("n"),
+            func.sum(TestAnalyticsByGroup.avg_total_score * TestAnalyticsByGroup.num_participants).label("score_sum"),
+        )
+        .filter(
+            TestAnalyticsByGroup.group_type == group_type,
+            TestAnalyticsByGroup.group_value == group_value
+        )
+        .one()
+    )
+
+    sten_columns = [getattr(ReportSTENDistribution, f"sten_{level}") for level in range(1, 11)]
+    sten_row = (
+        db.query(*[func.coalesce(func.sum(column), 0) for column in sten_columns])
+        .filter(
+            ReportSTENDistribution.group_type == group_type,
+            ReportSTENDistribution.group_value == group_value
+        )
+        .one()
+    )
+    sten_counts: Dict[int, int] = {level: int(count) for level, count in enumerate(sten_row, start=1)}
+    dominant_level = max(sten_counts, key=lambda level: sten_counts[level]) if any(sten_counts.values()) else None
+
+    n = totals.n or 0
+    return GroupAnalyticsSummary(
+        group=group_value,
+        avg_score=float(totals.score_sum or 0.0) / n if n else 0.0,
+        dominant_score_level=f"STEN {dominant_level}" if dominant_level else "STEN N/A",
+        score_distribution={
+            "STEN 6 이하": sum(sten_counts[level] for level in range(1, 7)),
+            "STEN 7~8": sten_counts[7] + sten_counts[8],
+            "STEN 9~10": sten_counts[9] + sten_counts[10]
+        }
+    )
+
+
+# ✅ 코호트 비교 통계 (학교/지역/기업/전체 평균을 집계 쿼리 1회로 계산)
+def compare_cohorts(
+    db: Session,
+    test_id: str,
+    cohorts: Dict[str, Tuple[str, Optional[str]]],
+    materialized: bool = False
+) -> Dict[str, dict]:
+    """
+    - cohorts: {응답 키: (group_type, group_value)} 예) {"school": ("school", "OO고"), "all": ("overall", "전체")}
+    - materialized=False: test_reports ⟕ user_profiles 를 해당 검사 범위에서 조건부 AVG/COUNT 1회 집계
+    - materialized=True: test_analytics_by_group 의 월별 행만 합산 → 전체 플랫폼 규모와 무관 (집계 지연 최대 수 분)
+    - 반환: {응답 키: {"avg_score", "user_count"}}
+    """
+    test_id = str(test_id)
+    active = {key: spec for key, spec in cohorts.items() if spec[1]}
+    result = {key: {"avg_score": None, "user_count": 0} for key in cohorts}
+    if not active:
+        return result
+
+    if materialized:
+        rows = (
+            db.query(
+                TestAnalyticsByGroup.group_type,
+                TestAnalyticsByGroup.group_value,
+                func.sum(TestAnalyticsByGroup.num_participants).label("n"),
+                func.sum(TestAnalyticsByGroup.avg_total_score * TestAnalyticsByGroup.num_participants).label("score_sum"),
+            )
+            .filter(
+                TestAnalyticsByGroup.test_id == test_id,
+                or_(*[
+                    and_(
+                        TestAnalyticsByGroup.group_type == GroupTypeEnum(group_type),
+                        TestAnalyticsByGroup.group_value == group_value
+                    )
+                    for group_type, group_value in active.values()
+                ])
+            )
+            .group_by(TestAnalyticsByGroup.group_type, TestAnalyticsByGroup.group_value)
+            .all()
+        )
+        totals = {(getattr(r.group_type, "value", r.group_type), r.group_value): r for r in rows}
+        for key, spec in active.items():
+            row = totals.get(spec)
+            if row and row.n:
+                result[key] = {"avg_score": round(float(row.score_sum) / row.n, 2), "user_count": int(row.n)}
+        return result
+
+    # ✅ 코호트별 조건부 집계 열 (AVG/COUNT 는 NULL 을 무시)
+    columns = []
+    for key, (group_type, group_value) in active.items():
+        if group_type == GroupTypeEnum.overall.value:
+            score = TestReport.score_total
+        else:
+            score = case((_COHORT_COLUMNS[group_type] == group_value, TestReport.score_total), else_=None)
+        columns += [func.avg(score).label(f"{key}_avg"), func.count(score).label(f"{key}_count")]
+
+    query = db.query(*columns).filter(TestReport.test_id == test_id)
+    if any(group_type != GroupTypeEnum.overall.value for group_type, _ in active.values()):
+        query = query.outerjoin(UserProfile, UserProfile.email == TestReport.email)
+    row = query.one()
+
+    for key in active:
+        count = getattr(row, f"{key}_count") or 0
+        avg = getattr(row, f"{key}_avg")
+        result[key] = {
+            "avg_score": round(float(avg), 2) if count else None,
+            "user_count": count
+        }
+    return result
+
+
+# ✅ 학교가 속한 지역 (user_profiles 에서 1건만 조회)
+def get_school_region(db: Session, school: str) -> Optional[str]:
+    return (
+        db.query(UserProfile.region)
+        .filter(UserProfile.school == school, UserProfile.region.isnot(None))
+        .limit(1)
+        .scalar()
+    )
@@ -0,0 +1,48 @@
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session, selectinload
+
+from backend.models.option import Option
+from backend.models.question import Question
+from backend.models.test import Test
+from backend.models.test_question_links import TestQuestionLink
+
+
+# ✅ 검사 + 순서대로 정렬된 문항 (선택지는 미리 로드됨)
+class TestWithQuestions(NamedTuple):
+    test: Test
+    questions: List[Question]
+
+
+# ✅ 검사 + 문항 + 선택지 일괄 조회 (쿼리 최대 2회)
+def load_test_with_questions(db: Session, test_id: str, linked: bool = True) -> Optional[TestWithQuestions]:
+    """
+    - 1회차: tests LEFT JOIN (test_question_links →) questions, 문항 순서대로 정렬
+    - 2회차: 해당 문항들의 options 를 selectinload (IN 조회 1회, 문항이 없으면 생략)
+    - linked=True: test_question_links 기준 (order_index 순) — 응시 / 문항 연결 화면
+      linked=False: questions.test_id 직접 연결 기준 (questions.order_index 순) — 기존 방식 상세 조회
+    - 반환된 문항의 .options 는 이미 로드되어 추가 쿼리 없음 (정렬은 sorted_options 사용)
+    - 존재하지 않는 검사면 None
+    """
+    query = db.query(Test, Question).filter(Test.test_id == str(test_id))
+    if linked:
+        query = (
+            query.outerjoin(TestQuestionLink, TestQuestionLink.test_id == Test.test_id)
+            .outerjoin(Question, Question.question_id == TestQuestionLink.question_id)
+            .order_by(TestQuestionLink.order_index.asc())
+        )
+    else:
+        query = (
+            query.outerjoin(Question, Question.test_id == Test.test_id)
+            .order_by(Question.order_index.asc())
+        )
+
+    rows = query.options(selectinload(Question.options)).all()
+    if not rows:
+        return None
+    return TestWithQuestions(test=rows[0][0], questions=[q for _, q in rows if q is not None])
+
+
+# ✅ 선택지 보기 순서 정렬 (selectinload 는 순서를 보장하지 않음)
+def sorted_options(question: Question) -> List[Option]:
+    return sorted(question.options, key=lambda o: o.option_order or 0)
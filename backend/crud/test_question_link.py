@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Dict, List, NamedTuple
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+
+from backend.models.question import Question
+from backend.models.test import Test
+from backend.models.test_question_links import TestQuestionLink
+
+
+# ✅ 연결 교체 결과 (변경이 없으면 모두 0)
+class LinkDiff(NamedTuple):
+    inserted: int
+    deleted: int
+    reordered: int
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.deleted or self.reordered)
+
+
+# ✅ 검사의 문항 연결을 주어진 목록으로 원자적 교체
+def replace_test_question_links(db: Session, test: Test, question_ids: List[str]) -> LinkDiff:
+    """
+    - question_ids 순서가 곧 order_index (0부터), 중복 ID 는 첫 번째만 사용
+    - 기존 연결과 비교해 빠진 문항만 DELETE, 새 문항만 다중 VALUES INSERT,
+      남는 문항은 순서가 바뀐 경우에만 order_index UPDATE (순서만 바꾼 요청은 UPDATE 만 발생)
+    - question_count 는 목록 길이로 설정 (COUNT 조회 없음)
+    - 문항 수와 무관하게 SELECT 2회 + 쓰기 최대 3문장, 커밋은 호출하는 쪽에서 1회
+      → 중간 상태(연결 0개)가 다른 트랜잭션에 보이지 않음
+    - 존재하지 않는 문항 ID 가 있으면 ValueError (아무것도 변경하지 않음)
+    """
+    ordered = list(dict.fromkeys(str(q_id) for q_id in question_ids))
+
+    if ordered:
+        found = {q_id for (q_id,) in db.query(Question.question_id).filter(Question.question_id.in_(ordered)).all()}
+        missing = [q_id for q_id in ordered if q_id not in found]
+        if missing:
+            raise ValueError(f"존재하지 않는 문항 ID: {', '.join(missing[:10])}")
+
+    existing: Dict[str, tuple] = {}
+    stale_ids: List[str] = []
+    rows = (
+        db.query(TestQuestionLink.id, TestQuestionLink.question_id, TestQuestionLink.order_index)
+        .filter(TestQuestionLink.test_id == test.test_id)
+        .order_by(TestQuestionLink.order_index)
+        .all()
+    )
+    for link_id, q_id, order_index in rows:
+        if q_id in existing:
+            stale_ids.append(link_id)  # 🔧 중복 연결 정리
+        else:
+            existing[q_id] = (link_id, order_index)
+
+    new_index = {q_id: idx for idx, q_id in enumerate(ordered)}
+    stale_ids += [link_id for q_id, (link_id, _) in existing.items() if q_id not in new_index]
+    reorders = [
+        {"id": link_id, "order_index": new_index[q_id]}
+        for q_id, (link_id, order_index) in existing.items()
+        if q_id in new_index and order_index != new_index[q_id]
+    ]
+    now = datetime.utcnow()
+    inserts = [
+        {"id": str(uuid4()), "test_id": test.test_id, "question_id": q_id, "order_index": idx, "created_at": now}
+        for q_id, idx in new_index.items()
+        if q_id not in existing
+    ]
+
+    if stale_ids:
+        db.execute(delete(TestQuestionLink).where(TestQuestionLink.id.in_(stale_ids)))
+    if reorders:
+        db.execute(update(TestQuestionLink), reorders)  # ✅ 기본키 기준 executemany UPDATE
+    if inserts:
+        db.execute(insert(TestQuestionLink).values(inserts))
+
+    test.question_count = len(ordered)
+    return LinkDiff(inserted=len(inserts), deleted=len(stale_ids), reordered=len(reorders))
@@ -1,39 +1,77 @@
+from fastapi import HTTPException
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 from backend.models.user import User, UserProfile
+from backend.models.user_search_token import UserSearchToken
 from backend.schemas.user import UserCreate
-from backend.core.security import hash_password
+from backend.core.security import hash_password, aes_encrypt
+from backend.core.blind_index import email_index, phone_index, search_tokens
 import uuid
 
-# ✅ 암호화된 이메일로 사용자 조회
-# ✅ 수정 완료: 이미 암호화된 이메일을 받아 그대로 조회
+# ✅ 이메일로 사용자 조회 (평문 이메일 → 블라인드 인덱스 동등 조회)
 def get_user_by_email(db: Session, email: str):
     """
-    로그인 시 이미 암호화된 이메일 값을 기준으로 사용자 조회
-    - 중복 암호화를 방지하기 위해 aes_encrypt 제거
+    평문 이메일을 받아 users.email_bidx 로 조회합니다.
+    - 백필 전 사용자(email_bidx 없음)는 기존 결정적 암호문 비교로 조회
     """
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).filter(or_(
+        User.email_bidx == email_index(email),
+        and_(User.email_bidx.is_(None), User.email == aes_encrypt(email))
+    )).first()
 
-# ✅ 전화번호로 사용자 조회
-def get_user_by_phone(db: Session, encrypted_phone: str):
-    return db.query(User).filter(User.phone == encrypted_phone).first()
+# ✅ 전화번호로 사용자 조회 (평문 전화번호 → 블라인드 인덱스 동등 조회)
+def get_user_by_phone(db: Session, phone: str):
+    return db.query(User).filter(or_(
+        User.phone_bidx == phone_index(phone),
+        and_(User.phone_bidx.is_(None), User.phone == aes_encrypt(phone))
+    )).first()
+
+# ✅ 부분 검색 토큰 저장 (기존 토큰 교체, 커밋은 호출하는 쪽에서)
+def set_user_search_tokens(db: Session, user_id: str, email: str, phone: str = None):
+    db.query(UserSearchToken).filter(UserSearchToken.user_id == user_id).delete(synchronize_session=False)
+    rows = [{"user_id": user_id, "field": "email", "token": t} for t in search_tokens("email", email)]
+    if phone:
+        rows += [{"user_id": user_id, "field": "phone", "token": t} for t in search_tokens("phone", phone)]
+    if rows:
+        db.execute(UserSearchToken.__table__.insert(), rows)
+
+# ✅ 이메일/전화번호 부분 일치 사용자 ID 서브쿼리 (모든 3-gram 토큰을 가진 사용자)
+def search_user_ids(db: Session, field: str, keyword: str):
+    """
+    - 키워드의 3-gram 블라인드 토큰을 모두 가진 사용자만 반환 (3자 미만 키워드는 None)
+    - n-gram 일치이므로 드물게 실제로 포함하지 않는 사용자가 섞일 수 있음 (관리자 검색 용도로 허용)
+    """
+    tokens = search_tokens(field, keyword)
+    if not tokens:
+        return None
+    return (
+        db.query(UserSearchToken.user_id)
+        .filter(UserSearchToken.field == field, UserSearchToken.token.in_(tokens))
+        .group_by(UserSearchToken.user_id)
+        .having(func.count(func.distinct(UserSearchToken.token)) == len(tokens))
+    )
 
 # ✅ 사용자 생성 함수
 def create_user(db: Session, user_data: UserCreate, email: str, encrypted_phone: str):
     """
     신규 사용자 생성 함수
-    - 이메일/전화번호는 암호화되어 전달됨
+    - 이메일/전화번호는 암호화되어 전달됨 (블라인드 인덱스 / 검색 토큰은 user_data 평문으로 생성)
     - 비밀번호는 bcrypt 해시
     """
     user = User(
         user_id=str(uuid.uuid4()),
         email=email,
+        email_bidx=email_index(user_data.email),
         phone=encrypted_phone,
+        phone_bidx=phone_index(user_data.phone),
         name=user_data.name,  # ✅ 반드시 추가
         nickname=user_data.nickname,
         password=hash_password(user_data.password),
         is_active=True
     )
     db.add(user)
+    db.flush()
+    set_user_search_tokens(db, user.user_id, user_data.email, user_data.phone)
     db.commit()
     db.refresh(user)
     return user
@@ -42,7 +80,10 @@ def create_user(db: Session, user_data: UserCreate, email: str, encrypted_phone:
 def create_user_profile(db: Session, user_id: str, email: str):
     """
     이메일은 평문 그대로 저장 (user_profiles 테이블용)
+    - 이메일당 프로필 1개 (리포트 조인 키) → 이미 있으면 400
     """
+    if db.query(UserProfile.profile_id).filter(UserProfile.email == email).first():
+        raise HTTPException(status_code=400, detail="이미 프로필이 등록된 이메일입니다.")
     profile = UserProfile(
         email=email,
         user_id=user_id,
@@ -6,10 +6,12 @@ from sqlalchemy.orm import sessionmaker
 
 # ✅ config에서 안전하게 불러온 DB URL 사용
 from backend.core.config import settings
+from backend.database.pool_metrics import instrument_engine, pool_options
 DB_URL = settings.DATABASE_URL
 
-# ✅ DB 엔진 생성
-engine = create_engine(DB_URL, pool_pre_ping=True)
+# ✅ DB 엔진 생성 (풀 크기 / 재활용 / 사전 ping 전략은 Settings.DB_POOL_*)
+engine = create_engine(DB_URL, **pool_options())
+instrument_engine(engine, "sync")  # ✅ 체크아웃 대기 / 사용 중 커넥션 지표
 
 # ✅ 세션 로컬 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -24,3 +26,49 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ✅ 비동기 엔진 / 세션 (응시 hot path 전용, 첫 요청 시 생성 → aiomysql 없이도 동기 라우트는 그대로 동작)
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def _async_db_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    driver, rest = DB_URL.split("://", 1)
+    if driver.startswith("mysql"):
+        driver = "mysql+aiomysql"
+    return f"{driver}://{rest}"
+
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        _async_engine = create_async_engine(_async_db_url(), **pool_options(async_engine=True))
+        instrument_engine(_async_engine.sync_engine, "async")
+        # 🔧 expire_on_commit=False: 커밋 후 속성 접근 시 암묵적 재조회(비동기에서는 오류) 방지
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+
+# ✅ 의존성 주입용 비동기 DB 세션 함수
+async def get_async_db():
+    """
+    AsyncSession 을 제공합니다.
+    - 요청이 DB 응답을 기다리는 동안 스레드풀 스레드를 점유하지 않음
+    - 동기 Session 기반 헬퍼(캐시 로더 등)는 await db.run_sync(fn, ...) 로 재사용
+    """
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+# ✅ 앱 종료 시 비동기 엔진 커넥션 정리
+async def dispose_async_engine():
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
@@ -0,0 +1,189 @@
+# backend/database/pool_metrics.py
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from backend.core.config import settings
+
+# ✅ 체크아웃 대기 시간 히스토그램 구간 상한 (ms, 마지막은 +Inf)
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+# ✅ 커넥션 풀 지표 (엔진별 1개, 워커 프로세스별 메모리)
+class PoolMetrics:
+    """
+    - 체크아웃 대기 시간 히스토그램 / 타임아웃 횟수 (풀 클래스의 _do_get 측정)
+    - 사용 중 / overflow / 유휴 커넥션 게이지 (pool 상태 조회)
+    - connect / checkout / checkin / invalidate / 사전 ping 횟수 (SQLAlchemy 풀 이벤트)
+    - DB_POOL_SLOW_CHECKOUT_MS 보다 오래 기다린 체크아웃은 로그 출력
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self.wait_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.timeouts = 0
+        self.slow_checkouts = 0
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self.max_in_use = 0
+
+    def observe_wait(self, elapsed_ms: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            self.wait_counts[bisect.bisect_left(WAIT_BUCKETS_MS, elapsed_ms)] += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            slow = elapsed_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS
+            if slow:
+                self.slow_checkouts += 1
+        if slow:
+            print(f"⚠️ [db-pool:{self.name}] 커넥션 대기 {elapsed_ms:.0f}ms{' (timeout)' if timed_out else ''} — {self._gauges()}")
+
+    def incr(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            if counter == "checkouts" and self.pool is not None:
+                self.max_in_use = max(self.max_in_use, self.pool.checkedout())
+
+    def _gauges(self) -> Dict[str, Any]:
+        pool = self.pool
+        if pool is None:
+            return {}
+        return {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            observed = sum(self.wait_counts)
+            histogram = {f"le_{b}ms": c for b, c in zip(WAIT_BUCKETS_MS, self.wait_counts)}
+            histogram["le_inf"] = self.wait_counts[-1]
+            return {
+                "name": self.name,
+                **self._gauges(),
+                "max_in_use": self.max_in_use,
+                "checkout_wait_ms": {
+                    "count": observed,
+                    "avg": round(self.wait_total_ms / observed, 2) if observed else None,
+                    "max": round(self.wait_max_ms, 2),
+                    "histogram": histogram,
+                },
+                "timeouts": self.timeouts,
+                "slow_checkouts": self.slow_checkouts,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+            }
+
+
+_all_metrics: List[PoolMetrics] = []
+
+
+def _timed_pool_class(base):
+    """
+    풀이 커넥션을 내줄 때까지(대기 포함) 걸린 시간을 측정하는 풀 클래스
+    - SQLAlchemy 에는 '체크아웃 대기 시작' 이벤트가 없으므로 _do_get 을 감싸 측정
+    """
+    class TimedPool(base):
+        metrics: Optional[PoolMetrics] = None
+
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                conn = super()._do_get()
+            except exc.TimeoutError:
+                if self.metrics:
+                    self.metrics.observe_wait((time.perf_counter() - started) * 1000, timed_out=True)
+                raise
+            if self.metrics:
+                self.metrics.observe_wait((time.perf_counter() - started) * 1000)
+            return conn
+
+        def recreate(self):
+            pool = super().recreate()
+            pool.metrics = self.metrics
+            if self.metrics:
+                self.metrics.pool = pool
+            return pool
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+TimedQueuePool = _timed_pool_class(QueuePool)
+TimedAsyncAdaptedQueuePool = _timed_pool_class(AsyncAdaptedQueuePool)
+
+
+# ✅ create_engine / create_async_engine 공통 풀 설정
+def pool_options(async_engine: bool = False) -> Dict[str, Any]:
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if async_engine else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+
+
+# ✅ 엔진에 풀 이벤트 리스너 등록 (비동기 엔진은 engine.sync_engine 전달)
+def instrument_engine(engine, name: str) -> PoolMetrics:
+    metrics = PoolMetrics(name)
+    metrics.pool = engine.pool
+    engine.pool.metrics = metrics
+    _all_metrics.append(metrics)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.incr("checkouts")
+        # 🔧 idle 전략: 오래 쉰 커넥션만 ping (매 체크아웃 왕복 1회 절약)
+        if settings.DB_POOL_PRE_PING == "idle":
+            last_checkin = connection_record.info.get("last_checkin")
+            if last_checkin is not None and time.monotonic() - last_checkin >= settings.DB_POOL_PING_IDLE_SECONDS:
+                metrics.incr("pings")
+                try:
+                    cursor = dbapi_connection.cursor()
+                    cursor.execute("SELECT 1")
+                    cursor.close()
+                except Exception:
+                    metrics.incr("ping_failures")
+                    raise exc.DisconnectionError()  # ✅ 풀이 이 커넥션을 버리고 새로 연결해 재시도
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.incr("checkins")
+        connection_record.info["last_checkin"] = time.monotonic()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+    return metrics
+
+
+def pool_stats() -> Dict[str, Any]:
+    return {m.name: m.stats() for m in _all_metrics}
@@ -0,0 +1,51 @@
+# backend/database/query_counter.py
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# ✅ 블록 안에서 실행된 SQL 문 수집 (쿼리 수 회귀 확인용)
+class QueryCounter:
+    """
+    - before_cursor_execute 이벤트로 엔진에서 실행된 SQL 문을 기록
+    - 다른 스레드(백그라운드 작업 등)의 쿼리는 제외 — 측정 블록을 실행한 스레드만 집계
+    - 비동기 엔진은 AsyncEngine.sync_engine 을 넘겨서 사용 (greenlet 은 호출 스레드에서 실행됨)
+    """
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self._thread_id = threading.get_ident()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == self._thread_id:
+            self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter._on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter._on_execute)
+
+
+@contextmanager
+def assert_max_queries(engine: Engine, limit: int, label: str = "") -> Iterator[QueryCounter]:
+    """
+    블록 안의 쿼리 수가 limit 를 넘으면 실행된 SQL 목록과 함께 AssertionError
+    """
+    with count_queries(engine) as counter:
+        yield counter
+    if counter.count > limit:
+        executed = "\n".join(f"  {i + 1}. {s.splitlines()[0][:200]}" for i, s in enumerate(counter.statements))
+        raise AssertionError(f"{label or '쿼리 수'}: {counter.count}회 실행 (허용 {limit}회)\n{executed}")
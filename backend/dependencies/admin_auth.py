@@ -9,28 +9,34 @@ from backend.database.database import SessionLocal
 from backend.models.user import User
 
 from backend.core.config import settings  # ✅ 설정 파일에서 불러오도록 수정
+from backend.core.auth_cache import get_cached_user, claims_match  # ✅ 인증 레코드 캐시 + 토큰 클레임 검증
 
 # ✅ JWT 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
 SECRET_KEY = settings.JWT_SECRET_KEY  # ✅ token.py와 동일한 키로 통일
 ALGORITHM = settings.JWT_ALGORITHM    # ✅ 알고리즘도 설정과 통일
 
-# ✅ 현재 로그인된 사용자 반환
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+# ✅ 액세스 토큰 검증 및 클레임 반환 (요청당 1회 — FastAPI 의존성 캐시로 공유)
+def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    if payload.get("sub") is None or payload.get("type") == "refresh":  # ✅ 리프레시 토큰으로 API 접근 불가
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+# ✅ 현재 로그인된 사용자 반환
+def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: Session = Depends(get_db)
+) -> User:
+    # ✅ 캐시 적중 시 DB 조회 없이 세션에 병합된 User 반환
+    user = get_cached_user(db, payload["sub"])
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
+    if not claims_match(payload, user):
+        raise HTTPException(status_code=401, detail="계정 권한 정보가 변경되었습니다. 다시 로그인해주세요.")
     return user
 
 # ✅ 관리자 인증 의존성 (방법 1 적용)
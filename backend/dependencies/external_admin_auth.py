@@ -4,35 +4,36 @@ from sqlalchemy.orm import Session
 from backend.database.database import SessionLocal
 from backend.models.institution_admin import InstitutionAdmin
 from backend.models.user import User
-from backend.dependencies.admin_auth import get_current_user
+from backend.dependencies.admin_auth import get_current_user, get_token_payload
+from backend.core.auth_cache import get_cached_institution_admin, claims_institution  # ✅ 인증 레코드 캐시
+
+# ✅ 기관 관리자 공통 확인 (토큰 inst 클레임 → 캐시된 InstitutionAdmin)
+def _get_institution_admin(payload: dict, current_user: User, db: Session, institution_type: str, detail: str) -> InstitutionAdmin:
+    # 🔧 토큰 발급 시점에 해당 유형 소속이 없으면 조회 없이 거부 (승인 후에는 토큰 재발급 필요)
+    names = claims_institution(payload, institution_type)
+    if names == []:
+        raise HTTPException(status_code=403, detail=detail)
+
+    admin = get_cached_institution_admin(db, current_user.user_id, institution_type)
+    if not admin or (names is not None and admin.institution_name not in names):
+        raise HTTPException(status_code=403, detail=detail)
+    return admin
 
 # ✅ 학교 관리자 인증
 def get_school_admin_user(
+    payload: dict = Depends(get_token_payload),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> InstitutionAdmin:
-    admin = db.query(InstitutionAdmin).filter(
-        InstitutionAdmin.user_id == current_user.user_id,
-        InstitutionAdmin.institution_type == "school",
-        InstitutionAdmin.approved == True
-    ).first()
-    if not admin:
-        raise HTTPException(status_code=403, detail="학교 관리자 권한이 없습니다.")
-    return admin
+    return _get_institution_admin(payload, current_user, db, "school", "학교 관리자 권한이 없습니다.")
 
 # ✅ 기업 관리자 인증
 def get_company_admin_user(
+    payload: dict = Depends(get_token_payload),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> InstitutionAdmin:
-    admin = db.query(InstitutionAdmin).filter(
-        InstitutionAdmin.user_id == current_user.user_id,
-        InstitutionAdmin.institution_type == "company",
-        InstitutionAdmin.approved == True
-    ).first()
-    if not admin:
-        raise HTTPException(status_code=403, detail="기업 관리자 권한이 없습니다.")
-    return admin
+    return _get_institution_admin(payload, current_user, db, "company", "기업 관리자 권한이 없습니다.")
 
 # ✅ 콘텐츠 관리자 인증
 def get_content_admin_user(
@@ -28,9 +28,17 @@ from backend.routers import user_reports
 from backend.routers import admin_pdf
 from backend.routers import admin_norms
 from backend.routers import admin_upload  # 추가
+from backend.routers import admin_metrics  # ✅ DB 풀 / 캐시 / 요청 제한 지표
 from backend.routers import tests
 
-
+# ✅ 백그라운드 작업
+from backend.core.config import settings
+from backend.services.stats_aggregator import aggregator_job  # ✅ 문항 통계 write-behind 집계기
+from backend.services.analytics_materializer import materializer_job  # ✅ 검사 그룹 통계 증분 집계기
+from backend.services.pdf_renderer import pdf_renderer  # ✅ PDF 렌더링 워커 풀
+from backend.services.pdf_export import pdf_export_job  # ✅ 기관 관리자 일괄 PDF 내보내기
+from backend.services.report_prerender import report_prerenderer  # ✅ 제출 직후 리포트 PDF 사전 렌더링
+from backend.database.database import dispose_async_engine  # ✅ 응시 hot path 비동기 엔진
 
 
 app = FastAPI(
@@ -66,6 +74,7 @@ app.include_router(user_reports.router)
 app.include_router(admin_pdf.router)
 app.include_router(admin_norms.router)
 app.include_router(admin_upload.router)  # 추가
+app.include_router(admin_metrics.router)  # ✅ 운영 지표 (슈퍼 관리자)
 app.include_router(tests.router)
 app.include_router(admin_questions.router)
 app.include_router(admin_tests.router)
@@ -73,6 +82,33 @@ app.include_router(admin_tests.router)
 
 
 
+# ✅ 백그라운드 작업 시작/종료
+@app.on_event("startup")
+def start_background_jobs():
+    if settings.STATS_AGGREGATOR_ENABLED:
+        aggregator_job.start()
+    if settings.ANALYTICS_MATERIALIZER_ENABLED:
+        materializer_job.start()
+    if settings.PDF_EXPORT_ENABLED:
+        pdf_export_job.start()
+    if settings.REPORT_PRERENDER_ENABLED:
+        report_prerenderer.start()
+
+
+@app.on_event("shutdown")
+def stop_background_jobs():
+    aggregator_job.stop()
+    materializer_job.stop()
+    pdf_export_job.stop()
+    report_prerenderer.stop()
+    pdf_renderer.shutdown()
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    await dispose_async_engine()
+
+
 # ✅ 루트 경로 확인용
 @app.get("/")
 def read_root():
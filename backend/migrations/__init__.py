@@ -0,0 +1,3 @@
+# backend/migrations/__init__.py
+# ✅ 기존 DB 스키마 업그레이드 단계 (기능별 모듈, 각 모듈의 upgrade() 는 여러 번 실행해도 안전)
+# 실행 순서는 backend/utils/migrate_schema.py 의 MIGRATIONS 목록
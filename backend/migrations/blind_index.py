@@ -0,0 +1,15 @@
+# backend/migrations/blind_index.py
+# ✅ 사용자 블라인드 인덱스 조회: users.email_bidx / phone_bidx, n-gram 검색 토큰 테이블
+# 기존 사용자는 암호문을 복호화해 블라인드 인덱스 + 검색 토큰을 채움 (backend.utils.backfill_blind_index, 재실행 시 남은 사용자부터)
+
+from backend.migrations.schema import add_columns, add_indexes, create_tables
+from backend.models.user import User
+from backend.models.user_search_token import UserSearchToken
+from backend.utils import backfill_blind_index
+
+
+def upgrade():
+    add_columns(User.__table__, ["email_bidx", "phone_bidx"])
+    add_indexes(User.__table__, ["ix_users_email_bidx", "ix_users_phone_bidx"])
+    create_tables(UserSearchToken.__table__)
+    print(f"✅ 블라인드 인덱스: {backfill_blind_index.backfill()}명")
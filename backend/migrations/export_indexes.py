@@ -0,0 +1,9 @@
+# backend/migrations/export_indexes.py
+# ✅ 사용자 결과 내보내기: user_profiles.email ↔ test_reports.email 조인 인덱스 (리포트 생성일 범위 포함)
+
+from backend.migrations.schema import add_indexes
+from backend.models.test import TestReport
+
+
+def upgrade():
+    add_indexes(TestReport.__table__, ["ix_test_reports_email"])
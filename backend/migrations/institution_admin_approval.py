@@ -0,0 +1,10 @@
+# backend/migrations/institution_admin_approval.py
+# ✅ 기관 관리자 인증 조건: institution_admins.approved
+# 기존 기관 관리자는 0 (미승인) → 슈퍼 관리자가 승인 API (admin_external_admins) 로 다시 승인해야 권한이 생김
+
+from backend.migrations.schema import add_columns
+from backend.models.institution_admin import InstitutionAdmin
+
+
+def upgrade():
+    add_columns(InstitutionAdmin.__table__, ["approved"])
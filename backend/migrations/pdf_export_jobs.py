@@ -0,0 +1,9 @@
+# backend/migrations/pdf_export_jobs.py
+# ✅ 리포트 PDF 일괄 내보내기: 작업 상태 테이블 (중단 시 last_report_id 부터 재개)
+
+from backend.migrations.schema import create_tables
+from backend.models.pdf_export_job import PdfExportJob
+
+
+def upgrade():
+    create_tables(PdfExportJob.__table__)
@@ -0,0 +1,15 @@
+# backend/migrations/question_list_indexes.py
+# ✅ 문항 목록 keyset 페이지네이션: (필터 컬럼, created_at, question_id) 인덱스 + 문항명 접두어 검색 인덱스
+
+from backend.migrations.schema import add_indexes
+from backend.models.question import Question
+
+
+def upgrade():
+    add_indexes(Question.__table__, [
+        "ix_questions_created_id",
+        "ix_questions_status_created_id",
+        "ix_questions_usage_created_id",
+        "ix_questions_type_created_id",
+        "ix_questions_name",
+    ])
@@ -0,0 +1,126 @@
+# backend/migrations/question_stats_aggregator.py
+# ✅ 문항 통계 비동기 집계: 워터마크 테이블, responses 채점/그룹/반영 표시 컬럼, question_stats_by_group 유니크 키
+#
+# - stats_applied 를 이번에 추가한 경우에만 백필
+#   워터마크가 있으면 (created_at, response_id) 가 워터마크 이하인 응답 = 이미 집계됨 → 1
+#   워터마크가 없으면 기존 응답은 모두 제출 시 동기 방식으로 집계된 것 → 전부 1
+# - 유니크 키 추가 전 중복 통계 행은 병합 (기존 응답은 is_correct / group_value 가 없어 재집계 불가)
+# - is_correct 가 비어 있는 기존 응답은 검사별 정답표로 채점해 채움 (문항 통계 API 용)
+
+import json
+from collections import Counter
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.database.database import SessionLocal
+from backend.migrations.schema import (
+    BATCH_SIZE, add_columns, add_indexes, create_tables, duplicate_groups, has_index, update_in_batches,
+)
+from backend.models.aggregation_watermark import AggregationWatermark
+from backend.models.question_stats_by_group import QuestionStatsByGroup
+from backend.models.response import UserResponse
+from backend.services.scoring import load_answer_key
+from backend.services.stats_aggregator import JOB_NAME
+
+UNIQUE_KEY = "uq_question_stats_group_period"
+
+
+def backfill_stats_applied(db: Session) -> int:
+    watermark = db.query(AggregationWatermark).filter(AggregationWatermark.job_name == JOB_NAME).first()
+    if watermark is None:
+        return update_in_batches(db, "responses", "stats_applied = 1", "stats_applied = 0")
+    if watermark.last_created_at is None:
+        return 0
+    return update_in_batches(
+        db, "responses", "stats_applied = 1",
+        "stats_applied = 0 AND (created_at < :wm_at OR (created_at = :wm_at AND response_id <= :wm_id))",
+        {"wm_at": watermark.last_created_at, "wm_id": watermark.last_id or ""}
+    )
+
+
+def merge_duplicate_stats(db: Session) -> int:
+    """
+    (문항, 그룹, 연, 월) 중복 행을 하나로 병합합니다.
+    - 응답 수는 합산, 정답률 / 평균 응답 시간은 응답 수 가중 평균, 선택지 분포는 합산
+    """
+    columns = ["question_id", "group_type", "group_value", "year", "month"]
+    removed = 0
+    for group in duplicate_groups(db, QuestionStatsByGroup.__tablename__, columns):
+        rows = db.query(QuestionStatsByGroup).filter(*[
+            getattr(QuestionStatsByGroup, name).is_(None) if value is None else getattr(QuestionStatsByGroup, name) == value
+            for name, value in zip(columns, group)
+        ]).order_by(QuestionStatsByGroup.id).all()
+        keeper, others = rows[0], rows[1:]
+
+        total_n = sum(r.num_responses or 0 for r in rows)
+        dist = Counter()
+        for r in rows:
+            dist.update(json.loads(r.option_distribution_json or "{}"))
+        keeper.num_responses = total_n
+        keeper.correct_rate = sum((r.correct_rate or 0.0) * (r.num_responses or 0) for r in rows) / total_n if total_n else None
+        keeper.avg_response_time = sum((r.avg_response_time or 0.0) * (r.num_responses or 0) for r in rows) / total_n if total_n else None
+        keeper.option_distribution_json = json.dumps(dict(dist))
+        for r in others:
+            db.delete(r)
+        removed += len(others)
+    db.commit()
+    return removed
+
+
+def backfill_is_correct(db: Session) -> int:
+    """
+    is_correct 가 비어 있는 기존 응답을 검사별 정답표로 채점해 채웁니다.
+    - response_id 순서(keyset)로 배치 처리, 정답표는 검사당 1회 로드
+    - 정답표에 없는 문항(삭제/연결 해제)의 응답은 NULL 로 둠
+    """
+    answer_keys = {}
+    total = 0
+    last_id = ""
+    while True:
+        rows = (
+            db.query(UserResponse.response_id, UserResponse.test_id, UserResponse.question_id, UserResponse.selected_option_ids)
+            .filter(UserResponse.is_correct.is_(None), UserResponse.response_id > last_id)
+            .order_by(UserResponse.response_id)
+            .limit(BATCH_SIZE)
+            .all()
+        )
+        if not rows:
+            return total
+
+        values = []
+        for response_id, test_id, question_id, selected_option_ids in rows:
+            key = answer_keys.get(test_id)
+            if key is None:
+                key = answer_keys[test_id] = load_answer_key(db, test_id)
+            correct_ids = key.correct.get(str(question_id))
+            if correct_ids is None:
+                continue
+            values.append({
+                "response_id": response_id,
+                "is_correct": {str(opt_id) for opt_id in selected_option_ids or []} == correct_ids,
+            })
+        if values:
+            db.execute(update(UserResponse), values)
+        db.commit()
+
+        total += len(values)
+        last_id = rows[-1].response_id
+        print(f"⏳ responses.is_correct {total}행 채점 (마지막 response_id={last_id})")
+
+
+def upgrade():
+    create_tables(AggregationWatermark.__table__)
+    added = add_columns(UserResponse.__table__, ["is_correct", "group_value", "stats_applied"])
+    add_indexes(UserResponse.__table__, ["ix_responses_created_at_id", "ix_responses_stats_pending"])
+
+    db = SessionLocal()
+    try:
+        if "stats_applied" in added:
+            print(f"✅ responses.stats_applied 백필: {backfill_stats_applied(db)}행을 반영 완료로 표시")
+        if not has_index(QuestionStatsByGroup.__tablename__, UNIQUE_KEY):
+            print(f"✅ question_stats_by_group 중복 {merge_duplicate_stats(db)}행 병합")
+        add_indexes(QuestionStatsByGroup.__table__, [UNIQUE_KEY])
+        print(f"✅ responses.is_correct: {backfill_is_correct(db)}행")
+    finally:
+        db.close()
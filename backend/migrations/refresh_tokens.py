@@ -0,0 +1,9 @@
+# backend/migrations/refresh_tokens.py
+# ✅ 액세스 토큰 갱신: 회전식 리프레시 토큰 테이블 (family_id 로 재사용 탐지 시 일괄 폐기)
+
+from backend.migrations.schema import create_tables
+from backend.models.refresh_token import RefreshToken
+
+
+def upgrade():
+    create_tables(RefreshToken.__table__)
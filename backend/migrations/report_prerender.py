@@ -0,0 +1,9 @@
+# backend/migrations/report_prerender.py
+# ✅ 제출 직후 리포트 PDF 사전 렌더링: tests.prerender_reports (기존 검사는 NULL → 사전 렌더링 안 함)
+
+from backend.migrations.schema import add_columns
+from backend.models.test import Test
+
+
+def upgrade():
+    add_columns(Test.__table__, ["prerender_reports"])
@@ -0,0 +1,10 @@
+# backend/migrations/response_email.py
+# ✅ 일괄 채점 제출: responses.email (응답자 이메일, submit_test 에서 저장)
+# 기존 응답은 응답자 정보가 없으므로 NULL 로 둠
+
+from backend.migrations.schema import add_columns
+from backend.models.response import UserResponse
+
+
+def upgrade():
+    add_columns(UserResponse.__table__, ["email"])
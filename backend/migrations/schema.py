@@ -0,0 +1,131 @@
+# backend/migrations/schema.py
+
+from typing import Dict, Iterable, List, Set
+
+from sqlalchemy import Table, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import AddConstraint, CreateColumn, CreateIndex
+
+from backend.database.database import engine
+
+# ✅ 대량 UPDATE / 백필 배치 크기 (한 트랜잭션이 너무 커지지 않도록)
+BATCH_SIZE = 10000
+
+
+# ------------------------------------------------------------
+# ✅ information_schema 조회
+# ------------------------------------------------------------
+def existing_columns(conn, table_name: str) -> Dict[str, str]:
+    rows = conn.execute(text(
+        "SELECT COLUMN_NAME, COLUMN_TYPE FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+    ), {"table": table_name})
+    return {column_name: column_type for column_name, column_type in rows}
+
+
+def existing_indexes(conn, table_name: str) -> Set[str]:
+    rows = conn.execute(text(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+    ), {"table": table_name})
+    return {index_name for (index_name,) in rows}
+
+
+def _column_ddl(column) -> str:
+    return str(CreateColumn(column).compile(dialect=engine.dialect)).strip()
+
+
+# ------------------------------------------------------------
+# ✅ DDL (모델 정의에서 컴파일 → 모델과 DB 정의가 어긋나지 않음)
+# ------------------------------------------------------------
+def create_tables(*tables: Table) -> None:
+    for table in tables:
+        with engine.begin() as conn:
+            if not existing_columns(conn, table.name):
+                table.create(bind=conn)
+                print(f"✅ 테이블 생성: {table.name}")
+
+
+def add_columns(table: Table, names: Iterable[str]) -> List[str]:
+    """
+    빠진 컬럼만 ALTER TABLE ... ADD COLUMN 으로 추가합니다.
+    - 반환: 이번 실행에서 추가된 컬럼 이름 (새로 추가된 경우에만 백필하기 위해)
+    """
+    added = []
+    with engine.begin() as conn:
+        columns = existing_columns(conn, table.name)
+        for name in names:
+            if name in columns:
+                continue
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {_column_ddl(table.c[name])}"))
+            added.append(name)
+            print(f"✅ 컬럼 추가: {table.name}.{name}")
+    return added
+
+
+def extend_enum(table: Table, name: str) -> None:
+    """
+    모델의 ENUM 값 중 DB 에 없는 값이 있으면 MODIFY COLUMN 으로 확장합니다.
+    """
+    column = table.c[name]
+    with engine.begin() as conn:
+        column_type = existing_columns(conn, table.name).get(name) or ""
+        if all(f"'{value}'" in column_type for value in column.type.enums):
+            return
+        conn.execute(text(f"ALTER TABLE {table.name} MODIFY COLUMN {_column_ddl(column)}"))
+        print(f"✅ ENUM 확장: {table.name}.{name}")
+
+
+def add_indexes(table: Table, names: Iterable[str]) -> None:
+    """
+    모델에 선언된 인덱스 / 유니크 키 중 이름이 주어진 것을 없으면 추가합니다.
+    - 유니크 키는 중복 행을 먼저 정리한 뒤 호출
+    """
+    declared = {index.name: CreateIndex(index) for index in table.indexes}
+    declared.update({c.name: AddConstraint(c) for c in table.constraints if c.name})
+    with engine.begin() as conn:
+        indexes = existing_indexes(conn, table.name)
+        for name in names:
+            if name in indexes:
+                continue
+            conn.execute(declared[name])
+            print(f"✅ 인덱스 추가: {table.name}.{name}")
+
+
+def drop_index(table_name: str, name: str) -> None:
+    with engine.begin() as conn:
+        if name in existing_indexes(conn, table_name):
+            conn.execute(text(f"DROP INDEX {name} ON {table_name}"))
+            print(f"✅ 인덱스 삭제: {table_name}.{name}")
+
+
+def has_index(table_name: str, name: str) -> bool:
+    with engine.connect() as conn:
+        return name in existing_indexes(conn, table_name)
+
+
+# ------------------------------------------------------------
+# ✅ 데이터 정리 / 백필
+# ------------------------------------------------------------
+def duplicate_groups(db: Session, table_name: str, columns: List[str]) -> list:
+    column_list = ", ".join(columns)
+    return db.execute(text(
+        f"SELECT {column_list} FROM {table_name} GROUP BY {column_list} HAVING COUNT(*) > 1"
+    )).all()
+
+
+def update_in_batches(db: Session, table_name: str, assignment: str, condition: str, params: Dict = None) -> int:
+    """
+    UPDATE ... LIMIT BATCH_SIZE 를 영향받은 행이 없을 때까지 반복합니다 (배치마다 커밋).
+    - condition 은 갱신된 행이 다시 선택되지 않도록 작성 (예: flag = 0 AND ...)
+    """
+    total = 0
+    while True:
+        result = db.execute(
+            text(f"UPDATE {table_name} SET {assignment} WHERE {condition} LIMIT {BATCH_SIZE}"),
+            params or {}
+        )
+        db.commit()
+        total += result.rowcount
+        if result.rowcount < BATCH_SIZE:
+            return total
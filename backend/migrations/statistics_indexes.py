@@ -0,0 +1,11 @@
+# backend/migrations/statistics_indexes.py
+# ✅ 관리자 통계 SQL 집계: 문항 통계 / 검사별 점수 통계 커버링 인덱스
+
+from backend.migrations.schema import add_indexes
+from backend.models.response import UserResponse
+from backend.models.test import TestReport
+
+
+def upgrade():
+    add_indexes(UserResponse.__table__, ["ix_responses_question_stats"])
+    add_indexes(TestReport.__table__, ["ix_test_reports_test_score"])
@@ -0,0 +1,117 @@
+# backend/migrations/test_analytics_materializer.py
+# ✅ 검사 그룹 통계 증분 집계: 프로필 그룹 컬럼, test_reports 완료율/반영 표시 컬럼, Welford 누적 컬럼, 유니크 키
+#
+# - analytics_applied 를 이번에 추가한 경우에만 백필
+#   워터마크가 있으면 (report_generated_at, report_id) 가 워터마크 이하인 리포트 = 이미 집계됨 → 1
+#   워터마크가 없으면 기존 통계 행과 섞이지 않도록 전체 재집계
+# - 유니크 키 추가 전 중복 행이 있으면 전체 재집계 (test_reports 에서 다시 만들 수 있음)
+# - user_profiles.email 유니크 키: 리포트 조인이 중복되지 않도록 이메일당 가장 최근 프로필(profile_id 최대)만 이메일 유지
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend.database.database import SessionLocal
+from backend.migrations.schema import (
+    add_columns, add_indexes, drop_index, duplicate_groups, extend_enum, has_index, update_in_batches,
+)
+from backend.models.aggregation_watermark import AggregationWatermark
+from backend.models.report_sten_distribution import ReportSTENDistribution
+from backend.models.test import TestReport
+from backend.models.test_analytics_by_group import TestAnalyticsByGroup
+from backend.models.user import UserProfile
+from backend.services import analytics_materializer
+
+UNIQUE_KEYS = [
+    (TestAnalyticsByGroup.__table__, "uq_test_analytics_group_period"),
+    (ReportSTENDistribution.__table__, "uq_report_sten_group_period"),
+]
+
+
+def clear_duplicate_profile_emails(db: Session) -> int:
+    """
+    같은 이메일의 프로필이 여럿이면 profile_id 가 가장 큰 프로필만 남기고 나머지 email 을 NULL 로 비웁니다.
+    """
+    result = db.execute(text(
+        "UPDATE user_profiles p "
+        "JOIN (SELECT email, MAX(profile_id) AS keep_id FROM user_profiles "
+        "      WHERE email IS NOT NULL GROUP BY email HAVING COUNT(*) > 1) d "
+        "ON p.email = d.email AND p.profile_id <> d.keep_id "
+        "SET p.email = NULL"
+    ))
+    db.commit()
+    return result.rowcount
+
+
+def backfill_analytics_applied(db: Session) -> bool:
+    """
+    기존 리포트의 analytics_applied 를 채웁니다.
+    - 반환: 전체 재집계가 필요하면 True (워터마크 없음)
+    """
+    watermark = (
+        db.query(AggregationWatermark)
+        .filter(AggregationWatermark.job_name == analytics_materializer.JOB_NAME)
+        .first()
+    )
+    if watermark is None:
+        return True
+    if watermark.last_created_at is not None:
+        total = update_in_batches(
+            db, "test_reports", "analytics_applied = 1",
+            "analytics_applied = 0 AND (report_generated_at < :wm_at "
+            "OR (report_generated_at = :wm_at AND report_id <= :wm_id))",
+            {"wm_at": watermark.last_created_at, "wm_id": watermark.last_id or ""}
+        )
+        print(f"✅ test_reports.analytics_applied 백필: {total}행을 반영 완료로 표시")
+    return False
+
+
+def has_duplicate_groups(db: Session) -> bool:
+    for table, name in UNIQUE_KEYS:
+        if has_index(table.name, name):
+            continue
+        constraint = next(c for c in table.constraints if c.name == name)
+        groups = duplicate_groups(db, table.name, [c.name for c in constraint.columns])
+        if groups:
+            print(f"⚠️ {table.name} 중복 {len(groups)}그룹 → 전체 재집계 예정")
+            return True
+    return False
+
+
+def upgrade():
+    add_columns(UserProfile.__table__, ["email", "school", "region"])
+    add_indexes(UserProfile.__table__, [
+        "ix_user_profiles_school", "ix_user_profiles_region", "ix_user_profiles_current_company",
+    ])
+    if not has_index(UserProfile.__tablename__, "uq_user_profiles_email"):
+        db = SessionLocal()
+        try:
+            print(f"✅ user_profiles 중복 이메일 {clear_duplicate_profile_emails(db)}행 비움")
+        finally:
+            db.close()
+    add_indexes(UserProfile.__table__, ["uq_user_profiles_email"])
+    drop_index(UserProfile.__tablename__, "ix_user_profiles_email")  # ✅ 유니크 키가 같은 조회를 처리
+
+    added = add_columns(TestReport.__table__, ["num_questions", "num_answered", "analytics_applied"])
+    add_indexes(TestReport.__table__, ["ix_test_reports_generated_at_id", "ix_test_reports_analytics_pending"])
+
+    add_columns(TestAnalyticsByGroup.__table__, [
+        "num_participants", "num_completed", "score_m2", "sum_correct", "sum_questions",
+    ])
+    extend_enum(TestAnalyticsByGroup.__table__, "group_type")
+
+    db = SessionLocal()
+    try:
+        needs_rebuild = False
+        if "analytics_applied" in added:
+            needs_rebuild = backfill_analytics_applied(db)
+        needs_rebuild = has_duplicate_groups(db) or needs_rebuild
+        db.rollback()
+        if needs_rebuild:
+            # ✅ 검사 통계 / STEN 분포를 비우고 모든 리포트를 미반영으로 표시 → 증분 집계 작업이 다시 채움
+            analytics_materializer.rebuild(db)
+            print("✅ 검사 그룹 통계 초기화 (백그라운드 집계 작업이 전체 재집계)")
+    finally:
+        db.close()
+
+    for table, name in UNIQUE_KEYS:
+        add_indexes(table, [name])
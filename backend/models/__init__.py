@@ -3,6 +3,7 @@
 # ✅ 사용자 및 관련 정보
 from .user import User, UserProfile
 from .user_deletion_log import UserDeletionLog
+from .user_search_token import UserSearchToken
 
 # ✅ 관리자
 from .institution_admin import InstitutionAdmin
@@ -28,6 +29,11 @@ from .sten_rule import STENRule
 from .scoring_rule import ScoringRule
 from .test_analytics_by_group import TestAnalyticsByGroup
 from .norm_group import NormGroup
+from .aggregation_watermark import AggregationWatermark
+from .pdf_export_job import PdfExportJob
+
+# ✅ 인증 토큰
+from .refresh_token import RefreshToken
 
 # ✅ QnA
 from .qna import QnA
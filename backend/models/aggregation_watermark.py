@@ -0,0 +1,15 @@
+# backend/models/aggregation_watermark.py
+
+from sqlalchemy import Column, String, DateTime
+from datetime import datetime
+from backend.database.database import Base
+
+
+# ✅ 백그라운드 집계 작업별 처리 위치(워터마크) 테이블
+class AggregationWatermark(Base):
+    __tablename__ = "aggregation_watermarks"
+
+    job_name = Column(String(50), primary_key=True)           # ✅ 작업 이름 (예: question_stats)
+    last_created_at = Column(DateTime, nullable=True)         # ✅ 마지막으로 반영한 행의 생성 시각
+    last_id = Column(String(36), nullable=True)               # ✅ 같은 시각 내 정렬용 마지막 행 ID
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # ✅ 갱신 시각
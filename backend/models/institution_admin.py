@@ -1,6 +1,6 @@
 # backend/models/institution_admin.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime  # ✅ SQLAlchemy 기본 컬럼/제약조건 타입
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, text  # ✅ SQLAlchemy 기본 컬럼/제약조건 타입
 from sqlalchemy.orm import relationship  # ✅ 관계 설정
 from backend.database.database import Base  # ✅ SQLAlchemy Base 클래스
 from datetime import datetime  # ✅ 생성/수정 시간용
@@ -15,6 +15,7 @@ class InstitutionAdmin(Base):
     name = Column(String(100), nullable=False)                     # ✅ 관리자 이름
     institution_type = Column(String(50), nullable=False)          # ✅ 기관 종류 (예: 학교, 기업)
     institution_name = Column(String(100), nullable=False)         # ✅ 기관 이름
+    approved = Column(Boolean, default=False, server_default=text("0"))  # ✅ 슈퍼 관리자 승인 여부 (기관 관리자 인증 조건)
 
     # 🔧 수정됨: 외래키 참조를 users.user_id로 변경하고 타입을 String(36)으로 일치시킴
     user_id = Column(String(36), ForeignKey("users.user_id"))      # ✅ UUID 기반 사용자 식별자 참조
@@ -0,0 +1,38 @@
+# backend/models/pdf_export_job.py
+
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Enum
+from datetime import datetime
+from uuid import uuid4
+import enum
+from backend.database.database import Base
+
+
+# ✅ 일괄 PDF 내보내기 작업 상태
+class PdfExportStatusEnum(str, enum.Enum):
+    pending = "pending"        # 생성됨, 렌더링 대기
+    running = "running"        # 렌더링 진행 중 (중단 시 last_report_id 부터 재개)
+    completed = "completed"    # 모든 리포트 렌더링 완료 → ZIP 다운로드 가능
+    failed = "failed"          # 재시도 한도 초과
+
+
+# ✅ 학교/기업 관리자의 일괄 리포트 PDF 내보내기 작업
+class PdfExportJob(Base):
+    __tablename__ = "pdf_export_jobs"
+
+    job_id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    admin_id = Column(Integer, ForeignKey("institution_admins.id"), nullable=False)  # ✅ 요청한 기관 관리자
+
+    institution_type = Column(String(50), nullable=False)     # ✅ school / company
+    institution_name = Column(String(100), nullable=False)    # ✅ 코호트 범위 (user_profiles.school / current_company)
+    test_id = Column(String(36), ForeignKey("tests.test_id"), nullable=True)  # ✅ 특정 검사만 (없으면 전체)
+
+    status = Column(Enum(PdfExportStatusEnum), nullable=False, default=PdfExportStatusEnum.pending)
+    total = Column(Integer, default=0)                        # ✅ 생성 시점 대상 리포트 수
+    processed = Column(Integer, default=0)                    # ✅ 렌더링 완료 리포트 수
+    last_report_id = Column(String(36), nullable=True)        # ✅ 재개 위치 (report_id 순)
+    failed_attempts = Column(Integer, default=0)              # ✅ 연속 실패 횟수
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
@@ -2,7 +2,7 @@ import enum
 from uuid import uuid4
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, Boolean, Enum as PgEnum, ForeignKey, Integer, DateTime
+from sqlalchemy import Column, String, Text, Boolean, Enum as PgEnum, ForeignKey, Integer, DateTime, Index
 from sqlalchemy import String
 from sqlalchemy.dialects.mysql import CHAR
 import uuid
@@ -25,6 +25,14 @@ class UsageType(str, enum.Enum):
 # 🔸 questions 테이블 정의
 class Question(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        # ✅ 문항 목록 keyset 페이지네이션 (created_at DESC, question_id DESC) + 필터별 복합 인덱스
+        Index("ix_questions_created_id", "created_at", "question_id"),
+        Index("ix_questions_status_created_id", "status", "created_at", "question_id"),
+        Index("ix_questions_usage_created_id", "usage_type", "created_at", "question_id"),
+        Index("ix_questions_type_created_id", "question_type", "created_at", "question_id"),
+        Index("ix_questions_name", "question_name"),  # ✅ 문항명 접두어 검색 (LIKE 'prefix%')
+    )
 
     question_id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     test_id = Column(String(36), ForeignKey("tests.test_id"), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, Enum, ForeignKey, Text
+from sqlalchemy import Column, String, Float, Integer, Enum, ForeignKey, Text, UniqueConstraint
 from backend.database.database import Base
 from uuid import uuid4
 import enum
@@ -13,6 +13,10 @@ class GroupTypeEnum(str, enum.Enum):
 # ✅ 문항별 그룹 통계 테이블
 class QuestionStatsByGroup(Base):
     __tablename__ = "question_stats_by_group"
+    __table_args__ = (
+        # ✅ (문항, 그룹, 연, 월) 단위 1행 보장 → 집계기의 INSERT ... ON DUPLICATE KEY UPDATE 대상
+        UniqueConstraint("question_id", "group_type", "group_value", "year", "month", name="uq_question_stats_group_period"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))  # UUID → String
     question_id = Column(String(36), ForeignKey("questions.question_id"), nullable=False)  # UUID → String
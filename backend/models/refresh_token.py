@@ -0,0 +1,22 @@
+# backend/models/refresh_token.py
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from backend.database.database import Base
+
+
+# ✅ 발급된 리프레시 토큰 (회전/폐기 상태 저장)
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_id", "user_id"),
+        Index("ix_refresh_tokens_family_id", "family_id"),
+    )
+
+    jti = Column(String(36), primary_key=True)                                   # ✅ 토큰 고유 ID (JWT jti 클레임)
+    user_id = Column(String(36), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    family_id = Column(String(36), nullable=False)                               # ✅ 로그인 1회에서 이어지는 회전 체인
+    issued_at = Column(DateTime, default=datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=True)                                 # ✅ 회전(사용) 또는 폐기 시각
+    replaced_by = Column(String(36), nullable=True)                              # ✅ 회전으로 새로 발급된 jti
@@ -1,6 +1,6 @@
 # backend/models/report_sten_distribution.py
 
-from sqlalchemy import Column, String, Integer, Enum, ForeignKey
+from sqlalchemy import Column, String, Integer, Enum, ForeignKey, UniqueConstraint
 from backend.database.database import Base
 from uuid import uuid4
 import enum
@@ -15,6 +15,10 @@ class GroupTypeEnum(str, enum.Enum):
 # ✅ STEN 분포 저장 테이블
 class ReportSTENDistribution(Base):
     __tablename__ = "report_sten_distribution"
+    __table_args__ = (
+        # ✅ (검사, 그룹, 연, 월) 단위 1행 보장 → 증분 집계 UPSERT 대상
+        UniqueConstraint("test_id", "group_type", "group_value", "year", "month", name="uq_report_sten_group_period"),
+    )
 
     # ✅ UUID → String(36)으로 변경 (MySQL 호환을 위해)
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))  # UUID 문자열 기본키
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Float, JSON
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Float, JSON, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from backend.database.database import Base
 from datetime import datetime
@@ -25,11 +25,20 @@ class UserTestHistory(Base):
 # ✅ 사용자 응답 (responses 테이블)
 class UserResponse(Base):
     __tablename__ = "responses"  # ✅ 실제 DB 테이블명 responses에 매핑
-    __table_args__ = {"extend_existing": True}  # ✅ 중복 정의 방지
+    __table_args__ = (
+        Index("ix_responses_created_at_id", "created_at", "response_id"),
+        Index("ix_responses_stats_pending", "stats_applied", "created_at"),  # ✅ 미반영 응답 조회용
+        Index("ix_responses_question_stats", "question_id", "is_correct", "response_time_sec"),  # ✅ 문항 통계 커버링 인덱스
+        {"extend_existing": True},  # ✅ 중복 정의 방지
+    )
 
     response_id = Column(String(36), primary_key=True)  # ✅ 응답 ID (UUID 문자열)
+    email = Column(String(255), nullable=True)  # ✅ 응답자 이메일 (submit_test 에서 저장)
     test_id = Column(String(36), ForeignKey("tests.test_id"), nullable=False)  # ✅ 검사 ID (FK)
     question_id = Column(String(36), ForeignKey("questions.question_id"), nullable=False)  # ✅ 문항 ID (FK)
     selected_option_ids = Column(JSON, nullable=True)  # ✅ 선택된 선택지 ID (JSON 배열)
     response_time_sec = Column(Float, nullable=True)  # ✅ 응답 소요 시간 (초)
+    is_correct = Column(Boolean, nullable=True)  # ✅ 제출 시 채점 결과 (문항 통계 집계용)
+    group_value = Column(String(100), nullable=True)  # ✅ 제출 시점 소속 학교 (문항 통계 집계용)
+    stats_applied = Column(Boolean, nullable=False, default=False, server_default=text("0"))  # ✅ 문항 통계 반영 여부 (집계기가 설정)
     created_at = Column(DateTime, default=datetime.utcnow)  # ✅ 생성일시 (자동 입력)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, DateTime, Enum, Text, Float, JSON
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, DateTime, Enum, Text, Float, JSON, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from backend.database.database import Base
@@ -29,6 +29,7 @@ class Test(Base):
 
     question_count = Column(Integer, default=0)  # ✅ 예상 문항 수
     is_published = Column(Boolean, default=False)  # ✅ 공개 여부
+    prerender_reports = Column(Boolean, default=False)  # ✅ 제출 직후 리포트 PDF 사전 렌더링 여부
     duration_minutes = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -48,6 +49,12 @@ class QuestionTypeEnum(str, enum.Enum):
 # ✅ 검사 리포트 테이블 (분석용)
 class TestReport(Base):
     __tablename__ = "test_reports"
+    __table_args__ = (
+        Index("ix_test_reports_generated_at_id", "report_generated_at", "report_id"),
+        Index("ix_test_reports_analytics_pending", "analytics_applied", "report_generated_at"),  # ✅ 미반영 리포트 조회용
+        Index("ix_test_reports_test_score", "test_id", "score_total", "score_standardized"),  # ✅ 검사별 통계 커버링 인덱스
+        Index("ix_test_reports_email", "email", "report_generated_at"),  # ✅ 내보내기 사용자 ↔ 리포트 조인 (기간 필터 포함)
+    )
 
     report_id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)  # ✅ 사용자 ID 필드
@@ -58,6 +65,9 @@ class TestReport(Base):
     score_level = Column(String(20))
     result_summary = Column(Text)
     report_generated_at = Column(DateTime, default=datetime.utcnow)
+    num_questions = Column(Integer, nullable=True)  # ✅ 제출 시점 검사 문항 수 (완료율 집계용)
+    num_answered = Column(Integer, nullable=True)   # ✅ 채점된 응답 문항 수 (완료율 집계용)
+    analytics_applied = Column(Boolean, nullable=False, default=False, server_default=text("0"))  # ✅ 그룹 통계 반영 여부 (집계기가 설정)
 
     # ✅ 관계 설정
     test = relationship("Test", back_populates="reports", overlaps="user_reports")
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, String, Float, Enum, ForeignKey, Integer, Text
+from sqlalchemy import Column, String, Float, Enum, ForeignKey, Integer, Text, UniqueConstraint
 from backend.database.database import Base
 from uuid import uuid4
 import enum
 
 # ✅ 그룹 유형 enum 정의
 class GroupTypeEnum(str, enum.Enum):
+    overall = "overall"     # ✅ 추가: 전체 응시자 기준 (group_value="전체")
     school = "school"
     region = "region"
     company = "company"
@@ -13,6 +14,10 @@ class GroupTypeEnum(str, enum.Enum):
 # ✅ 검사별 그룹 통계 테이블
 class TestAnalyticsByGroup(Base):
     __tablename__ = "test_analytics_by_group"
+    __table_args__ = (
+        # ✅ (검사, 그룹, 연, 월) 단위 1행 보장 → 증분 집계 UPSERT 대상
+        UniqueConstraint("test_id", "group_type", "group_value", "year", "month", name="uq_test_analytics_group_period"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))  # ✅ UUID → String
     test_id = Column(String(36), ForeignKey("tests.test_id"), nullable=False)  # ✅ UUID → String
@@ -29,3 +34,10 @@ class TestAnalyticsByGroup(Base):
     overall_correct_rate = Column(Float, nullable=True)
 
     score_distribution_json = Column(Text)  # ✅ 긴 문자열 JSON 저장에 적합
+
+    # ✅ 증분 집계(Welford) 상태값 — 평균/표준편차/비율을 재계산 없이 갱신하기 위해 저장
+    num_participants = Column(Integer, default=0)      # 응시자(리포트) 수
+    num_completed = Column(Integer, default=0)         # 전 문항 응답 리포트 수
+    score_m2 = Column(Float, default=0.0)              # 점수 편차 제곱합 (Welford M2)
+    sum_correct = Column(Float, default=0.0)           # 정답 수 합계
+    sum_questions = Column(Integer, default=0)         # 문항 수 합계
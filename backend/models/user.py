@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from backend.database.database import Base
@@ -23,10 +23,12 @@ class User(Base):
     user_id = Column(String(36), primary_key=True)  # ✅ UUID 문자열로 기본키 설정
 
     email = Column(String(255), unique=True, nullable=False)  # ✅ [수정] 암호화된 이메일 → 일반 email
+    email_bidx = Column(String(64), nullable=True, index=True)  # ✅ 이메일 블라인드 인덱스 (HMAC, 동등 조회용)
     password = Column(String(255), nullable=False)  # ✅ [수정] password → password
     name = Column(String(100), nullable=False)  # ✅ 이름
     nickname = Column(String(50), nullable=True)  # ✅ 닉네임
     phone = Column(String(20), nullable=True)  # ✅ [수정] phone → phone
+    phone_bidx = Column(String(64), nullable=True, index=True)  # ✅ 전화번호 블라인드 인덱스 (HMAC, 동등 조회용)
     gender = Column(String(10), nullable=True)  # ✅ 성별
     birth_year = Column(Integer, nullable=True)  # ✅ 출생년도
     role = Column(Enum(UserRoleEnum), default="user", nullable=False)  # ✅ 사용자 권한
@@ -54,12 +56,21 @@ class User(Base):
 # ✅ 사용자 프로필 테이블 (User와 1:1 관계)
 class UserProfile(Base):
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        # ✅ 리포트는 email 로 프로필과 조인 → 이메일당 프로필 1개여야 리포트가 중복 집계/내보내기되지 않음
+        UniqueConstraint("email", name="uq_user_profiles_email"),
+    )
 
     profile_id = Column(Integer, primary_key=True, autoincrement=True)  # ✅ 기본키
 
     user_id = Column(String(36), ForeignKey("users.user_id"), nullable=False, unique=True)  # ✅ UUID 외래키
 
-    current_company = Column(String(100), nullable=True)  # ✅ 현재 소속 회사
+    # 🔧 수정됨: 라우터/CRUD 에서 사용 중인 컬럼을 모델에 반영 (create_user_profile, submit_test, 통계 API)
+    email = Column(String(255), nullable=True)  # ✅ 평문 이메일 (리포트 email 과 조인, 유니크)
+    school = Column(String(100), nullable=True, index=True)  # ✅ 소속 학교
+    region = Column(String(100), nullable=True, index=True)  # ✅ 지역
+
+    current_company = Column(String(100), nullable=True, index=True)  # ✅ 현재 소속 회사
     last_company = Column(String(100), nullable=True)     # ✅ 마지막 입사 회사
     education_level = Column(String(50), nullable=True)   # ✅ 학력
     experience_years = Column(Integer, nullable=True)     # ✅ 경력
@@ -0,0 +1,18 @@
+# backend/models/user_search_token.py
+
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from backend.database.database import Base
+
+
+# ✅ 암호화된 이메일/전화번호 부분 검색용 n-gram 블라인드 토큰
+class UserSearchToken(Base):
+    __tablename__ = "user_search_tokens"
+    __table_args__ = (
+        Index("ix_user_search_tokens_lookup", "field", "token", "user_id"),  # ✅ 토큰 → 사용자 커버링 인덱스
+        Index("ix_user_search_tokens_user_id", "user_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    field = Column(String(10), nullable=False)    # ✅ email / phone
+    token = Column(String(16), nullable=False)    # ✅ HMAC(3-gram) 앞 16자리
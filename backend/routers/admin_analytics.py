@@ -4,6 +4,7 @@ from uuid import UUID
 from typing import List, Any
 
 from backend.database.database import get_db
+from backend.crud import statistics  # ✅ SQL 집계 기반 통계
 from backend.schemas.test_analytics import (
     TestAnalyticsSummary,
     TestAnalyticsDetail,
@@ -25,47 +26,17 @@ router = APIRouter(
 # ✅ 전체 검사별 통계 요약
 @router.get("/tests", response_model=List[TestAnalyticsSummary])
 def get_all_test_stats(db: Session = Depends(get_db)):
-    # ✅ 예시 데이터 — 실제 구현 시 DB 분석 로직 필요
-    return [
-        TestAnalyticsSummary(
-            test_id=UUID("11111111-1111-1111-1111-111111111111"),
-            test_name="종합 적성 검사 A형",
-            num_participants=234,
-            avg_total_score=78.4,
-            std_total_score=9.2,
-            completion_rate=0.95
-        )
-    ]
+    return statistics.get_all_test_stats(db)
 
 # ✅ 특정 검사 상세 통계
 @router.get("/tests/{test_id}", response_model=TestAnalyticsDetail)
 def get_test_detail_stats(test_id: UUID, db: Session = Depends(get_db)):
-    return TestAnalyticsDetail(
-        test_id=test_id,
-        avg_duration_minutes=25.3,
-        overall_correct_rate=0.82,
-        score_distribution={
-            "60-70": 21,
-            "70-80": 55,
-            "80-90": 38
-        }
-    )
+    return statistics.get_test_detail_stats(db, str(test_id))
 
 # ✅ 문항별 통계
 @router.get("/questions/{question_id}", response_model=QuestionAnalytics)
 def get_question_stats(question_id: UUID, db: Session = Depends(get_db)):
-    return QuestionAnalytics(
-        question_id=question_id,
-        num_responses=1410,
-        correct_rate=0.64,
-        avg_response_time=8.2,
-        option_distribution={
-            "opt-a": 45.2,
-            "opt-b": 33.1,
-            "opt-c": 15.0,
-            "opt-d": 6.7
-        }
-    )
+    return statistics.get_question_stats(db, str(question_id))
 
 # ✅ 응답 기반 필터 통계 (예: 학교 필터)
 @router.get("/responses", response_model=ResponseAnalyticsSummary)
@@ -73,29 +44,14 @@ def get_response_stats(
     filter: str = Query(None),
     db: Session = Depends(get_db)
 ):
-    return ResponseAnalyticsSummary(
-        total_users=202,
-        avg_score=75.6,
-        dominant_level="STEN 6",
-        top_3_schools=["서울대", "연세대", "고려대"]
-    )
+    return statistics.get_response_stats(db, school=filter)
 
 # ✅ 그룹별 통계 비교 (학교/지역/기업 등)
 @router.get("/groups", response_model=GroupAnalyticsSummary)
 def get_group_stats(
     type: str = Query(...), value: str = Query(...), db: Session = Depends(get_db)
 ):
-    if type not in ["school", "region", "company", "age"]:
+    if type not in statistics.GROUP_TYPES:
         raise HTTPException(status_code=400, detail="Invalid group type")
 
-    return GroupAnalyticsSummary(
-        group=value,
-        avg_score=81.2,
-        dominant_score_level="STEN 7",
-        score_distribution={
-            "STEN 6 이하": 10,
-            "STEN 7~8": 22,
-            "STEN 9~10": 8
-        }
-    )
-
+    return statistics.get_group_stats(db, type, value)
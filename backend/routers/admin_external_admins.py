@@ -8,6 +8,7 @@ from backend.database.database import get_db
 from backend.models.institution_admin import InstitutionAdmin
 from backend.models.user import User
 from backend.dependencies.admin_auth import get_super_admin_user
+from backend.core.auth_cache import invalidate_user_auth
 from backend.schemas.external_admin import (
     ExternalAdminCreateRequest,
     ExternalAdminApprovalRequest
@@ -64,6 +65,7 @@ def approve_external_admin(
 
     admin.approved = request.approved
     db.commit()
+    invalidate_user_auth(admin.user_id)  # ✅ 기관 관리자 인증 캐시 무효화
 
     status_msg = "승인됨" if request.approved else "거절됨"
     return {"message": f"외부 관리자 요청이 {status_msg} 처리되었습니다."}
@@ -0,0 +1,36 @@
+# backend/routers/admin_metrics.py
+
+from fastapi import APIRouter, Depends
+
+from backend.dependencies.external_admin_auth import get_super_admin_user
+from backend.database.pool_metrics import pool_stats
+from backend.core.auth_cache import auth_cache_stats
+from backend.routers.user import login_ip_limiter, login_account_limiter, signup_ip_limiter
+
+router = APIRouter(
+    prefix="/api/admin/metrics",
+    tags=["Admin - Metrics"],
+    dependencies=[Depends(get_super_admin_user)]
+)
+
+
+# ✅ 운영 지표 (현재 워커 프로세스 기준)
+@router.get("")
+def get_metrics():
+    """
+    - db_pool: 엔진별 커넥션 풀 게이지(in_use / overflow / idle), 체크아웃 대기 히스토그램, 느린 체크아웃 / 타임아웃 횟수
+    - auth_cache: 인증 레코드 캐시 적중률
+    - rate_limit: 로그인 / 회원가입 요청 제한 허용 / 거부 횟수
+    - uvicorn 워커마다 별도 값이므로 요청마다 다른 워커의 지표가 반환될 수 있음
+    """
+    return {
+        "db_pool": pool_stats(),
+        "auth_cache": auth_cache_stats(),
+        "rate_limit": [limiter.stats() for limiter in (login_ip_limiter, login_account_limiter, signup_ip_limiter)],
+    }
+
+
+# ✅ 커넥션 풀 지표만 조회
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    return pool_stats()
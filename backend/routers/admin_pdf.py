@@ -1,16 +1,14 @@
 # backend/routers/admin_pdf.py
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Header
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
 from backend.database.database import get_db
-# ✅ Report → UserTestHistory로 클래스명 변경
-from backend.models.response import UserTestHistory
-from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
-import os
-import tempfile
+# ✅ UserTestHistory(user_reports)에는 점수 필드가 없어 TestReport 사용
+from backend.models.test import TestReport
+from backend.services.pdf_store import pdf_store, pdf_file_response  # ✅ 렌더링된 PDF 디스크 캐시
+from backend.services.pdf_export import ADMIN_REPORT_TEMPLATE, admin_report_context  # ✅ 일괄 내보내기와 캐시 키 공유
 
 router = APIRouter(
     prefix="/api/admin/reports",
@@ -19,30 +17,17 @@ router = APIRouter(
 
 # ✅ 리포트 PDF 다운로드 (학교/기업 관리자 전용)
 @router.get("/pdf/{report_id}")
-def download_report_pdf(report_id: UUID, db: Session = Depends(get_db)):
-    report = db.query(UserTestHistory).filter(UserTestHistory.report_id == report_id).first()  
+def download_report_pdf(
+    report_id: UUID,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    report = db.query(TestReport).filter(TestReport.report_id == str(report_id)).first()
 
     if not report:
         raise HTTPException(status_code=404, detail="리포트를 찾을 수 없습니다.")
 
-    # ✅ HTML 템플릿 렌더링 (Jinja2)
-    env = Environment(loader=FileSystemLoader("backend/templates"))
-    template = env.get_template("report_template.html")
+    # ✅ PDF 저장소 조회 → 없으면 워커 풀에서 렌더링 후 저장 (임시 파일은 저장소가 관리)
+    stored = pdf_store.get_or_render(ADMIN_REPORT_TEMPLATE, admin_report_context(report))
 
-    html_out = template.render(
-        report_id=report.report_id,
-        score=report.score,
-        sten=report.sten,
-        description=report.description,
-        created_at=report.created_at,
-    )
-
-    # ✅ 임시 PDF 파일 생성
-    tmp_pdf = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    HTML(string=html_out).write_pdf(tmp_pdf.name)
-
-    return FileResponse(
-        path=tmp_pdf.name,
-        filename=f"report_{report.report_id}.pdf",
-        media_type="application/pdf"
-    )
+    return pdf_file_response(stored, f"report_{report.report_id}.pdf", if_none_match)
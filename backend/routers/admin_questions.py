@@ -1,15 +1,20 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, UploadFile, File
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID, uuid4
 from typing import Optional, List
 
 from backend.database.database import get_db
-from backend.models.question import Question, QuestionStatus
+from backend.models.question import Question, QuestionStatus, UsageType
 from backend.models.option import Option
 from backend.schemas.question_review import QuestionReviewRequest, QuestionReviewResponse
 from backend.schemas.question_list import QuestionListItem, OptionItem
 from backend.schemas.question_create import QuestionCreateRequest, QuestionCreateResponse
+from backend.schemas.question_import import QuestionImportResponse
+from backend.crud.question import QuestionFilter, list_questions_page, invalidate_question_counts, update_question_in_place
+from backend.services import question_import
 from backend.dependencies.admin_auth import get_current_admin_user
+from backend.services.scoring import get_test_ids_for_question
+from backend.core.cache import invalidate_test_caches  # ✅ 검사 단위 캐시 무효화 (정답표/문항 페이로드)
 
 # ✅ 관리자 인증 의존성
 from backend.dependencies.admin_auth import get_content_or_super_admin_user
@@ -80,47 +85,91 @@ def review_question(
         message = "Question reviewed and rejected."
 
     db.commit()
+    invalidate_question_counts()
     return QuestionReviewResponse(message=message)
 
+def _to_list_item(q: Question) -> QuestionListItem:
+    return QuestionListItem(
+        question_id=q.question_id,
+        test_id=q.test_id,
+        question_text=q.question_text,
+        question_type=q.question_type,
+        is_multiple_choice=q.is_multiple_choice,
+        status=q.status,
+        created_at=q.created_at,
+        question_name=q.question_name,
+        instruction=q.instruction,
+        correct_explanation=q.correct_explanation,
+        wrong_explanation=q.wrong_explanation,
+        usage_type=q.usage_type,
+        options=[
+            OptionItem(
+                option_text=o.option_text,
+                is_correct=o.is_correct,
+                option_order=o.option_order
+            ) for o in sorted(q.options, key=lambda x: x.option_order or 0)
+        ]
+    )
+
 # 🔍 문항 목록 조회
 @router.get("", response_model=List[QuestionListItem])
 def get_questions(
+    response: Response,
     status: Optional[QuestionStatus] = Query(None),
+    usage_type: Optional[UsageType] = Query(None, description="aptitude / personality"),
+    question_type: Optional[str] = Query(None, description="text / image 등"),
+    name_prefix: Optional[str] = Query(None, max_length=100, description="문항명 접두어"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (지정 시 keyset 페이지네이션)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     db: Session = Depends(get_db)
 ):
     """
     ✅ 문항 목록을 조회하고, 선택지에 option_order 포함되도록 명시적 직렬화 처리
     ✅ 프론트엔드 '문항 보기' 기능에서 option_order 기반 정렬을 위해 필요
+    - limit / cursor 지정 시 (created_at, question_id) 기준 keyset 페이지 조회
+      → 응답 헤더 X-Next-Cursor (다음 페이지, 마지막이면 없음) / X-Total-Count (필터 기준 문항 수, 최대 60초 캐시)
+    - limit 없이 호출하면 기존처럼 전체 목록 반환 (문항 선택 모달 등 기존 화면 호환)
     """
-    query = db.query(Question).options(joinedload(Question.options))
-    if status:
-        query = query.filter(Question.status == status)
-
-    questions = query.order_by(Question.created_at.desc()).all()
-
-    result = []
-    for q in questions:
-        result.append(QuestionListItem(
-            question_id=q.question_id,
-            test_id=q.test_id,
-            question_text=q.question_text,
-            question_type=q.question_type,
-            is_multiple_choice=q.is_multiple_choice,
-            status=q.status,
-            created_at=q.created_at,
-            question_name=q.question_name,
-            instruction=q.instruction,
-            correct_explanation=q.correct_explanation,
-            wrong_explanation=q.wrong_explanation,
-            usage_type=q.usage_type,
-            options=[
-                OptionItem(
-                    option_text=o.option_text,
-                    is_correct=o.is_correct,
-                    option_order=o.option_order
-                ) for o in sorted(q.options, key=lambda x: x.option_order or 0)
-            ]
-        ))
+    f = QuestionFilter(status=status, usage_type=usage_type, question_type=question_type, name_prefix=name_prefix)
+
+    if limit is None and cursor is None:
+        page = list_questions_page(db, f, limit=None)
+    else:
+        try:
+            page = list_questions_page(db, f, limit=limit or 100, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+    response.headers["X-Total-Count"] = str(page.total)
+
+    return [_to_list_item(q) for q in page.items]
+
+# ✅ 문항 일괄 가져오기 (CSV / XLSX / JSON)
+@router.post("/import", response_model=QuestionImportResponse)
+def import_questions(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False, description="true 이면 검증만 수행 (저장 안 함)"),
+    db: Session = Depends(get_db)
+):
+    """
+    ✅ 업로드 파일의 문항을 청크 단위로 검증하고 일괄 저장합니다.
+    - CSV/XLSX 열: question_name, question_text, question_type, usage_type, is_multiple_choice(선택),
+      instruction, correct_explanation, wrong_explanation, question_image_url, test_id,
+      option_1 ~ option_N, correct ("2" 또는 "1,3", 1부터 시작)
+    - JSON: 문항 등록 API 와 같은 형식의 객체 배열 또는 JSON Lines
+    - 청크(500문항)마다 questions / options 를 각각 다중 VALUES INSERT 1회 + 커밋 1회
+    - 오류 행은 건너뛰고 행 번호별로 보고, 가져온 문항은 승인(approved) 상태로 저장
+    - 최대 20000행: 초과분은 처리하지 않고 truncated=true 로 응답 (그 전까지의 행은 저장됨)
+    """
+    try:
+        fmt = question_import.detect_format(file.filename)
+        result = question_import.import_questions(db, file.file, fmt, dry_run=dry_run)
+    except question_import.QuestionImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result["inserted"]:
+        invalidate_question_counts()
     return result
 
 # ✅ 문항 등록
@@ -162,57 +211,48 @@ def create_question(
         db.add(option)
 
     db.commit()
+    if request.test_id:
+        invalidate_test_caches([str(request.test_id)])  # ✅ 검사에 바로 연결된 문항 → 정답표/문항 페이로드 갱신
+    invalidate_question_counts()
 
     return QuestionCreateResponse(
         question_id=question.question_id,
         message="Question created successfully."
     )
 
-# ✅ 문항 수정 (문항 + 선택지 전체 업데이트)
+# ✅ 문항 수정 (문항 + 선택지 제자리 업데이트, option_id 유지)
 @router.put("/{question_id}", response_model=QuestionCreateResponse)
 def update_question(
     question_id: UUID,
     request: QuestionCreateRequest,
     db: Session = Depends(get_db)
 ):
-    print(f"🚨 update_question 호출됨: question_id = {question_id} ({type(question_id)})")
-
-    db.query(Option).filter(Option.question_id == str(question_id)).delete()
-    db.query(Question).filter(Question.question_id == str(question_id)).delete()
-
-    new_question = Question(
-        question_id=str(question_id),
-        test_id=request.test_id,
-        question_text=request.question_text,
-        question_type=request.question_type,
-        is_multiple_choice=request.is_multiple_choice,
-        instruction=request.instruction,
-        correct_explanation=request.correct_explanation,
-        wrong_explanation=request.wrong_explanation,
-        question_image_url=request.question_image_url,
-        question_name=request.question_name,
-        usage_type=request.usage_type,
-        status=QuestionStatus.approved
+    question = (
+        db.query(Question)
+        .options(selectinload(Question.options))
+        .filter(Question.question_id == str(question_id))
+        .first()
     )
-    db.add(new_question)
-    db.flush()
+    if not question:
+        raise HTTPException(status_code=404, detail="Question not found")
 
-    for index, opt in enumerate(request.options):
-        new_option = Option(
-            option_id=uuid4(),
-            question_id=str(question_id),
-            option_text=opt.option_text,
-            is_correct=opt.is_correct,
-            option_image_url=opt.option_image_url,
-            option_order=index
-        )
-        db.add(new_option)
+    # ✅ 정답표 캐시 무효화 대상 (수정 전 연결된 검사)
+    affected_test_ids = get_test_ids_for_question(db, question_id)
+
+    changed = update_question_in_place(db, question, request)
+    if not changed:
+        return QuestionCreateResponse(question_id=question_id, message="No changes.")
 
     db.commit()
 
+    if request.test_id:
+        affected_test_ids.append(str(request.test_id))
+    invalidate_test_caches(affected_test_ids)
+    invalidate_question_counts()
+
     return QuestionCreateResponse(
         question_id=question_id,
-        message="Question updated successfully (replaced)."
+        message="Question updated successfully."
     )
 
 @router.get("/{question_id}/used-in-tests", response_model=list[str])
@@ -250,6 +290,9 @@ def delete_question(
     # 🔧 문자열로 변환 (MySQL UUID 저장형식 대응)
     question_id_str = str(question_id)
 
+    # ✅ 정답표 캐시 무효화 대상 (연결 삭제 전에 계산)
+    affected_test_ids = get_test_ids_for_question(db, question_id_str)
+
     # ✅ Option (선택지) 먼저 삭제
     db.query(Option).filter(Option.question_id == question_id_str).delete()
 
@@ -269,4 +312,7 @@ def delete_question(
     db.delete(question)
     db.commit()
 
+    invalidate_test_caches(affected_test_ids)
+    invalidate_question_counts()
+
     return {"message": "Question and related data deleted successfully."}
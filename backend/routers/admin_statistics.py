@@ -2,11 +2,14 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
+from datetime import date
 from io import StringIO
-from typing import Optional, Any
+from typing import List, Optional, Any
 import pandas as pd
 
 from backend.database.database import get_db
+from backend.crud import statistics  # ✅ SQL 집계 기반 통계
+from backend.services.export import export_response  # ✅ 공용 내보내기 엔진
 from backend.models.test import TestReport, Test  # ✅ Report → TestReport로 이름 변경
 from backend.models.user import User
 from backend.dependencies.admin_auth import get_super_admin_user
@@ -26,127 +29,53 @@ router = APIRouter(
 )
 
 # ✅ 전체 검사별 통계 요약
-@router.get("/tests", response_model=list[TestAnalyticsSummary])
+@router.get("/tests", response_model=List[TestAnalyticsSummary])
 def get_all_test_stats(db: Session = Depends(get_db)):
-    return [
-        TestAnalyticsSummary(
-            test_id=UUID("11111111-1111-1111-1111-111111111111"),
-            test_name="종합 적성 검사 A형",
-            num_participants=234,
-            avg_total_score=78.4,
-            std_total_score=9.2,
-            completion_rate=0.95
-        )
-    ]
+    return statistics.get_all_test_stats(db)
 
 # ✅ 특정 검사 상세 통계
 @router.get("/tests/{test_id}", response_model=TestAnalyticsDetail)
 def get_test_detail_stats(test_id: UUID, db: Session = Depends(get_db)):
-    return TestAnalyticsDetail(
-        test_id=test_id,
-        avg_duration_minutes=25.3,
-        overall_correct_rate=0.82,
-        score_distribution={
-            "60-70": 21,
-            "70-80": 55,
-            "80-90": 38
-        }
-    )
+    return statistics.get_test_detail_stats(db, str(test_id))
 
 # ✅ 문항별 통계
 @router.get("/questions/{question_id}", response_model=QuestionAnalytics)
 def get_question_stats(question_id: UUID, db: Session = Depends(get_db)):
-    return QuestionAnalytics(
-        question_id=question_id,
-        num_responses=1410,
-        correct_rate=0.64,
-        avg_response_time=8.2,
-        option_distribution={
-            "opt-a": 45.2,
-            "opt-b": 33.1,
-            "opt-c": 15.0,
-            "opt-d": 6.7
-        }
-    )
+    return statistics.get_question_stats(db, str(question_id))
 
-# ✅ 응답 기반 필터 통계
+# ✅ 응답 기반 필터 통계 (예: 학교 필터)
 @router.get("/responses", response_model=ResponseAnalyticsSummary)
 def get_response_stats(
     filter: str = Query(None),
     db: Session = Depends(get_db)
 ):
-    return ResponseAnalyticsSummary(
-        total_users=202,
-        avg_score=75.6,
-        dominant_level="STEN 6",
-        top_3_schools=["서울대", "연세대", "고려대"]
-    )
+    return statistics.get_response_stats(db, school=filter)
 
-# ✅ 그룹별 통계 비교
+# ✅ 그룹별 통계 비교 (학교/지역/기업 등)
 @router.get("/groups", response_model=GroupAnalyticsSummary)
 def get_group_stats(
-    type: str = Query(...),
-    value: str = Query(...),
-    db: Session = Depends(get_db)
+    type: str = Query(...), value: str = Query(...), db: Session = Depends(get_db)
 ):
-    if type not in ["school", "region", "company", "age"]:
+    if type not in statistics.GROUP_TYPES:
         raise HTTPException(status_code=400, detail="Invalid group type")
 
-    return GroupAnalyticsSummary(
-        group=value,
-        avg_score=81.2,
-        dominant_score_level="STEN 7",
-        score_distribution={
-            "STEN 6 이하": 10,
-            "STEN 7~8": 22,
-            "STEN 9~10": 8
-        }
-    )
+    return statistics.get_group_stats(db, type, value)
 
-# ✅ 사용자 + 리포트 데이터 다운로드 (CSV)
+# ✅ 사용자 + 리포트 데이터 다운로드 (CSV / gzip-CSV / Parquet, 스트리밍)
 @router.get("/download")
-def download_user_reports(db: Session = Depends(get_db)):
-    users = db.query(User).all()
-    reports = db.query(TestReport).all()  # ✅ Report → TestReport 이름 변경
-    tests = {t.test_id: t.test_name for t in db.query(Test).all()}
-
-    # 사용자 DF
-    user_df = pd.DataFrame([
-        {
-            "user_id": u.user_id,
-            "nickname": u.nickname,
-            "subscription": u.subscription,
-            "is_active": u.is_active,
-            "created_at": u.created_at
-        }
-        for u in users
-    ])
-
-    # 리포트 DF (검사별 점수 & 생성일)
-    report_rows = []
-    for r in reports:
-        report_rows.append({
-            "user_id": r.user_id,
-            f"{tests.get(r.test_id, 'Unknown')}_score": r.score_total,
-            f"{tests.get(r.test_id, 'Unknown')}_date": r.report_generated_at.strftime("%Y-%m-%d")
-        })
-    report_df = pd.DataFrame(report_rows)
-
-    # 검사별 열 확장 (pivot-like merge)
-    final_df = user_df.copy()
-    if not report_df.empty:
-        report_wide = report_df.groupby("user_id").first().reset_index()
-        final_df = pd.merge(user_df, report_wide, on="user_id", how="left")
-
-    # CSV 스트리밍
-    buffer = StringIO()
-    final_df.to_csv(buffer, index=False)
-    buffer.seek(0)
-
-    return StreamingResponse(
-        buffer,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=all_user_reports.csv"}
+def download_user_reports(
+    format: str = Query("csv", description="csv / csv.gz / parquet"),
+    columns: Optional[str] = Query(None, description="쉼표로 구분된 출력 열 (예: user_id,nickname,적성검사A)"),
+    date_from: Optional[date] = Query(None, description="리포트 생성일 시작 (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="리포트 생성일 종료 (YYYY-MM-DD)"),
+    db: Session = Depends(get_db)
+):
+    """
+    전체 사용자 검사 결과를 검사별 score/date 열로 피벗하여 스트리밍합니다.
+    - 서버 측 커서(yield_per) 사용 → 사용자 수와 무관하게 메모리 일정, 첫 바이트 즉시 전송
+    """
+    return export_response(
+        db, "all_user_reports", format, columns, date_from, date_to
     )
 
 # ✅ 특정 검사 결과 다운로드 (CSV)
@@ -299,4 +228,3 @@ def get_test_result_summary(test_id: UUID, db: Session = Depends(get_db)):
         "max_score": max(scores) if scores else None,
         "sten_distribution": sten_distribution
     }
-
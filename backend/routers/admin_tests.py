@@ -8,7 +8,7 @@ from backend.models.test import Test
 from backend.models.question import Question
 from backend.models.option import Option
 from backend.schemas.question_create import OptionItem
-from backend.schemas.test_detail import TestDetailResponse, QuestionWithOptionsOut, QuestionIdList, TestCreateRequest
+from backend.schemas.test_detail import TestDetailResponse, QuestionWithOptions, QuestionWithOptionsOut, QuestionIdList, TestCreateRequest
 from backend.schemas.test_create import TestCreateRequest, TestCreateResponse
 from backend.schemas.test_add_question import AddQuestionRequest, AddQuestionResponse
 from backend.schemas.test_remove_question import RemoveQuestionRequest, RemoveQuestionResponse
@@ -16,9 +16,15 @@ from backend.schemas.test_update import TestUpdateRequest, TestUpdateResponse
 from backend.schemas.test_question_bulk_link import TestQuestionBulkLinkRequest
 
 from backend.dependencies.admin_auth import get_current_admin_user
+from backend.core.cache import invalidate_test_caches, invalidate_test_catalog, test_cache_stats  # ✅ 검사 단위 캐시 (정답표/문항 페이로드)
+from backend.services.report_prerender import report_prerenderer  # ✅ 리포트 사전 렌더링 지표
+from backend.services.pdf_store import pdf_store
+from backend.services.pdf_renderer import pdf_renderer
 
 from backend.models.test_question_links import TestQuestionLink
 from backend.schemas.test_question_links import TestQuestionLinkCreate, TestQuestionLinkOut
+from backend.crud.test_question_link import replace_test_question_links
+from backend.crud.test import load_test_with_questions, sorted_options  # ✅ 검사 + 문항 + 선택지 일괄 조회 (쿼리 2회)
 
 
 
@@ -42,22 +48,38 @@ def get_all_tests(db: Session = Depends(get_db)):
     ]
 
 
+# ✅ 검사 단위 캐시 적중/미스 통계 (/{test_id} 보다 먼저 등록해야 함)
+@router.get("/cache/stats")
+def get_cache_stats():
+    """
+    현재 워커 프로세스의 검사 단위 캐시 hit/miss 카운터를 반환합니다.
+    """
+    return test_cache_stats()
+
+
+# ✅ 리포트 사전 렌더링 대기열 지표 (/{test_id} 보다 먼저 등록해야 함)
+@router.get("/prerender/stats")
+def get_prerender_stats():
+    """
+    현재 워커 프로세스의 사전 렌더링 대기열 깊이 / 처리 / 버림 건수와 PDF 저장소 적중률을 반환합니다.
+    """
+    return {
+        "prerender": report_prerenderer.stats(),
+        "pdf_store": pdf_store.stats(),
+        "pdf_renderer": pdf_renderer.stats(),
+    }
+
+
 # ✅ 특정 검사 상세 조회
 @router.get("/{test_id}", response_model=TestDetailResponse)
 def get_test_detail(test_id: UUID, db: Session = Depends(get_db)):
-    test = db.query(Test).filter(Test.test_id == str(test_id)).first()
-    if not test:
+    loaded = load_test_with_questions(db, str(test_id), linked=False)
+    if not loaded:
         raise HTTPException(status_code=404, detail="Test not found")
-
-    questions = (
-        db.query(Question)
-        .filter(Question.test_id == str(test_id))
-        .order_by(Question.order_index)
-        .all()
-    )
+    test = loaded.test
 
     question_items: List[QuestionWithOptions] = []
-    for q in test.questions:
+    for q in loaded.questions:
         option_items = [
             OptionItem(
                 option_id=o.option_id,
@@ -66,7 +88,7 @@ def get_test_detail(test_id: UUID, db: Session = Depends(get_db)):
                 is_correct=o.is_correct,
                 option_image_url=o.option_image_url
             )
-            for o in q.options
+            for o in sorted_options(q)
         ]
         question_items.append(
             QuestionWithOptions(
@@ -117,6 +139,7 @@ def create_test(
     )
     db.add(test)
     db.commit()
+    invalidate_test_catalog()
 
     return TestCreateResponse(
         test_id=test.test_id,
@@ -144,6 +167,7 @@ def add_questions_to_test(
             added_count += 1
 
     db.commit()
+    invalidate_test_caches([str(test_id)])
 
     return AddQuestionResponse(
         added_count=added_count,
@@ -173,6 +197,7 @@ def remove_questions_from_test(
             removed_count += 1
 
     db.commit()
+    invalidate_test_caches([str(test_id)])
 
     return RemoveQuestionResponse(
         removed_count=removed_count,
@@ -203,8 +228,12 @@ def update_test(
         test.scoring_rule_id = request.scoring_rule_id
     if request.norm_group_id is not None:
         test.norm_group_id = request.norm_group_id
+    if request.prerender_reports is not None:
+        test.prerender_reports = request.prerender_reports
 
     db.commit()
+    invalidate_test_catalog()
+    invalidate_test_caches([str(test_id)])  # ✅ 검사명 / 소요 시간이 응시자 문항 페이로드에 포함됨
 
     return TestUpdateResponse(
         test_id=test.test_id,
@@ -222,38 +251,31 @@ def bulk_link_questions_to_test(
 ):
     """
     테스트에 문항 일괄 연결
-    기존 연결 삭제 후 새로 저장
+    - 요청 목록으로 연결을 교체 (한 트랜잭션, 변경분만 INSERT/UPDATE/DELETE)
+    - 검사 행을 잠가 동시 교체 요청을 직렬화
     """
-    # 기존 연결 삭제
-    db.query(TestQuestionLink).filter(TestQuestionLink.test_id == test_id).delete()
-    db.commit()
-
-    question_ids = question_data.question_ids
-    new_links = []
-
-    for idx, q_id in enumerate(question_ids):
-        link = TestQuestionLink(
-            test_id=test_id,
-            question_id=q_id,
-            order_index=idx,
-        )
-        db.add(link)
-        new_links.append(link)
+    test = db.query(Test).filter(Test.test_id == test_id).with_for_update().first()
+    if not test:
+        raise HTTPException(status_code=404, detail="검사를 찾을 수 없습니다.")
 
+    try:
+        diff = replace_test_question_links(db, test, question_data.question_ids)
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
     db.commit()
 
-    # ✅ 등록된 문항 수 업데이트
-    test = db.query(Test).filter(Test.test_id == test_id).first()
-    if test:
-        test.question_count = (
-            db.query(TestQuestionLink)
-            .filter(TestQuestionLink.test_id == test_id)
-            .count()
-        )
-        db.commit()
+    # ✅ 연결 문항이 바뀌었으므로 정답표 캐시 무효화
+    if diff.changed:
+        invalidate_test_caches([test_id])
 
     # ✅ 응답 형식도 변경
-    return {"message": "문항이 성공적으로 연결되었습니다."}
+    return {
+        "message": "문항이 성공적으로 연결되었습니다.",
+        "inserted": diff.inserted,
+        "deleted": diff.deleted,
+        "reordered": diff.reordered,
+    }
 
 
 
@@ -262,23 +284,25 @@ def bulk_link_questions_to_test(
 def get_test_questions(test_id: str, db: Session = Depends(get_db), user=Depends(get_current_admin_user)):
     """
     특정 검사에 연결된 문항과 보기(option)를 순서대로 반환합니다.
+    - 검사가 없으면 기존처럼 빈 목록
     """
-    links = (
-        db.query(TestQuestionLink)
-        .filter(TestQuestionLink.test_id == test_id)
-        .order_by(TestQuestionLink.order_index)
-        .all()
-    )
-
-    questions = []
-    for link in links:
-        question = db.query(Question).filter(Question.question_id == link.question_id).first()
-        if question:
-            options = db.query(Option).filter(Option.question_id == question.question_id).all()
-            question.options = options
-            questions.append(question)
+    loaded = load_test_with_questions(db, test_id)
+    if not loaded:
+        return []
 
-    return questions
+    return [
+        QuestionWithOptionsOut(
+            question_id=q.question_id,
+            question_name=q.question_name,
+            instruction=q.instruction,
+            question_text=q.question_text,
+            options=[
+                {"option_id": o.option_id, "option_text": o.option_text, "is_correct": o.is_correct}
+                for o in sorted_options(q)
+            ]
+        )
+        for q in loaded.questions
+    ]
 
 @router.put("/{test_id}/publish")
 def toggle_publish_test(
@@ -328,5 +352,7 @@ def delete_test(
 
     db.delete(test)
     db.commit()
+    invalidate_test_caches([test_id])
+    invalidate_test_catalog()
 
     return {"message": "Test deleted successfully."}
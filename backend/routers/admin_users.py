@@ -9,6 +9,9 @@ from backend.database.database import get_db
 from backend.models.user import User
 from backend.schemas.user_admin import UserListItem, AdminRoleUpdateRequest  # ✅ 역할 변경 요청 스키마 포함
 from backend.dependencies.admin_auth import get_current_admin_user  # ✅ 인증 의존성 (슈퍼 관리자 포함)
+from backend.crud import refresh_token as crud_refresh_token
+from backend.crud import user as crud_user
+from backend.core.auth_cache import invalidate_user_auth  # ✅ 역할 변경 / 비활성화 시 인증 캐시 무효화
 
 # 관리자 사용자 관리 라우터
 router = APIRouter(
@@ -20,19 +23,20 @@ router = APIRouter(
 # ✅ 사용자 목록 조회 + 필터 검색 API
 @router.get("/", response_model=List[UserListItem])
 def get_user_list(
-    keyword: Optional[str] = Query(None, description="닉네임 또는 이메일 검색"),
+    keyword: Optional[str] = Query(None, description="닉네임 / 이메일 / 전화번호 검색 (이메일·전화번호는 3자 이상)"),
     is_active: Optional[bool] = Query(None, description="활성화 여부 필터"),
     db: Session = Depends(get_db)
 ):
     query = db.query(User)
 
     if keyword:
-        query = query.filter(
-            or_(
-                User.nickname.ilike(f"%{keyword}%"),
-                User.email.ilike(f"%{keyword}%")
-            )
-        )
+        # ✅ 이메일/전화번호는 암호문이므로 n-gram 블라인드 토큰으로 검색
+        conditions = [User.nickname.ilike(f"%{keyword}%")]
+        for field in ("email", "phone"):
+            user_ids = crud_user.search_user_ids(db, field, keyword)
+            if user_ids is not None:
+                conditions.append(User.user_id.in_(user_ids))
+        query = query.filter(or_(*conditions))
 
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
@@ -76,7 +80,9 @@ def deactivate_admin_user(user_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="이미 비활성화된 계정입니다.")
 
     user.is_active = False
+    crud_refresh_token.revoke_user_tokens(db, user.user_id)  # ✅ 재발급 차단
     db.commit()
+    invalidate_user_auth(user.user_id)  # ✅ 인증 캐시 즉시 무효화
 
     return {"message": f"관리자 계정이 비활성화되었습니다: {user.nickname}"}
 
@@ -102,5 +108,6 @@ def update_admin_role(
     # ✅ 역할 변경
     user.role = request.role
     db.commit()
+    invalidate_user_auth(user.user_id)  # ✅ 인증 캐시 즉시 무효화
 
     return {"message": f"{user.nickname}의 역할이 {request.role}로 변경되었습니다."}
@@ -1,17 +1,17 @@
 # app/routers/company_statistics.py
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from io import StringIO
-import pandas as pd
+from datetime import date
+from typing import Optional
 
 from backend.database.database import get_db
-# ✅ Report → TestReport로 이름 변경
-from backend.models.test import TestReport, Test
-from backend.models.user import User
+from backend.crud import statistics  # ✅ SQL 집계 기반 통계
+from backend.models.test_analytics_by_group import GroupTypeEnum
 from backend.models.institution_admin import InstitutionAdmin
 from backend.dependencies.external_admin_auth import get_company_admin_user
+from backend.services.export import export_response  # ✅ 공용 내보내기 엔진
+from backend.services import pdf_export  # ✅ 일괄 PDF 내보내기 작업
 
 router = APIRouter(
     prefix="/api/company/statistics",
@@ -22,88 +22,80 @@ router = APIRouter(
 # ✅ 소속 기업 지원자 검사 결과 다운로드
 @router.get("/reports/download")
 def download_company_user_reports(
+    format: str = Query("csv", description="csv / csv.gz / parquet"),
+    columns: Optional[str] = Query(None, description="쉼표로 구분된 출력 열 (예: user_id,nickname,적성검사A)"),
+    date_from: Optional[date] = Query(None, description="리포트 생성일 시작 (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="리포트 생성일 종료 (YYYY-MM-DD)"),
     current_admin: InstitutionAdmin = Depends(get_company_admin_user),
     db: Session = Depends(get_db)
 ):
     company = current_admin.institution_name
 
-    users = db.query(User).join(User.profile).filter(
-        User.profile.has(current_company=company),
-        User.is_active == True
-    ).all()
-
-    user_ids = [u.user_id for u in users]
-    reports = db.query(TestReport).filter(TestReport.user_id.in_(user_ids)).all()  # ✅ Report → TestReport 이름 변경
-    tests = {t.test_id: t.test_name for t in db.query(Test).all()}
-
-    user_df = pd.DataFrame([
-        {
-            "user_id": u.user_id,
-            "nickname": u.nickname,
-            "subscription": u.subscription,
-            "created_at": u.created_at
-        }
-        for u in users
-    ])
-
-    report_rows = []
-    for r in reports:
-        report_rows.append({
-            "user_id": r.user_id,
-            f"{tests.get(r.test_id, 'Unknown')}_score": r.score_total,
-            f"{tests.get(r.test_id, 'Unknown')}_date": r.report_generated_at.strftime("%Y-%m-%d")
-        })
-    report_df = pd.DataFrame(report_rows)
-
-    final_df = user_df.copy()
-    if not report_df.empty:
-        report_wide = report_df.groupby("user_id").first().reset_index()
-        final_df = pd.merge(user_df, report_wide, on="user_id", how="left")
+    return export_response(
+        db, f"{company}_지원자결과", format, columns, date_from, date_to,
+        company=company, active_only=True
+    )
 
-    buffer = StringIO()
-    final_df.to_csv(buffer, index=False)
-    buffer.seek(0)
+# ✅ 소속 지원자 리포트 PDF 일괄 내보내기 작업 생성
+@router.post("/reports/pdf-export")
+def create_pdf_export(
+    test_id: Optional[str] = Query(None, description="특정 검사만 내보낼 경우 test_id"),
+    current_admin: InstitutionAdmin = Depends(get_company_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    백그라운드에서 소속 지원자 리포트를 병렬 렌더링합니다.
+    - 진행 상황은 GET /reports/pdf-export/{job_id} 로 조회, 완료 후 /download 로 ZIP 수신
+    """
+    job = pdf_export.create_export_job(db, current_admin, test_id)
+    return pdf_export.job_status(job)
+
+# ✅ 일괄 PDF 내보내기 작업 상태 조회
+@router.get("/reports/pdf-export/{job_id}")
+def get_pdf_export_status(
+    job_id: str,
+    current_admin: InstitutionAdmin = Depends(get_company_admin_user),
+    db: Session = Depends(get_db)
+):
+    return pdf_export.job_status(pdf_export.get_export_job(db, current_admin, job_id))
 
-    return StreamingResponse(
-        buffer,
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={company}_지원자결과.csv"}
-    )
+# ✅ 일괄 PDF 내보내기 결과 다운로드 (ZIP 스트리밍)
+@router.get("/reports/pdf-export/{job_id}/download")
+def download_pdf_export(
+    job_id: str,
+    current_admin: InstitutionAdmin = Depends(get_company_admin_user),
+    db: Session = Depends(get_db)
+):
+    return pdf_export.export_zip_response(pdf_export.get_export_job(db, current_admin, job_id))
 
 # ✅ 기업 지원자 vs 전체 평균 비교
 @router.get("/compare")
 def compare_company_statistics(
     test_id: str,
+    source: str = Query("live", description="live: 리포트 실시간 집계 / materialized: 그룹 통계 테이블 사용"),
     db: Session = Depends(get_db),
     current_admin: InstitutionAdmin = Depends(get_company_admin_user)
 ):
-    company = current_admin.institution_name
+    """
+    기업 지원자 / 전체 평균을 집계 쿼리 1회로 계산합니다 (사용자 목록을 메모리로 불러오지 않음).
+    """
+    if source not in ("live", "materialized"):
+        raise HTTPException(status_code=400, detail="source 는 live 또는 materialized 만 가능합니다.")
 
-    company_users = db.query(User).join(User.profile).filter(
-        User.profile.has(current_company=company)
-    ).all()
-    all_users = db.query(User).all()
-
-    # ✅ 리포트 불러오기 함수 내부에서도 TestReport 사용
-    def get_scores(user_list):
-        uids = [u.user_id for u in user_list]
-        reports = db.query(TestReport).filter(  # ✅ Report → TestReport
-            TestReport.test_id == test_id,
-            TestReport.user_id.in_(uids)
-        ).all()
-        return [r.score_total for r in reports]
-
-    company_scores = get_scores(company_users)
-    all_scores = get_scores(all_users)
+    company = current_admin.institution_name
 
-    def calc_stats(scores):
-        return {
-            "avg_score": round(sum(scores)/len(scores), 2) if scores else None,
-            "user_count": len(scores)
-        }
+    stats = statistics.compare_cohorts(
+        db,
+        test_id,
+        {
+            "company": (GroupTypeEnum.company.value, company),
+            "all": (GroupTypeEnum.overall.value, "전체"),
+        },
+        materialized=(source == "materialized")
+    )
 
     return {
         "test_id": test_id,
-        "company": {"name": company, **calc_stats(company_scores)},
-        "all": {"name": "전체", **calc_stats(all_scores)}
+        "company": {"name": company, **stats["company"]},
+        "all": {"name": "전체", **stats["all"]}
     }
@@ -1,17 +1,18 @@
 # app/routers/reports.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header
 from sqlalchemy.orm import Session
 from backend.database.database import SessionLocal, get_db
 # ✅ Report → TestReport로 클래스명 변경
 from backend.models.test import TestReport, Test
-from typing import List, Any
+from typing import List, Any, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
 from fastapi.responses import Response
-from jinja2 import Environment, FileSystemLoader
-import os
+from backend.services.pdf_renderer import render_report_html  # ✅ 캐시된 리포트 템플릿
+from backend.services.pdf_store import pdf_store, pdf_file_response  # ✅ 렌더링된 PDF 디스크 캐시
+from backend.services.pdf_export import USER_REPORT_TEMPLATE, user_report_context  # ✅ 사전 렌더링과 캐시 키 공유
 
 # ✅ 환경설정 import
 from backend.core.config import settings
@@ -84,42 +85,25 @@ def get_report_detail(report_id: str, db: Session = Depends(get_db)):
 
 # ✅ 리포트 PDF 또는 HTML 다운로드 API (운영: PDF, 개발: HTML 반환)
 @router.get("/api/reports/{report_id}/download/pdf")
-def download_report_pdf(report_id: str, db: Session = Depends(get_db)):
+def download_report_pdf(
+    report_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
     report = db.query(TestReport).filter(TestReport.report_id == report_id).first()
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
     test = db.query(Test).filter(Test.test_id == report.test_id).first()
-    test_name = test.test_name if test else "Unknown"
-
-    # 템플릿 렌더링
-    template_dir = os.path.join(os.path.dirname(__file__), "..", "templates")
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template("report_pdf.html")
-
-    html_content = template.render(report={
-        "test_name": test_name,
-        "generated_at": report.report_generated_at.strftime("%Y-%m-%d"),
-        "score_total": report.score_total,
-        "score_level": report.score_level,
-        "score_standardized": report.score_standardized,
-        "result_summary": report.result_summary
-    })
-
-    # ✅ 운영환경에서만 PDF 렌더링 (weasyprint import는 내부에서만 시도)
+    context = user_report_context(report, test.test_name if test else None)
+
+    # ✅ 운영환경에서만 PDF 렌더링 (PDF 저장소에 있으면 렌더링 없이 파일 반환, Range/ETag 지원)
     if settings.ENV == "production":
-        try:
-            from weasyprint import HTML
-            pdf = HTML(string=html_content).write_pdf()
-            return Response(
-                content=pdf,
-                media_type="application/pdf",
-                headers={"Content-Disposition": f"attachment; filename=report_{report_id}.pdf"}
-            )
-        except ImportError:
-            raise HTTPException(status_code=500, detail="weasyprint 라이브러리가 서버에 설치되어 있지 않습니다.")
-
-    # ✅ 개발 환경: HTML로 직접 반환
+        stored = pdf_store.get_or_render(USER_REPORT_TEMPLATE, context)
+        return pdf_file_response(stored, f"report_{report_id}.pdf", if_none_match)
+
+    # ✅ 개발 환경: HTML로 직접 반환 (모듈 수준 캐시된 템플릿 사용)
+    html_content = render_report_html(USER_REPORT_TEMPLATE, **context)
     return Response(
         content=html_content,
         media_type="text/html",
@@ -1,17 +1,17 @@
 # app/routers/school_statistics.py
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from io import StringIO
-import pandas as pd
+from datetime import date
+from typing import Optional
 
 from backend.database.database import get_db
-from backend.models.test import TestReport, Test  # ✅ Report 이름 중복 방지를 위해 수정
-from backend.models.user import User
+from backend.crud import statistics  # ✅ SQL 집계 기반 통계
+from backend.models.test_analytics_by_group import GroupTypeEnum
 from backend.models.institution_admin import InstitutionAdmin
 from backend.dependencies.external_admin_auth import get_school_admin_user
-from backend.utils.encryption import aes_decrypt  # ✅ 이메일 복호화를 위해 추가됨
+from backend.services.export import export_response  # ✅ 공용 내보내기 엔진
+from backend.services import pdf_export  # ✅ 일괄 PDF 내보내기 작업
 
 router = APIRouter(
     prefix="/api/school/statistics",
@@ -22,100 +22,82 @@ router = APIRouter(
 # ✅ 소속 학교 학생들의 검사 결과 다운로드
 @router.get("/reports/download")
 def download_school_user_reports(
+    format: str = Query("csv", description="csv / csv.gz / parquet"),
+    columns: Optional[str] = Query(None, description="쉼표로 구분된 출력 열 (예: user_id,nickname,적성검사A)"),
+    date_from: Optional[date] = Query(None, description="리포트 생성일 시작 (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="리포트 생성일 종료 (YYYY-MM-DD)"),
     current_admin: InstitutionAdmin = Depends(get_school_admin_user),
     db: Session = Depends(get_db)
 ):
-    # ✅ 학교 관리자 정보 기준
-    school_name = current_admin.institution_name
-
-    # ✅ 소속 학교 학생 조회
-    users = db.query(User).join(User.profile).filter(
-        User.profile.has(school=school_name),
-        User.is_active == True
-    ).all()
-
-    user_emails = [u.email for u in users]  # ✅ 사용자 email 기준 필터링용
-
-    reports = db.query(TestReport).filter(TestReport.email.in_(user_emails)).all()  # ✅ Report → TestReport
-    tests = {t.test_id: t.test_name for t in db.query(Test).all()}
-
-    user_df = pd.DataFrame([
-        {
-            "user_id": u.user_id,
-            "nickname": u.nickname,
-            "subscription": u.subscription,
-            "created_at": u.created_at
-        }
-        for u in users
-    ])
-
-    report_rows = []
-    for r in reports:
-        report_rows.append({
-            "user_id": next((u.user_id for u in users if u.email == r.email), "unknown"),
-            f"{tests.get(r.test_id, 'Unknown')}_score": r.score_total,
-            f"{tests.get(r.test_id, 'Unknown')}_date": r.report_generated_at.strftime("%Y-%m-%d")
-        })
-    report_df = pd.DataFrame(report_rows)
-
-    final_df = user_df.copy()
-    if not report_df.empty:
-        report_wide = report_df.groupby("user_id").first().reset_index()
-        final_df = pd.merge(user_df, report_wide, on="user_id", how="left")
+    # ✅ 학교 관리자 정보 기준 → 소속 학교 활성 학생만 내보내기
+    return export_response(
+        db, "school_reports", format, columns, date_from, date_to,
+        school=current_admin.institution_name, active_only=True
+    )
 
-    buffer = StringIO()
-    final_df.to_csv(buffer, index=False)
-    buffer.seek(0)
+# ✅ 소속 학생 리포트 PDF 일괄 내보내기 작업 생성
+@router.post("/reports/pdf-export")
+def create_pdf_export(
+    test_id: Optional[str] = Query(None, description="특정 검사만 내보낼 경우 test_id"),
+    current_admin: InstitutionAdmin = Depends(get_school_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    백그라운드에서 소속 학생 리포트를 병렬 렌더링합니다.
+    - 진행 상황은 GET /reports/pdf-export/{job_id} 로 조회, 완료 후 /download 로 ZIP 수신
+    """
+    job = pdf_export.create_export_job(db, current_admin, test_id)
+    return pdf_export.job_status(job)
+
+# ✅ 일괄 PDF 내보내기 작업 상태 조회
+@router.get("/reports/pdf-export/{job_id}")
+def get_pdf_export_status(
+    job_id: str,
+    current_admin: InstitutionAdmin = Depends(get_school_admin_user),
+    db: Session = Depends(get_db)
+):
+    return pdf_export.job_status(pdf_export.get_export_job(db, current_admin, job_id))
 
-    return StreamingResponse(
-        buffer,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=school_reports.csv"}
-    )
+# ✅ 일괄 PDF 내보내기 결과 다운로드 (ZIP 스트리밍)
+@router.get("/reports/pdf-export/{job_id}/download")
+def download_pdf_export(
+    job_id: str,
+    current_admin: InstitutionAdmin = Depends(get_school_admin_user),
+    db: Session = Depends(get_db)
+):
+    return pdf_export.export_zip_response(pdf_export.get_export_job(db, current_admin, job_id))
 
 # ✅ 본교 vs 지역 vs 전체 평균 비교 API
 @router.get("/compare")
 def compare_school_statistics(
     test_id: str,
+    source: str = Query("live", description="live: 리포트 실시간 집계 / materialized: 그룹 통계 테이블 사용"),
     db: Session = Depends(get_db),
     current_admin: InstitutionAdmin = Depends(get_school_admin_user)
 ):
-    school_name = current_admin.institution_name
-
-    school_users = db.query(User).join(User.profile).filter(
-        User.profile.has(school=school_name)
-    ).all()
-    school_ids = [u.user_id for u in school_users]
+    """
+    본교 / 지역 / 전체 평균을 집계 쿼리 1회로 계산합니다 (사용자 목록을 메모리로 불러오지 않음).
+    """
+    if source not in ("live", "materialized"):
+        raise HTTPException(status_code=400, detail="source 는 live 또는 materialized 만 가능합니다.")
 
-    region = school_users[0].profile.region if school_users else None
-    region_users = db.query(User).join(User.profile).filter(
-        User.profile.has(region=region)
-    ).all() if region else []
-
-    all_users = db.query(User).all()
-
-    # ✅ 리포트 가져오기 함수: Report → TestReport
-    def get_scores(user_list):
-        uids = [u.user_id for u in user_list]
-        reports = db.query(TestReport).filter(
-            TestReport.test_id == test_id,
-            TestReport.user_id.in_(uids)
-        ).all()
-        return [r.score_total for r in reports]
-
-    school_scores = get_scores(school_users)
-    region_scores = get_scores(region_users)
-    all_scores = get_scores(all_users)
+    school_name = current_admin.institution_name
+    region = statistics.get_school_region(db, school_name)
 
-    def calc_stats(scores):
-        return {
-            "avg_score": round(sum(scores)/len(scores), 2) if scores else None,
-            "user_count": len(scores)
-        }
+    stats = statistics.compare_cohorts(
+        db,
+        test_id,
+        {
+            "school": (GroupTypeEnum.school.value, school_name),
+            "region": (GroupTypeEnum.region.value, region),
+            "all": (GroupTypeEnum.overall.value, "전체"),
+        },
+        materialized=(source == "materialized")
+    )
 
     return {
         "test_id": test_id,
-        "school": {"name": school_name, **calc_stats(school_scores)},
-        "region": {"name": region, **calc_stats(region_scores)},
-        "all": {"name": "전체", **calc_stats(all_scores)}
+        "school": {"name": school_name, **stats["school"]},
+        "region": {"name": region, **stats["region"]},
+        "all": {"name": "전체", **stats["all"]}
     }
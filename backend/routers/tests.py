@@ -1,19 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi.responses import Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from backend.database.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.database.database import get_db, get_async_db
 # ✅ Report → TestReport로 이름 변경하여 중복 오류 해결
 from backend.models.test import Test, Question, Option, TestReport
 from backend.models.test_analytics_by_group import TestAnalyticsByGroup, GroupTypeEnum
-from backend.models.question_stats_by_group import QuestionStatsByGroup
 from backend.models.sten_rule import STENRule  # ✅ STEN 등급 규칙 모델 import
 from backend.models.user import UserProfile, User  # ✅ 사용자 정보 및 프로필
 from backend.dependencies.admin_auth import get_current_user, get_current_admin_user  # ✅ 관리자 권한 확인 추가
-from typing import List
+from backend.services.scoring import get_answer_key, score_answers, bulk_insert_responses  # ✅ 일괄 채점 엔진
+from backend.services.exam_payload import get_exam_payload  # ✅ 응시자용 문항 페이로드 캐시
+from backend.crud.test import load_test_with_questions, sorted_options  # ✅ 검사 + 문항 + 선택지 일괄 조회 (쿼리 2회)
+from backend.core.cache import invalidate_test_caches, invalidate_test_catalog
+from backend.services.report_prerender import schedule_prerender  # ✅ 제출 직후 리포트 PDF 사전 렌더링
+from typing import List, Optional
 from pydantic import BaseModel
 from enum import Enum
 from datetime import datetime
 import uuid
-import json
 
 router = APIRouter()
 
@@ -92,14 +98,14 @@ def get_tests(db: Session = Depends(get_db)):
 # ✅ 단일 검사 상세 조회
 @router.get("/api/tests/{test_id}", response_model=TestDetail)
 def get_test_detail(test_id: str, db: Session = Depends(get_db)):
-    test = db.query(Test).filter(Test.test_id == test_id).first()
-    if not test:
+    loaded = load_test_with_questions(db, test_id, linked=False)
+    if not loaded:
         raise HTTPException(status_code=404, detail="Test not found")
+    test = loaded.test
 
-    questions = db.query(Question).filter(Question.test_id == test_id).order_by(Question.order_index).all()
     question_data = []
-    for q in questions:
-        options = db.query(Option).filter(Option.question_id == q.question_id).order_by(Option.option_order).all()
+    for q in loaded.questions:
+        options = sorted_options(q)
         question_data.append(QuestionSchema(
             question_id=q.question_id,
             question_text=q.question_text,
@@ -133,8 +139,8 @@ class StartResponse(BaseModel):
 
 # ✅ 검사 시작 API
 @router.post("/api/tests/{test_id}/start", response_model=StartResponse)
-def start_test(test_id: str, request: StartRequest, db: Session = Depends(get_db)):
-    test = db.query(Test).filter(Test.test_id == test_id).first()
+async def start_test(test_id: str, request: StartRequest, db: AsyncSession = Depends(get_async_db)):
+    test = await db.scalar(select(Test.test_id).where(Test.test_id == test_id))
     if not test:
         raise HTTPException(status_code=404, detail="Test not found")
     return StartResponse(message="Test session started.", started_at=datetime.utcnow())
@@ -155,91 +161,27 @@ class SubmitResponse(BaseModel):
 
 # ✅ 응답 제출 API 시작
 @router.post("/api/tests/{test_id}/submit", response_model=SubmitResponse)
-def submit_test(test_id: str, request: SubmitRequest, db: Session = Depends(get_db)):
-    test = db.query(Test).filter(Test.test_id == test_id).first()
+async def submit_test(test_id: str, request: SubmitRequest, db: AsyncSession = Depends(get_async_db)):
+    test = await db.scalar(select(Test).where(Test.test_id == test_id))
     if not test:
         raise HTTPException(status_code=404, detail="Test not found")
 
-    total_score = 0.0
-    now = datetime.utcnow()
-    year, month = now.year, now.month
-
-    profile = db.query(UserProfile).filter(UserProfile.email == request.email).first()
-    group_value = profile.school if profile else None
-
-    for item in request.responses:
-        question = db.query(Question).filter(
-            Question.question_id == item.question_id,
-            Question.test_id == test_id
-        ).first()
-
-        if not question:
-            continue
-
-        correct_option_ids = [
-            opt.option_id for opt in db.query(Option).filter(
-                Option.question_id == item.question_id,
-                Option.is_correct == True
-            ).all()
-        ]
-
-        is_correct = set(item.selected_option_ids) == set(correct_option_ids)
-        if is_correct:
-            total_score += 1
-
-        response = Response(
-            response_id=str(uuid.uuid4()),
-            email=request.email,
-            test_id=test_id,
-            question_id=item.question_id,
-            selected_option_ids=item.selected_option_ids,
-            response_time_sec=0.0
-        )
-        db.add(response)
-
-        if group_value:
-            stat = db.query(QuestionStatsByGroup).filter_by(
-                question_id=item.question_id,
-                group_type=GroupTypeEnum.school,
-                group_value=group_value,
-                year=year,
-                month=month
-            ).first()
-
-            if stat:
-                previous_n = stat.num_responses
-                stat.num_responses += 1
-                stat.correct_rate = ((stat.correct_rate * previous_n) + (1 if is_correct else 0)) / stat.num_responses
-                stat.avg_response_time = ((stat.avg_response_time * previous_n) + 0.0) / stat.num_responses
-
-                dist = json.loads(stat.option_distribution_json or '{}')
-                for opt_id in item.selected_option_ids:
-                    dist[opt_id] = dist.get(opt_id, 0) + 1
-                stat.option_distribution_json = json.dumps(dist)
-
-            else:
-                stat = QuestionStatsByGroup(
-                    question_id=item.question_id,
-                    group_type=GroupTypeEnum.school,
-                    group_value=group_value,
-                    year=year,
-                    month=month,
-                    num_responses=1,
-                    correct_rate=1.0 if is_correct else 0.0,
-                    avg_response_time=0.0,
-                    option_distribution_json=json.dumps({
-                        opt_id: 1 for opt_id in item.selected_option_ids
-                    })
-                )
-                db.add(stat)
+    group_value = await db.scalar(select(UserProfile.school).where(UserProfile.email == request.email).limit(1))
+
+    # ✅ 정답표(캐시) → 메모리 내 집합 비교 채점 → 응답 일괄 INSERT
+    # ✅ 문항별 그룹 통계(question_stats_by_group)는 stats_aggregator 가 응답을 모아 비동기 반영
+    # ✅ 동기 Session 기반 헬퍼는 run_sync 로 같은 비동기 커넥션/트랜잭션에서 실행
+    answer_key = await db.run_sync(get_answer_key, test_id)
+    total_score, scored = score_answers(answer_key, request.responses)
+    await db.run_sync(bulk_insert_responses, test_id, request.email, scored, group_value=group_value)
 
     score_standardized = total_score * 10
 
-    sten_rule = db.query(STENRule).filter(
+    sten_rule = await db.scalar(select(STENRule).where(
         STENRule.test_id == test_id,
         STENRule.min_score <= score_standardized,
         STENRule.max_score >= score_standardized
-    ).first()
+    ).limit(1))
 
     score_level = f"STEN {sten_rule.sten_level}" if sten_rule else "STEN N/A"
 
@@ -250,11 +192,15 @@ def submit_test(test_id: str, request: SubmitRequest, db: Session = Depends(get_
         score_total=total_score,
         score_standardized=score_standardized,
         score_level=score_level,
-        result_summary="임시 요약"
+        result_summary="임시 요약",
+        num_questions=len(answer_key.correct),
+        num_answered=len(scored)
     )
     db.add(report)
-    db.commit()
-    db.refresh(report)
+    await db.commit()
+
+    # ✅ 커밋 이후 PDF 사전 렌더링 예약 (검사별 토글, 대기열 가득 시 다운로드 시점 렌더링으로 대체)
+    schedule_prerender(test, report.report_id)
 
     return SubmitResponse(
         message="Responses submitted successfully.",
@@ -301,6 +247,7 @@ def create_test(
     db.add(new_test)
     db.commit()
     db.refresh(new_test)
+    invalidate_test_catalog()
 
     return CreateTestResponse(
         message="검사가 성공적으로 등록되었습니다.",
@@ -309,63 +256,27 @@ def create_test(
 
 # ✅ 사용자 전용 문항 조회 API
 @router.get("/api/tests/{test_id}/questions-public", response_model=TestDetail)
-def get_test_questions_for_user(test_id: str, db: Session = Depends(get_db)):
+async def get_test_questions_for_user(
+    test_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     ✅ 사용자(응시자)용 문항 조회 API
     - 관리자 인증 없이 누구나 접근 가능
     - test_question_links 기준으로 순서대로 문항 + 선택지 반환
+    - 사전 직렬화된 JSON 을 캐시에서 반환, If-None-Match 일치 시 304 응답
+    - 캐시 적중 시 DB 커넥션을 사용하지 않음 (미스일 때만 run_sync 로 조회)
     """
-    test = db.query(Test).filter(Test.test_id == test_id).first()
-    if not test:
+    payload = await db.run_sync(get_exam_payload, test_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Test not found")
 
-    # ✅ 연결된 문항 순서대로 불러오기
-    from backend.models.test_question_links import TestQuestionLink
-    links = (
-        db.query(TestQuestionLink)
-        .filter(TestQuestionLink.test_id == test_id)
-        .order_by(TestQuestionLink.order_index.asc())
-        .all()
-    )
-    question_ids = [link.question_id for link in links]
-
-    questions = (
-        db.query(Question)
-        .filter(Question.question_id.in_(question_ids))
-        .all()
-    )
-
-    question_map = {q.question_id: q for q in questions}
-
-    # ✅ 문항 + 선택지 구성
-    question_data = []
-    for order, qid in enumerate(question_ids):
-        q = question_map[qid]
-        options = db.query(Option).filter(
-            Option.question_id == q.question_id
-        ).order_by(Option.option_order.asc()).all()
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if if_none_match and payload.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
 
-        question_data.append(QuestionSchema(
-            question_id=q.question_id,
-            question_text=q.question_text,
-            question_type=q.question_type,
-            is_multiple_choice=q.is_multiple_choice,
-            order_index=order + 1,
-            options=[
-                OptionSchema(
-                    option_id=o.option_id,
-                    option_text=o.option_text,
-                    option_order=o.option_order
-                ) for o in options
-            ]
-        ))
-
-    return TestDetail(
-        test_id=test.test_id,
-        test_name=test.test_name,
-        duration_minutes=test.duration_minutes,
-        questions=question_data
-    )
+    return Response(content=payload.body, media_type="application/json", headers=headers)
 
 # ✅ 검사 삭제 API
 @router.delete("/api/tests/{test_id}")
@@ -392,5 +303,7 @@ def delete_test(
 
     db.delete(test)
     db.commit()
+    invalidate_test_caches([test_id])
+    invalidate_test_catalog()
 
     return {"message": "Test deleted successfully."}
@@ -1,20 +1,47 @@
-from fastapi import APIRouter, HTTPException, Depends, Body, Query
+from fastapi import APIRouter, HTTPException, Depends, Body, Query, Request
 from sqlalchemy.orm import Session
-from backend.schemas.user import UserCreate, UserResponse, UserLogin
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend.schemas.user import UserCreate, UserResponse, UserLogin, TokenRefreshRequest
 from backend.crud import user as crud_user
-from backend.database.database import SessionLocal, get_db
+from backend.crud import refresh_token as crud_refresh_token
+from backend.database.database import SessionLocal, get_db, get_async_db
 from backend.core import security, token
 from backend.models.user import User
-from backend.core.security import get_current_user
+from backend.core.security import get_current_user, get_current_user_async
+from backend.core.auth_cache import build_token_claims, invalidate_user_auth, get_cached_user
 from backend.models.user_deletion_log import UserDeletionLog
+from backend.core.config import settings
+from backend.core.rate_limit import TokenBucketLimiter
 from datetime import datetime
 from typing import Optional
 
 router = APIRouter()
 
+# ✅ 로그인 / 회원가입 요청 제한 (IP 별 + 계정별 토큰 버킷)
+login_ip_limiter = TokenBucketLimiter("login_ip", settings.LOGIN_RATE_PER_IP_BURST, settings.LOGIN_RATE_PER_IP_PER_SECOND)
+login_account_limiter = TokenBucketLimiter("login_account", settings.LOGIN_RATE_PER_ACCOUNT_BURST, settings.LOGIN_RATE_PER_ACCOUNT_PER_SECOND)
+signup_ip_limiter = TokenBucketLimiter("signup_ip", settings.SIGNUP_RATE_PER_IP_BURST, settings.SIGNUP_RATE_PER_IP_PER_SECOND)
+
+def _client_ip(request: Request) -> str:
+    """
+    요청 제한 키로 쓸 클라이언트 IP
+    - 직접 연결한 주소가 TRUSTED_PROXIES 에 있을 때만 X-Forwarded-For 사용 (그 외에는 위조 가능하므로 무시)
+    - X-Forwarded-For 는 오른쪽(가장 가까운 프록시가 추가한 값)부터 읽어 첫 번째 비신뢰 주소를 반환
+    """
+    peer = request.client.host if request.client else "unknown"
+    if peer not in settings.TRUSTED_PROXIES:
+        return peer
+
+    forwarded = [ip.strip() for ip in request.headers.get("x-forwarded-for", "").split(",") if ip.strip()]
+    for ip in reversed(forwarded):
+        if ip not in settings.TRUSTED_PROXIES:
+            return ip
+    return forwarded[0] if forwarded else peer
+
 # ✅ 회원가입 API
 @router.post("/api/signup", response_model=UserResponse)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+def signup(user_data: UserCreate, request: Request, db: Session = Depends(get_db)):
+    signup_ip_limiter.check(_client_ip(request))
 
     # ⛳ 디버깅 로그
     print("🟢 [DEBUG] user_data.dict():", user_data.dict())
@@ -26,11 +53,11 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     email = security.aes_encrypt(user_data.email)
     encrypted_phone = security.aes_encrypt(user_data.phone)
 
-    existing_user = crud_user.get_user_by_email(db, email)
+    existing_user = crud_user.get_user_by_email(db, user_data.email)
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already exists.")
 
-    existing_phone = crud_user.get_user_by_phone(db, encrypted_phone)
+    existing_phone = crud_user.get_user_by_phone(db, user_data.phone)
     if existing_phone:
         raise HTTPException(status_code=400, detail="Phone number already exists.")
 
@@ -41,18 +68,61 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     new_user = crud_user.create_user(db, user_data, email, encrypted_phone)
     return new_user
 
-# ✅ 로그인 API
+# ✅ 로그인 API (비동기: DB 조회 / bcrypt 대기 동안 스레드풀 스레드를 점유하지 않음)
 @router.post("/api/login")
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
-    email = security.aes_encrypt(user_data.email)
-    user = crud_user.get_user_by_email(db, email)
-    if not user or not security.verify_password(user_data.password, user.password):
+async def login(user_data: UserLogin, request: Request, db: AsyncSession = Depends(get_async_db)):
+    # ✅ bcrypt 이전에 요청 제한 → 폭주 시 CPU 를 쓰지 않고 429
+    login_ip_limiter.check(_client_ip(request))
+    login_account_limiter.check(user_data.email.lower())
+
+    user = await db.run_sync(crud_user.get_user_by_email, user_data.email)  # ✅ 블라인드 인덱스 조회
+    if not user:
+        await security.dummy_verify_password_async()
         raise HTTPException(status_code=401, detail="Invalid email or password")
+    if not await security.verify_password_async(user_data.password, user.password):
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+
+    # ✅ 작업 계수 변경 시 로그인 성공 시점에 해시 갱신
+    if security.password_needs_rehash(user.password):
+        user.password = await security.hash_password_async(user_data.password)
 
-    access_token = token.create_access_token(data={"sub": str(user.user_id)})
-    refresh_token = token.create_refresh_token(data={"sub": str(user.user_id)})
+    # ✅ 역할 / 활성 여부 / 기관 소속을 서명된 클레임으로 포함 → 요청마다 권한 조회 불필요
+    access_token = token.create_access_token(data=await db.run_sync(build_token_claims, user))
+    refresh_token, _ = await db.run_sync(crud_refresh_token.issue_refresh_token, user.user_id)
+    await db.commit()
     return {"access_token": access_token, "refresh_token": refresh_token}
 
+# ✅ 액세스 토큰 재발급 API (리프레시 토큰 회전)
+@router.post("/api/token/refresh")
+def refresh_access_token(request: TokenRefreshRequest, db: Session = Depends(get_db)):
+    """
+    리프레시 토큰으로 새 액세스 토큰 + 새 리프레시 토큰을 발급합니다.
+    - 비밀번호 검증(bcrypt) / 이메일 암호화 없이 토큰 검증 + 행 1건 잠금만 수행
+    - 사용된 리프레시 토큰은 즉시 폐기, 재사용 시 해당 로그인 체인 전체 폐기
+    """
+    rotated = crud_refresh_token.rotate_refresh_token(db, request.refresh_token)
+    if rotated is None:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    user_id, refresh_token = rotated
+
+    user = get_cached_user(db, user_id)
+    if not user or not user.is_active:
+        db.rollback()
+        raise HTTPException(status_code=401, detail="Inactive user")
+
+    access_token = token.create_access_token(data=build_token_claims(db, user))
+    db.commit()
+    return {"access_token": access_token, "refresh_token": refresh_token}
+
+# ✅ 리프레시 토큰 폐기 API (로그아웃)
+@router.post("/api/token/revoke")
+def revoke_refresh_token(request: TokenRefreshRequest, db: Session = Depends(get_db)):
+    payload = token.decode_token(request.refresh_token)
+    if payload and payload.get("type") == "refresh" and payload.get("fam"):
+        crud_refresh_token.revoke_family(db, payload["fam"])
+        db.commit()
+    return {"message": "Logged out."}
+
 # ✅ 회원 탈퇴 API
 @router.delete("/api/user/withdraw")
 def withdraw_user(
@@ -65,9 +135,11 @@ def withdraw_user(
         reason=reason,
         deleted_at=datetime.utcnow(),
     )
+    user_id = current_user.user_id
     db.add(log)
     db.delete(current_user)
     db.commit()
+    invalidate_user_auth(user_id)
     return {"message": "User successfully deleted."}
 
 # ✅ 이메일 중복 확인 API
@@ -77,10 +149,9 @@ def check_email_duplicate(
     db: Session = Depends(get_db)
 ):
     """
-    사용자가 입력한 이메일이 DB에 존재하는지 암호화된 상태로 확인합니다.
+    사용자가 입력한 이메일이 DB에 존재하는지 블라인드 인덱스(HMAC)로 확인합니다.
     반환 형식: { "available": true } 또는 { "available": false }
     """
-    email = security.aes_encrypt(email)
     user = crud_user.get_user_by_email(db, email)
     return {"available": user is None}
 
@@ -105,21 +176,21 @@ def check_phone_duplicate(
 ):
     """
     전화번호 중복 여부 확인 API
-    - 전화번호는 암호화된 상태로 비교
+    - 전화번호는 블라인드 인덱스(HMAC)로 비교
     - 반환 예: { "available": true } 또는 { "available": false }
     """
-    encrypted_phone = security.aes_encrypt(phone)
-    user = crud_user.get_user_by_phone(db, encrypted_phone)
+    user = crud_user.get_user_by_phone(db, phone)
     return {"available": user is None}
 
 # ✅ 현재 로그인된 사용자 정보 반환 API (role 포함으로 수정됨)
 @router.get("/api/me")
-def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user_async)):
     """
     ✅ JWT 토큰을 기반으로 현재 로그인한 사용자의 정보를 반환하는 API입니다.
     - 요청 예: GET /api/me
     - 응답: user_id, nickname, is_active 등 포함
     - 📌 관리자 권한 판단을 위해 role 추가됨
+    - 응시 화면마다 호출되므로 비동기 세션 사용 (스레드풀 미점유)
     """
     return {
         "user_id": current_user.user_id,
@@ -141,7 +212,9 @@ def withdraw_user_post(
         reason=reason,
         deleted_at=datetime.utcnow(),
     )
+    user_id = current_user.user_id
     db.add(log)
     db.delete(current_user)
     db.commit()
+    invalidate_user_auth(user_id)
     return {"message": "User successfully deleted (via POST)."}
\ No newline at end of file
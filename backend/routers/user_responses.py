@@ -9,7 +9,7 @@ from backend.schemas.response import ResponseSubmit, ReportResult  # ✅ 수정
 # ✅ Report → UserTestHistory로 클래스명 변경
 from backend.models.response import UserTestHistory  # ✅ 결과 리포트 저장용 모델
 from backend.models.test import Test
-from backend.models.option import Option
+from backend.services.scoring import get_answer_key  # ✅ 정답표 캐시
 from backend.models.norm_group import NormGroup  # ✅ 규준 그룹 정보
 from backend.models.report_rule import ReportRule  # ✅ STEN 해석 문구
 from datetime import datetime
@@ -27,15 +27,13 @@ def submit_response(payload: ResponseSubmit, db: Session = Depends(get_db)):
     if total_questions == 0:
         raise HTTPException(status_code=400, detail="문항 응답이 없습니다.")
 
+    # ✅ 캐시된 정답표로 채점 (피크 시간에도 정답 조회용 DB 쿼리 없음)
+    answer_key = get_answer_key(db, str(payload.test_id))
+
     correct_count = 0
 
     for answer in payload.answers:
-        correct_options = db.query(Option).filter(
-            Option.question_id == answer.question_id,
-            Option.is_correct == True
-        ).all()
-
-        correct_ids = {str(opt.option_id) for opt in correct_options}
+        correct_ids = answer_key.correct.get(str(answer.question_id), frozenset())
         selected_ids = {str(opt_id) for opt_id in answer.selected_option_ids}
 
         if correct_ids == selected_ids:
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+# 🔸 행별 오류 (row: CSV/XLSX 는 시트 행 번호, JSON 은 항목 순서)
+class QuestionImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+# 🔸 문항 일괄 가져오기 응답 스키마
+class QuestionImportResponse(BaseModel):
+    dry_run: bool
+    format: str
+    total_rows: int
+    valid_rows: int
+    inserted: int
+    error_count: int
+    errors: List[QuestionImportRowError] = []
+    elapsed_seconds: float
+    items_per_second: Optional[float] = None
+    truncated: bool = False  # ✅ MAX_ROWS 초과로 중간에 멈춘 경우 (total_rows 까지만 처리됨)
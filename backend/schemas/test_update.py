@@ -10,6 +10,7 @@ class TestUpdateRequest(BaseModel):
     duration_minutes: Optional[int] = None      # 소요 시간
     scoring_rule_id: Optional[UUID] = None      # 채점 기준 연결
     norm_group_id: Optional[UUID] = None        # 규준 연결
+    prerender_reports: Optional[bool] = None    # 제출 직후 리포트 PDF 사전 렌더링
 
 # 🔸 검사 수정 응답 스키마
 class TestUpdateResponse(BaseModel):
@@ -15,6 +15,10 @@ class UserLogin(BaseModel):
     email: EmailStr
     password: str
 
+# ✅ 토큰 재발급 / 폐기 요청용
+class TokenRefreshRequest(BaseModel):
+    refresh_token: str
+
 # ✅ 사용자 응답용 (기본 정보)
 class UserResponse(BaseModel):
     user_id: str
@@ -0,0 +1,328 @@
+# backend/services/analytics_materializer.py
+
+from collections import Counter
+from typing import Dict, List, Tuple
+from sqlalchemy import update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+import json
+import math
+import re
+import uuid
+
+from backend.core.config import settings
+from backend.database.database import SessionLocal
+from backend.models.test import TestReport
+from backend.models.user import UserProfile
+from backend.models.test_analytics_by_group import TestAnalyticsByGroup, GroupTypeEnum
+from backend.models.report_sten_distribution import ReportSTENDistribution
+from backend.crud.aggregation_watermark import lock_watermark, advance_watermark
+from backend.services.background import PeriodicJob
+
+JOB_NAME = "test_analytics"
+
+# ✅ 전체 응시자 그룹 값
+OVERALL_GROUP_VALUE = "전체"
+
+# ✅ 점수 히스토그램 구간 폭 (score_standardized 기준)
+HISTOGRAM_BIN_WIDTH = 10
+
+_STEN_PATTERN = re.compile(r"STEN\s*(\d+)")
+
+
+# ✅ Welford 방식 스트리밍 평균/분산 누적기
+class Welford:
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other: "Welford") -> None:
+        """
+        두 누적기를 병합합니다 (Chan 병렬 알고리즘).
+        """
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
+# ✅ (검사, 그룹 유형, 그룹 값, 연, 월) 단위 누적값
+class _Bucket:
+    __slots__ = ("scores", "num_completed", "sum_correct", "sum_questions", "histogram", "sten")
+
+    def __init__(self):
+        self.scores = Welford()
+        self.num_completed = 0
+        self.sum_correct = 0.0
+        self.sum_questions = 0
+        self.histogram = Counter()
+        self.sten = Counter()
+
+
+def _histogram_label(score: float) -> str:
+    low = int(score // HISTOGRAM_BIN_WIDTH) * HISTOGRAM_BIN_WIDTH
+    return f"{low}-{low + HISTOGRAM_BIN_WIDTH}"
+
+
+def _parse_sten(score_level: str):
+    match = _STEN_PATTERN.search(score_level or "")
+    if not match:
+        return None
+    level = int(match.group(1))
+    return level if 1 <= level <= 10 else None
+
+
+# ✅ 리포트가 속하는 그룹 목록 (전체 + 학교/지역/기업)
+def _groups_for(row) -> List[Tuple[str, str]]:
+    groups = [(GroupTypeEnum.overall.value, OVERALL_GROUP_VALUE)]
+    if row.school:
+        groups.append((GroupTypeEnum.school.value, row.school))
+    if row.region:
+        groups.append((GroupTypeEnum.region.value, row.region))
+    if row.current_company:
+        groups.append((GroupTypeEnum.company.value, row.current_company))
+    return groups
+
+
+# ✅ 미반영 리포트를 한 배치 읽어 그룹 통계 테이블 2종에 반영
+def materialize_pending_reports(db: Session, batch_size: int = None) -> int:
+    """
+    아직 반영되지 않은(analytics_applied = 0) test_reports 를 읽어 test_analytics_by_group / report_sten_distribution 을 갱신합니다.
+    - 평균/표준편차: 저장된 (n, mean, M2) 와 배치 누적기를 Welford 병합
+    - 완료율, 정답률, 점수 히스토그램, STEN 1~10 카운터를 그룹·월 단위로 누적
+    - 행별 반영 표시 → 늦게 커밋된 리포트 / 서버 간 시계 차이에도 누락 없음
+    - 통계 반영과 analytics_applied 표시를 한 트랜잭션으로 커밋 → 재시작/재실행해도 중복 반영 없음
+    - 반환: 이번 배치에서 읽은 리포트 수
+    """
+    batch_size = batch_size or settings.ANALYTICS_MATERIALIZER_BATCH_SIZE
+    watermark = lock_watermark(db, JOB_NAME)
+
+    query = (
+        db.query(
+            TestReport.report_id,
+            TestReport.test_id,
+            TestReport.score_total,
+            TestReport.score_level,
+            TestReport.score_standardized,
+            TestReport.num_questions,
+            TestReport.num_answered,
+            TestReport.report_generated_at,
+            UserProfile.school,
+            UserProfile.region,
+            UserProfile.current_company,
+        )
+        .outerjoin(UserProfile, UserProfile.email == TestReport.email)
+        .filter(TestReport.analytics_applied == False)
+    )
+
+    rows = query.order_by(TestReport.report_generated_at, TestReport.report_id).limit(batch_size).all()
+    if not rows:
+        db.rollback()  # 워터마크 잠금 해제
+        return 0
+
+    # ✅ 1. 메모리 내에서 그룹·월 단위로 합산
+    buckets: Dict[Tuple[str, str, str, int, int], _Bucket] = {}
+    for row in rows:
+        if row.test_id is None or row.score_total is None:
+            continue
+        generated_at = row.report_generated_at
+        sten = _parse_sten(row.score_level)
+
+        for group_type, group_value in _groups_for(row):
+            key = (row.test_id, group_type, group_value, generated_at.year, generated_at.month)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+
+            bucket.scores.add(row.score_total)
+            bucket.sum_correct += row.score_total
+            bucket.sum_questions += row.num_questions or 0
+            if row.num_questions and (row.num_answered or 0) >= row.num_questions:
+                bucket.num_completed += 1
+            bucket.histogram[_histogram_label(row.score_standardized or 0.0)] += 1
+            if sten:
+                bucket.sten[sten] += 1
+
+    if buckets:
+        _upsert_test_analytics(db, buckets)
+        _upsert_sten_distribution(db, buckets)
+
+    db.execute(
+        update(TestReport)
+        .where(TestReport.report_id.in_([row.report_id for row in rows]))
+        .values(analytics_applied=True)
+    )
+    last = rows[-1]
+    advance_watermark(watermark, last.report_generated_at, last.report_id)
+    db.commit()
+    return len(rows)
+
+
+def _lock_existing(db: Session, model, buckets) -> Dict[tuple, object]:
+    existing = (
+        db.query(model)
+        .filter(
+            model.test_id.in_({k[0] for k in buckets}),
+            model.group_type.in_({k[1] for k in buckets}),
+            model.group_value.in_({k[2] for k in buckets}),
+            model.year.in_({k[3] for k in buckets}),
+            model.month.in_({k[4] for k in buckets}),
+        )
+        .with_for_update()
+        .all()
+    )
+    return {
+        (r.test_id, getattr(r.group_type, "value", r.group_type), r.group_value, r.year, r.month): r
+        for r in existing
+    }
+
+
+# ✅ test_analytics_by_group 병합 + 다중 행 UPSERT
+def _upsert_test_analytics(db: Session, buckets) -> None:
+    stat_map = _lock_existing(db, TestAnalyticsByGroup, buckets)
+
+    values = []
+    for key, bucket in buckets.items():
+        stat = stat_map.get(key)
+        scores = Welford()
+        num_completed, sum_correct, sum_questions = 0, 0.0, 0
+        histogram = Counter()
+        if stat:
+            scores = Welford(stat.num_participants or 0, stat.avg_total_score or 0.0, stat.score_m2 or 0.0)
+            num_completed = stat.num_completed or 0
+            sum_correct = stat.sum_correct or 0.0
+            sum_questions = stat.sum_questions or 0
+            histogram = Counter(json.loads(stat.score_distribution_json or "{}"))
+
+        scores.merge(bucket.scores)
+        num_completed += bucket.num_completed
+        sum_correct += bucket.sum_correct
+        sum_questions += bucket.sum_questions
+        histogram.update(bucket.histogram)
+
+        values.append({
+            "id": stat.id if stat else str(uuid.uuid4()),
+            "test_id": key[0],
+            "group_type": GroupTypeEnum(key[1]),
+            "group_value": key[2],
+            "year": key[3],
+            "month": key[4],
+            "num_participants": scores.n,
+            "avg_total_score": scores.mean,
+            "std_total_score": scores.std,
+            "score_m2": scores.m2,
+            "num_completed": num_completed,
+            "completion_rate": num_completed / scores.n if scores.n else None,
+            "sum_correct": sum_correct,
+            "sum_questions": sum_questions,
+            "overall_correct_rate": sum_correct / sum_questions if sum_questions else None,
+            "score_distribution_json": json.dumps(dict(histogram), ensure_ascii=False),
+        })
+
+    stmt = mysql_insert(TestAnalyticsByGroup.__table__).values(values)
+    stmt = stmt.on_duplicate_key_update({
+        column: stmt.inserted[column]
+        for column in values[0].keys()
+        if column not in ("id", "test_id", "group_type", "group_value", "year", "month")
+    })
+    db.execute(stmt)
+
+
+# ✅ report_sten_distribution 병합 + 다중 행 UPSERT
+def _upsert_sten_distribution(db: Session, buckets) -> None:
+    stat_map = _lock_existing(db, ReportSTENDistribution, buckets)
+    sten_columns = [f"sten_{level}" for level in range(1, 11)]
+
+    values = []
+    for key, bucket in buckets.items():
+        stat = stat_map.get(key)
+        row = {
+            "id": stat.id if stat else str(uuid.uuid4()),
+            "test_id": key[0],
+            "group_type": key[1],
+            "group_value": key[2],
+            "year": key[3],
+            "month": key[4],
+        }
+        for level, column in enumerate(sten_columns, start=1):
+            row[column] = ((getattr(stat, column) or 0) if stat else 0) + bucket.sten.get(level, 0)
+        values.append(row)
+
+    stmt = mysql_insert(ReportSTENDistribution.__table__).values(values)
+    stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in sten_columns})
+    db.execute(stmt)
+
+
+# ✅ 전체 재집계 준비 (집계 테이블 비우고 모든 리포트를 미반영으로 표시)
+def rebuild(db: Session) -> None:
+    """
+    워터마크 행 잠금을 잡은 채 삭제 + 표시 초기화를 한 트랜잭션으로 커밋합니다.
+    - 실행 중인 증분 집계와 섞여 중복 반영되지 않음
+    """
+    watermark = lock_watermark(db, JOB_NAME)
+    db.query(TestAnalyticsByGroup).delete(synchronize_session=False)
+    db.query(ReportSTENDistribution).delete(synchronize_session=False)
+    db.execute(update(TestReport).values(analytics_applied=False))
+    advance_watermark(watermark, None, None)
+    db.commit()
+
+
+# ✅ 백그라운드 스레드에서 1회 실행 (세션 생성/정리 포함)
+def run_once() -> int:
+    db = SessionLocal()
+    try:
+        return materialize_pending_reports(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# ✅ 앱 시작 시 main.py 에서 start() 호출
+materializer_job = PeriodicJob(
+    name="test-analytics-materializer",
+    run_once=run_once,
+    interval_seconds=settings.ANALYTICS_MATERIALIZER_INTERVAL_SECONDS,
+)
+
+
+# ✅ 단독 실행: python -m backend.services.analytics_materializer [--rebuild]
+if __name__ == "__main__":
+    import sys
+
+    if "--rebuild" in sys.argv:
+        session = SessionLocal()
+        try:
+            rebuild(session)
+        finally:
+            session.close()
+        print("🧹 Materialized tables cleared, watermark reset.")
+
+    total = 0
+    while True:
+        processed = run_once()
+        if not processed:
+            break
+        total += processed
+        print(f"⏳ {total} reports materialized...")
+    print(f"✅ Materialization finished: {total} reports.")
@@ -0,0 +1,67 @@
+# backend/services/background.py
+
+import threading
+import traceback
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+
+# ✅ 주기 실행 백그라운드 작업 (데몬 스레드)
+class PeriodicJob:
+    """
+    run_once() 를 interval 초마다 실행하는 데몬 스레드입니다.
+    - run_once 가 처리 건수를 반환하고, 처리 건수가 있으면 쉬지 않고 바로 다음 배치 실행
+    - 예외는 로그만 남기고 다음 주기에 재시도
+    - 여러 uvicorn 워커에서 동시에 돌아도 되도록, 작업 자체가 DB 잠금으로 직렬화되어야 함
+    """
+
+    def __init__(self, name: str, run_once: Callable[[], int], interval_seconds: float):
+        self.name = name
+        self.run_once = run_once
+        self.interval_seconds = interval_seconds
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.runs = 0
+        self.processed = 0
+        self.errors = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            processed = 0
+            try:
+                processed = self.run_once() or 0
+                self.processed += processed
+            except Exception:
+                self.errors += 1
+                self.last_error = traceback.format_exc(limit=3)
+                print(f"❌ [{self.name}] 백그라운드 작업 실패:\n{self.last_error}")
+            self.runs += 1
+            self.last_run_at = datetime.utcnow()
+
+            if not processed:
+                self._stop_event.wait(self.interval_seconds)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "runs": self.runs,
+            "processed": self.processed,
+            "errors": self.errors,
+            "last_run_at": self.last_run_at,
+            "last_error": self.last_error,
+        }
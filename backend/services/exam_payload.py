@@ -0,0 +1,71 @@
+# backend/services/exam_payload.py
+
+from typing import NamedTuple, Optional
+from sqlalchemy.orm import Session
+import hashlib
+import json
+
+from backend.core.cache import VersionedCache
+from backend.core.config import settings
+from backend.crud.test import load_test_with_questions, sorted_options
+
+
+# ✅ 사전 직렬화된 응시자용 문항 페이로드
+class ExamPayload(NamedTuple):
+    body: bytes     # JSON 응답 본문 (1회 직렬화)
+    etag: str       # 본문 해시 기반 ETag (따옴표 포함)
+
+
+# ✅ 검사 + 연결 문항 + 선택지 조회 후 JSON 바이트로 직렬화
+def build_exam_payload(db: Session, test_id: str) -> Optional[ExamPayload]:
+    """
+    응시자용 문항 페이로드를 생성합니다.
+    - load_test_with_questions: 검사 ↔ test_question_links ↔ questions 조인 1회 + options selectinload 1회
+    - order_index 는 연결 순서 기준 1부터 부여 (기존 questions-public 응답과 동일)
+    - 존재하지 않는 검사면 None 반환
+    """
+    loaded = load_test_with_questions(db, test_id)
+    if not loaded:
+        return None
+    test, questions = loaded
+
+    payload = {
+        "test_id": test.test_id,
+        "test_name": test.test_name,
+        "duration_minutes": test.duration_minutes,
+        "questions": [
+            {
+                "question_id": q.question_id,
+                "question_text": q.question_text,
+                "question_type": q.question_type,
+                "is_multiple_choice": bool(q.is_multiple_choice),
+                "order_index": order + 1,
+                "options": [
+                    {
+                        "option_id": o.option_id,
+                        "option_text": o.option_text,
+                        "option_order": o.option_order
+                    }
+                    for o in sorted_options(q)
+                ]
+            }
+            for order, q in enumerate(questions)
+        ]
+    }
+
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return ExamPayload(body=body, etag=etag)
+
+
+# ✅ 응시자용 문항 페이로드 캐시 (test_id 단위)
+# ✅ 다른 워커의 검사/문항 수정은 TTL 안에 반영 (ETag 도 함께 바뀜)
+exam_payload_cache = VersionedCache("exam_payload", scope="test", ttl_seconds=settings.TEST_CACHE_TTL_SECONDS)
+
+
+def get_exam_payload(db: Session, test_id: str) -> Optional[ExamPayload]:
+    """
+    캐시된 페이로드를 반환합니다. 검사 구성 변경 시 invalidate_test_caches() 로 무효화됩니다.
+    """
+    test_id = str(test_id)
+    return exam_payload_cache.get(test_id, lambda version: build_exam_payload(db, test_id))
@@ -0,0 +1,361 @@
+# backend/services/export.py
+
+from datetime import date, datetime, time
+from typing import Iterator, List, NamedTuple, Optional
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+from io import StringIO
+from urllib.parse import quote
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+import csv
+import zlib
+
+from backend.core.cache import VersionedCache
+from backend.core.config import settings
+from backend.database.database import SessionLocal
+from backend.models.test import Test, TestReport
+from backend.models.user import User, UserProfile
+
+# ✅ 서버 측 커서로 한 번에 가져올 행 수 / 출력 청크당 사용자 수
+YIELD_PER = 1000
+CHUNK_USERS = 500
+
+USER_COLUMNS = ["user_id", "nickname", "is_active", "created_at"]
+
+# ✅ 지원 출력 형식: (media_type, 파일 확장자)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "csv.gz": ("application/gzip", "csv.gz"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+# ✅ 검사별 열 구성 (test_id 순서 + 열 이름 접두사)
+class TestColumns(NamedTuple):
+    test_ids: List[str]
+    prefixes: List[str]
+
+
+# ✅ 검사 목록 캐시 (검사 생성/수정/삭제 시 invalidate_test_catalog() 로 무효화, 다른 워커의 변경은 TTL 안에 반영)
+test_columns_cache = VersionedCache("export_test_columns", scope="catalog", ttl_seconds=settings.TEST_CACHE_TTL_SECONDS)
+
+
+# ✅ 내보내기 계획 (요청 시점에 검증 완료된 헤더/필터)
+class ExportPlan(NamedTuple):
+    header: List[str]                  # 전체 열 이름 (사용자 열 + 검사별 score/date 열)
+    selected: List[int]                # 출력할 열 인덱스
+    test_ids: List[str]                # 검사별 열 순서
+    school: Optional[str]
+    company: Optional[str]
+    active_only: bool
+    date_from: Optional[datetime]
+    date_to: Optional[datetime]
+
+    @property
+    def columns(self) -> List[str]:
+        return [self.header[i] for i in self.selected]
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# ✅ 검사별 열 이름 생성 (동일 검사명은 버전으로 구분)
+def _test_column_prefixes(tests) -> List[str]:
+    names = [t.test_name for t in tests]
+    prefixes = []
+    for t in tests:
+        prefix = t.test_name
+        if names.count(t.test_name) > 1:
+            prefix = f"{t.test_name}({t.version})"
+            if [f"{x.test_name}({x.version})" for x in tests].count(prefix) > 1:
+                prefix = f"{t.test_name}({t.test_id[:8]})"
+        prefixes.append(prefix)
+    return prefixes
+
+
+def _load_test_columns(db: Session) -> TestColumns:
+    tests = db.query(Test.test_id, Test.test_name, Test.version).order_by(Test.test_name, Test.version).all()
+    return TestColumns(
+        test_ids=[t.test_id for t in tests],
+        prefixes=_test_column_prefixes(tests),
+    )
+
+
+# ✅ 캐시된 검사별 열 구성 조회 (내보내기마다 tests 전체 조회 방지)
+def get_test_columns(db: Session) -> TestColumns:
+    return test_columns_cache.get("all", lambda version: _load_test_columns(db))
+
+
+# ✅ 내보내기 계획 수립 (열 검증 포함, 잘못된 열 이름은 ValueError)
+def build_export_plan(
+    db: Session,
+    school: Optional[str] = None,
+    company: Optional[str] = None,
+    active_only: bool = False,
+    columns: Optional[List[str]] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> ExportPlan:
+    """
+    - school / company: 코호트 필터 (user_profiles.school / current_company)
+    - columns: 출력 열 선택 (사용자 열 이름, "{검사명}_score" 등, 또는 검사명만 주면 해당 검사의 score/date 모두)
+    - date_from / date_to: 리포트 생성일 범위 (해당 기간 리포트만 피벗, 사용자 행은 유지)
+    """
+    test_columns = get_test_columns(db)
+    prefixes = test_columns.prefixes
+
+    header = list(USER_COLUMNS)
+    for prefix in prefixes:
+        header += [f"{prefix}_score", f"{prefix}_date"]
+
+    if columns:
+        index = {name: i for i, name in enumerate(header)}
+        selected = []
+        for name in columns:
+            if name in index:
+                selected.append(index[name])
+            elif name in prefixes:
+                selected += [index[f"{name}_score"], index[f"{name}_date"]]
+            else:
+                raise ValueError(f"알 수 없는 열 이름입니다: {name}")
+        selected = sorted(set(selected))
+    else:
+        selected = list(range(len(header)))
+
+    return ExportPlan(
+        header=header,
+        selected=selected,
+        test_ids=test_columns.test_ids,
+        school=school,
+        company=company,
+        active_only=active_only,
+        date_from=datetime.combine(date_from, time.min) if date_from else None,
+        date_to=datetime.combine(date_to, time.max) if date_to else None,
+    )
+
+
+# ✅ 사용자 단위 와이드 행 생성기 (단일 패스 피벗)
+def iter_user_report_rows(db: Session, plan: ExportPlan) -> Iterator[list]:
+    """
+    users ⟕ user_profiles ⟕ test_reports 를 user_id 순으로 yield_per 스트리밍하며
+    연속된 행을 사용자 단위로 접어 [사용자 열..., 검사별 score, date...] 한 행씩 반환합니다.
+    - 리포트 ↔ 사용자 매칭은 DB 조인으로 처리 → 사용자 수 × 리포트 수 비교 없이 O(행 수)
+    - 리포트는 user_profiles.email 기준으로 연결 (submit_test 가 email 만 기록하므로)
+    - 같은 검사를 여러 번 본 경우 기간 내 가장 최근 결과 사용 (report_generated_at 비교)
+    - user_id 로만 정렬 → 리포트 정렬용 filesort 없이 users PK 순서 + ix_test_reports_email 조회
+    """
+    report_join = TestReport.email == UserProfile.email
+    if plan.date_from:
+        report_join = and_(report_join, TestReport.report_generated_at >= plan.date_from)
+    if plan.date_to:
+        report_join = and_(report_join, TestReport.report_generated_at <= plan.date_to)
+
+    query = (
+        db.query(
+            User.user_id,
+            User.nickname,
+            User.is_active,
+            User.created_at,
+            TestReport.test_id,
+            TestReport.score_total,
+            TestReport.report_generated_at,
+        )
+        .outerjoin(UserProfile, UserProfile.user_id == User.user_id)
+        .outerjoin(TestReport, report_join)
+    )
+    if plan.school:
+        query = query.filter(UserProfile.school == plan.school)
+    if plan.company:
+        query = query.filter(UserProfile.current_company == plan.company)
+    if plan.active_only:
+        query = query.filter(User.is_active == True)
+
+    rows = query.order_by(User.user_id).yield_per(YIELD_PER)
+
+    current = None
+    scores = {}
+    for row in rows:
+        if current is None or row.user_id != current.user_id:
+            if current is not None:
+                yield _wide_row(current, scores, plan)
+            current = row
+            scores = {}
+        if row.test_id is None:
+            continue
+        latest = scores.get(row.test_id)
+        if latest is None or _is_newer(row.report_generated_at, latest[1]):
+            scores[row.test_id] = (row.score_total, row.report_generated_at)
+
+    if current is not None:
+        yield _wide_row(current, scores, plan)
+
+
+def _is_newer(generated_at, latest_at) -> bool:
+    if generated_at is None:
+        return False
+    return latest_at is None or generated_at > latest_at
+
+
+def _wide_row(user, scores, plan: ExportPlan) -> list:
+    line = [user.user_id, user.nickname, user.is_active, user.created_at]
+    for test_id in plan.test_ids:
+        score, generated_at = scores.get(test_id, (None, None))
+        line += [score, generated_at.strftime("%Y-%m-%d") if generated_at else None]
+    if len(plan.selected) == len(line):
+        return line
+    return [line[i] for i in plan.selected]
+
+
+# ✅ CSV 청크 생성기
+def _iter_csv(plan: ExportPlan, rows: Iterator[list]) -> Iterator[bytes]:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(plan.columns)
+
+    pending = 0
+    for line in rows:
+        writer.writerow(["" if value is None else value for value in line])
+        pending += 1
+        if pending >= CHUNK_USERS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+# ✅ gzip 스트리밍 압축 (청크 단위 zlib, gzip 헤더 포함)
+def _iter_gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# ✅ 스트리밍 출력용 싱크 (쓰인 바이트를 모아두었다가 row group / 파일 단위로 내보냄, Parquet·ZIP 공용)
+class DrainableSink:
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+# ✅ Parquet 스트리밍 (CHUNK_USERS 행 단위 row group)
+def _iter_parquet(plan: ExportPlan, rows: Iterator[list]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def column_type(name: str):
+        if name == "is_active":
+            return pa.bool_()
+        if name == "created_at":
+            return pa.timestamp("us")
+        if name.endswith("_score"):
+            return pa.float64()
+        return pa.string()
+
+    schema = pa.schema([(name, column_type(name)) for name in plan.columns])
+    sink = DrainableSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    def write_batch(batch):
+        columns = list(zip(*batch)) if batch else [[] for _ in plan.columns]
+        writer.write_table(pa.Table.from_arrays(
+            [pa.array(list(values), type=field.type) for values, field in zip(columns, schema)],
+            schema=schema
+        ))
+
+    batch = []
+    for line in rows:
+        batch.append(line)
+        if len(batch) >= CHUNK_USERS:
+            write_batch(batch)
+            batch = []
+            yield sink.drain()
+    if batch:
+        write_batch(batch)
+    writer.close()
+    yield sink.drain()
+
+
+# ✅ 형식별 스트리밍 본문 생성 (세션은 생성기 안에서 직접 관리)
+def stream_export(plan: ExportPlan, fmt: str = "csv") -> Iterator[bytes]:
+    """
+    StreamingResponse 본문 전송 중에는 요청 세션이 이미 닫혀 있으므로, 생성기 안에서 세션을 직접 열고 닫습니다.
+    메모리 사용량은 사용자 수와 무관하게 청크 크기로 고정됩니다.
+    """
+    db: Session = SessionLocal()
+    try:
+        rows = iter_user_report_rows(db, plan)
+        if fmt == "parquet":
+            yield from _iter_parquet(plan, rows)
+        elif fmt == "csv.gz":
+            yield from _iter_gzip(_iter_csv(plan, rows))
+        else:
+            yield from _iter_csv(plan, rows)
+    finally:
+        db.close()
+
+
+# ✅ 라우터 공용: 쿼리 파라미터 검증 → StreamingResponse 생성
+def export_response(
+    db: Session,
+    filename: str,
+    fmt: str = "csv",
+    columns: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    **cohort,
+) -> StreamingResponse:
+    """
+    - fmt: csv / csv.gz / parquet
+    - columns: 쉼표로 구분된 열 이름 목록
+    - filename: 확장자 제외 파일명 (한글 가능, RFC 5987 형식으로 전달)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {fmt}")
+    if fmt == "parquet" and not parquet_available():
+        raise HTTPException(status_code=400, detail="pyarrow 라이브러리가 서버에 설치되어 있지 않습니다.")
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from 은 date_to 보다 이후일 수 없습니다.")
+
+    selected = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    try:
+        plan = build_export_plan(db, columns=selected, date_from=date_from, date_to=date_to, **cohort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension = EXPORT_FORMATS[fmt]
+    return StreamingResponse(
+        stream_export(plan, fmt),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(f'{filename}.{extension}')}"}
+    )
@@ -0,0 +1,286 @@
+# backend/services/pdf_export.py
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import quote
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+import re
+import zipfile
+
+from backend.core.config import settings
+from backend.database.database import SessionLocal
+from backend.models.test import Test, TestReport
+from backend.models.user import User, UserProfile
+from backend.models.institution_admin import InstitutionAdmin
+from backend.models.pdf_export_job import PdfExportJob, PdfExportStatusEnum
+from backend.services.background import PeriodicJob
+from backend.services.export import DrainableSink
+from backend.services.pdf_renderer import pdf_renderer
+from backend.services.pdf_store import pdf_store
+
+# ✅ 기관 관리자용 리포트 템플릿 (admin_pdf 단건 다운로드와 동일 → 같은 캐시 키 공유)
+ADMIN_REPORT_TEMPLATE = "report_template.html"
+
+# ✅ 응시자용 리포트 템플릿 (reports 다운로드 / 제출 시 사전 렌더링 공용)
+USER_REPORT_TEMPLATE = "report_pdf.html"
+
+# ✅ 한 번에 렌더링할 리포트 수 (청크마다 진행 위치 커밋)
+CHUNK_SIZE = 50
+
+# ✅ 연속 실패 허용 횟수 (초과 시 failed 처리)
+MAX_FAILED_ATTEMPTS = 3
+
+# ✅ 작업 점유 유지 시간 (렌더링 중에는 행 잠금 없이 updated_at 으로 점유, 워커 종료 시 이 시간 후 다른 워커가 재개)
+CLAIM_LEASE_SECONDS = 600
+
+_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|]+')
+
+
+# ✅ 리포트 → 템플릿 컨텍스트 (단건/일괄 다운로드 공용)
+def admin_report_context(report) -> Dict[str, Any]:
+    return {
+        "report_id": report.report_id,
+        "score": report.score_total,
+        "sten": report.score_level,
+        "description": report.result_summary,
+        "created_at": report.report_generated_at,
+    }
+
+
+def user_report_context(report, test_name: Optional[str]) -> Dict[str, Any]:
+    return {"report": {
+        "test_name": test_name or "Unknown",
+        "generated_at": report.report_generated_at.strftime("%Y-%m-%d"),
+        "score_total": report.score_total,
+        "score_level": report.score_level,
+        "score_standardized": report.score_standardized,
+        "result_summary": report.result_summary
+    }}
+
+
+# ✅ 기관 코호트 리포트 조회 (user_profiles.email 조인, report_id 순)
+def _cohort_reports(db: Session, job: PdfExportJob):
+    cohort_column = UserProfile.school if job.institution_type == "school" else UserProfile.current_company
+    query = (
+        db.query(TestReport)
+        .join(UserProfile, UserProfile.email == TestReport.email)
+        .filter(cohort_column == job.institution_name)
+    )
+    if job.test_id:
+        query = query.filter(TestReport.test_id == job.test_id)
+    if job.created_at:
+        # ✅ 작업 생성 이후 리포트는 제외 (진행률 total 과 ZIP 구성 일치)
+        query = query.filter(TestReport.report_generated_at <= job.created_at)
+    return query
+
+
+# ------------------------------------------------------------
+# ✅ 작업 생성 / 조회 (라우터 공용)
+# ------------------------------------------------------------
+def create_export_job(db: Session, admin: InstitutionAdmin, test_id: Optional[str] = None) -> PdfExportJob:
+    """
+    관리자 소속 기관(InstitutionAdmin.institution_name) 범위로 일괄 PDF 작업을 생성합니다.
+    - 같은 조건의 진행 중 작업이 있으면 새로 만들지 않고 그 작업을 반환
+    """
+    existing = db.query(PdfExportJob).filter(
+        PdfExportJob.admin_id == admin.id,
+        PdfExportJob.test_id == test_id,
+        PdfExportJob.status.in_([PdfExportStatusEnum.pending, PdfExportStatusEnum.running])
+    ).first()
+    if existing:
+        return existing
+
+    job = PdfExportJob(
+        admin_id=admin.id,
+        institution_type=admin.institution_type,
+        institution_name=admin.institution_name,
+        test_id=test_id,
+        status=PdfExportStatusEnum.pending,
+    )
+    job.total = _cohort_reports(db, job).count()
+    if job.total == 0:
+        job.status = PdfExportStatusEnum.completed
+        job.completed_at = datetime.utcnow()
+
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_export_job(db: Session, admin: InstitutionAdmin, job_id: str) -> PdfExportJob:
+    job = db.query(PdfExportJob).filter(
+        PdfExportJob.job_id == job_id,
+        PdfExportJob.institution_type == admin.institution_type,
+        PdfExportJob.institution_name == admin.institution_name
+    ).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다.")
+    return job
+
+
+def job_status(job: PdfExportJob) -> Dict[str, Any]:
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value if hasattr(job.status, "value") else job.status,
+        "test_id": job.test_id,
+        "total": job.total,
+        "processed": job.processed,
+        "progress": round(job.processed / job.total, 4) if job.total else 1.0,
+        "error": job.error,
+        "created_at": job.created_at,
+        "completed_at": job.completed_at,
+    }
+
+
+# ------------------------------------------------------------
+# ✅ 백그라운드 렌더링 (청크 단위, 중단 시 last_report_id 부터 재개)
+# ------------------------------------------------------------
+def process_next_chunk(db: Session) -> int:
+    """
+    대기/진행 중 작업 하나를 점유하고 다음 CHUNK_SIZE 건을 병렬 렌더링하여 PDF 저장소에 채웁니다.
+    - SKIP LOCKED 로 작업을 잠가 점유(updated_at 갱신) + 리포트 조회 후 바로 커밋 → 렌더링 중에는 행 잠금/커넥션 미보유
+    - 점유 후 CLAIM_LEASE_SECONDS 동안 다른 워커는 같은 작업을 건너뜀
+    - 렌더링 후 작업을 다시 잠그고, 진행 위치가 그대로일 때만 전진 (점유 만료 후 다른 워커가 먼저 처리한 경우 무시)
+    - 렌더링 결과는 pdf_store 에 남으므로, 재개 시 이미 렌더링된 리포트는 캐시 적중으로 즉시 통과
+    - 반환: 이번에 처리한 리포트 수 (0 이면 할 일 없음)
+    """
+    now = datetime.utcnow()
+    job = (
+        db.query(PdfExportJob)
+        .filter(
+            or_(
+                PdfExportJob.status == PdfExportStatusEnum.pending,
+                (PdfExportJob.status == PdfExportStatusEnum.running)
+                & (PdfExportJob.updated_at < now - timedelta(seconds=CLAIM_LEASE_SECONDS)),
+            )
+        )
+        .order_by(PdfExportJob.created_at)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if not job:
+        db.rollback()
+        return 0
+
+    query = _cohort_reports(db, job)
+    if job.last_report_id:
+        query = query.filter(TestReport.report_id > job.last_report_id)
+    reports = query.order_by(TestReport.report_id).limit(CHUNK_SIZE).all()
+
+    if not reports:
+        job.status = PdfExportStatusEnum.completed
+        job.completed_at = now
+        db.commit()
+        return 0
+
+    # ✅ 점유 기록 후 커밋 → 잠금 해제 + 커넥션 반환 (렌더링 동안 DB 자원 미사용)
+    job_id, start_report_id = job.job_id, job.last_report_id
+    job.status = PdfExportStatusEnum.running
+    job.updated_at = now
+    report_ids = [r.report_id for r in reports]
+    contexts = [admin_report_context(r) for r in reports]
+    db.commit()
+
+    with ThreadPoolExecutor(max_workers=pdf_renderer.workers) as executor:
+        futures = [executor.submit(pdf_store.get_or_render, ADMIN_REPORT_TEMPLATE, c) for c in contexts]
+
+        # ✅ 앞에서부터 연속으로 성공한 리포트까지만 진행 위치 전진
+        done = 0
+        error = None
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                error = getattr(e, "detail", None) or str(e)
+                break
+            done += 1
+
+    job = db.query(PdfExportJob).filter(PdfExportJob.job_id == job_id).with_for_update().first()
+    if not job or job.last_report_id != start_report_id:
+        db.rollback()
+        return 0
+
+    if done:
+        job.processed += done
+        job.last_report_id = report_ids[done - 1]
+        job.failed_attempts = 0
+        job.error = None
+    if error:
+        job.failed_attempts += 1
+        job.error = error
+        if job.failed_attempts >= MAX_FAILED_ATTEMPTS:
+            job.status = PdfExportStatusEnum.failed
+    # 다음 청크는 점유 만료를 기다리지 않고 바로 재점유 가능하도록 updated_at 을 만료 시점으로 되돌림
+    job.updated_at = datetime.utcnow() - timedelta(seconds=CLAIM_LEASE_SECONDS)
+    db.commit()
+    return done
+
+
+def run_once() -> int:
+    db = SessionLocal()
+    try:
+        return process_next_chunk(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# ✅ 앱 시작 시 main.py 에서 start() 호출 (재시작 시 running 작업 자동 재개)
+pdf_export_job = PeriodicJob(
+    name="pdf-bulk-export",
+    run_once=run_once,
+    interval_seconds=settings.PDF_EXPORT_INTERVAL_SECONDS,
+)
+
+
+# ------------------------------------------------------------
+# ✅ ZIP 스트리밍 (아카이브 전체를 메모리에 두지 않음)
+# ------------------------------------------------------------
+def _iter_zip(job_id: str) -> Iterator[bytes]:
+    """
+    리포트 PDF 를 하나씩 ZIP 에 추가하며 바로 내보냅니다.
+    - PDF 는 이미 압축되어 있으므로 ZIP_STORED (CPU 절약)
+    - 저장소에서 밀려난 파일은 그 자리에서 다시 렌더링
+    """
+    db: Session = SessionLocal()
+    try:
+        job = db.query(PdfExportJob).filter(PdfExportJob.job_id == job_id).first()
+        rows = (
+            _cohort_reports(db, job)
+            .join(User, User.user_id == UserProfile.user_id)
+            .outerjoin(Test, Test.test_id == TestReport.test_id)
+            .with_entities(TestReport, User.nickname, User.name, Test.test_name)
+            .order_by(TestReport.report_id)
+            .yield_per(CHUNK_SIZE)
+        )
+
+        sink = DrainableSink()
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:
+            for report, nickname, name, test_name in rows:
+                stored = pdf_store.get_or_render(ADMIN_REPORT_TEMPLATE, admin_report_context(report))
+                folder = _UNSAFE_FILENAME.sub("_", test_name or "test")
+                label = _UNSAFE_FILENAME.sub("_", f"{nickname or name}_{report.report_id[:8]}.pdf")
+                archive.write(stored.path, arcname=f"{folder}/{label}")
+                yield sink.drain()
+        yield sink.drain()
+    finally:
+        db.close()
+
+
+def export_zip_response(job: PdfExportJob) -> StreamingResponse:
+    if job.status != PdfExportStatusEnum.completed:
+        raise HTTPException(status_code=409, detail="아직 렌더링이 완료되지 않았습니다.")
+
+    filename = f"{job.institution_name}_리포트.zip"
+    return StreamingResponse(
+        _iter_zip(job.job_id),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"}
+    )
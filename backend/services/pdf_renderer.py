@@ -0,0 +1,239 @@
+# backend/services/pdf_renderer.py
+
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+from fastapi import HTTPException
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from backend.core.config import settings
+
+TEMPLATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "templates"))
+
+# ✅ PDF 공통 스타일 (한글 글꼴 등) — 워커 시작 시 1회 파싱
+BASE_CSS_PATH = os.path.join(TEMPLATE_DIR, "report_base.css")
+
+# ✅ 워밍업 / 벤치마크용 리포트 데이터
+SAMPLE_REPORT = {
+    "test_name": "샘플 검사",
+    "generated_at": "2025-01-01",
+    "score_total": 42,
+    "score_level": "STEN 7",
+    "score_standardized": 61.5,
+    "result_summary": "샘플 요약입니다.",
+}
+
+# ✅ 모듈 수준 템플릿 환경 (컴파일된 템플릿은 Environment 내부 캐시에 보관, 파일 변경 검사 생략)
+_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=50,
+)
+
+
+class PdfRenderBusy(Exception):
+    """렌더링 대기열이 가득 찬 경우 (라우터에서 503 으로 변환)"""
+
+
+class PdfRenderUnavailable(Exception):
+    """weasyprint 가 설치되어 있지 않은 경우"""
+
+
+# ✅ 리포트 HTML 렌더링 (요청 스레드에서 실행, 템플릿은 캐시 재사용)
+def render_report_html(template_name: str, **context) -> str:
+    return _env.get_template(template_name).render(**context)
+
+
+def pdf_available() -> bool:
+    try:
+        import weasyprint  # noqa: F401
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+# ------------------------------------------------------------
+# ✅ 워커 프로세스 측 (초기화 시 weasyprint / 글꼴 / CSS 미리 로드)
+# ------------------------------------------------------------
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker():
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    stylesheets = []
+    if os.path.exists(BASE_CSS_PATH):
+        stylesheets.append(CSS(filename=BASE_CSS_PATH, font_config=font_config))
+
+    _worker_state.update(html_class=HTML, font_config=font_config, stylesheets=stylesheets)
+
+    # 🔧 첫 요청 지연을 없애기 위해 샘플 문서로 레이아웃 엔진/글꼴 캐시 워밍업
+    _render_in_worker(render_report_html("report_pdf.html", report=SAMPLE_REPORT))
+
+
+def _render_in_worker(html: str) -> bytes:
+    return _worker_state["html_class"](string=html, base_url=TEMPLATE_DIR).write_pdf(
+        stylesheets=_worker_state["stylesheets"],
+        font_config=_worker_state["font_config"],
+    )
+
+
+# ------------------------------------------------------------
+# ✅ API 프로세스 측 (프로세스 풀 + 제한된 대기열)
+# ------------------------------------------------------------
+class PdfRenderer:
+    """
+    WeasyPrint 렌더링을 별도 프로세스 풀에서 실행합니다.
+    - 요청 스레드는 HTML 만 만들고, 무거운 레이아웃/PDF 생성은 워커 프로세스가 처리
+    - 동시 작업 수(실행 중 + 대기) 를 workers + queue_size 로 제한, 초과 시 PdfRenderBusy
+    - 풀은 첫 요청 시 생성 (PDF 를 쓰지 않는 워커/스크립트는 비용 없음)
+    - 워커가 죽었거나(BrokenProcessPool) 시간 초과된 렌더링이 워커를 점유 중이면 풀을 폐기하고 다음 요청에서 재생성
+    - 다른 요청의 시간 초과로 풀이 폐기되어 실패한 렌더링은 새 풀에서 1회 재시도 (시간 초과된 요청만 실패)
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout_seconds: float, acquire_timeout_seconds: float):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout_seconds = timeout_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.render_seconds = 0.0
+        self.recycled = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                if not pdf_available():
+                    raise PdfRenderUnavailable("weasyprint 라이브러리가 서버에 설치되어 있지 않습니다.")
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """
+        현재 풀을 폐기합니다 (다음 _get_pool() 호출에서 새로 생성).
+        - .result(timeout) 은 워커의 렌더링을 취소하지 못하므로, 시간 초과 시 워커 프로세스를 직접 종료
+        - 다른 요청이 이미 교체한 풀이면 무시
+        """
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self.recycled += 1
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def render(self, html: str) -> bytes:
+        pool = self._get_pool()
+        if not self._slots.acquire(timeout=self.acquire_timeout_seconds):
+            with self._lock:
+                self.rejected += 1
+            raise PdfRenderBusy("PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+
+        started = time.perf_counter()
+        with self._lock:
+            self.in_flight += 1
+            self.submitted += 1
+        try:
+            pdf = self._submit_with_retry(pool, html)
+            with self._lock:
+                self.completed += 1
+                self.render_seconds += time.perf_counter() - started
+            return pdf
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def _submit_with_retry(self, pool: ProcessPoolExecutor, html: str) -> bytes:
+        for attempt in range(2):
+            try:
+                return pool.submit(_render_in_worker, html).result(timeout=self.timeout_seconds)
+            except FutureTimeoutError:
+                self._discard_pool(pool)
+                raise
+            except (BrokenProcessPool, CancelledError):
+                self._discard_pool(pool)
+            except RuntimeError:
+                # ✅ 제출 직전에 다른 요청이 풀을 종료한 경우만 재시도 (렌더링 중 발생한 RuntimeError 는 그대로 전달)
+                if self._pool is pool:
+                    raise
+            if attempt:
+                raise PdfRenderBusy("PDF 렌더러를 재시작하는 중입니다. 잠시 후 다시 시도해주세요.")
+            pool = self._get_pool()
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "started": self._pool is not None,
+                "in_flight": self.in_flight,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "failed": self.failed,
+                "recycled": self.recycled,
+                "avg_render_seconds": round(self.render_seconds / self.completed, 4) if self.completed else None,
+            }
+
+
+# ✅ 프로세스 전역 렌더러 (main.py shutdown 에서 정리)
+pdf_renderer = PdfRenderer(
+    workers=settings.PDF_RENDER_WORKERS,
+    queue_size=settings.PDF_RENDER_QUEUE_SIZE,
+    timeout_seconds=settings.PDF_RENDER_TIMEOUT_SECONDS,
+    acquire_timeout_seconds=settings.PDF_RENDER_ACQUIRE_TIMEOUT_SECONDS,
+)
+
+
+# ✅ 라우터 공용: PDF 렌더링 (대기열 초과 → 503 + Retry-After, weasyprint 미설치 → 500)
+def render_pdf(html: str) -> bytes:
+    try:
+        return pdf_renderer.render(html)
+    except PdfRenderBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except PdfRenderUnavailable as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ✅ 단독 실행: python -m backend.services.pdf_renderer [렌더링 수] → 처리량(PDF/초) 측정
+if __name__ == "__main__":
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    html = render_report_html("report_pdf.html", report=SAMPLE_REPORT)
+    pdf_renderer.render(html)  # 워커 기동/워밍업은 측정에서 제외
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=pdf_renderer.workers + pdf_renderer.queue_size) as clients:
+        sizes = list(clients.map(lambda _: len(pdf_renderer.render(html)), range(count)))
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ {count} PDFs in {elapsed:.2f}s → {count / elapsed:.1f} PDFs/sec (avg {sum(sizes) // count} bytes)")
+    print(pdf_renderer.stats())
+    pdf_renderer.shutdown()
@@ -0,0 +1,243 @@
+# backend/services/pdf_store.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+from fastapi.responses import FileResponse, Response
+
+from backend.core.config import settings
+from backend.services.pdf_renderer import TEMPLATE_DIR, BASE_CSS_PATH, render_report_html, render_pdf
+
+# ✅ 쓰다 만 임시 파일을 고아로 간주하는 시간 (렌더링 제한 시간보다 충분히 길게)
+ORPHAN_TMP_SECONDS = 600
+
+# ✅ 용량 초과 시 이 비율까지 줄임 (경계에서 매 요청마다 삭제가 반복되지 않도록)
+EVICT_TARGET_RATIO = 0.9
+
+# ✅ 최근 접근/생성된 파일은 삭제 대상에서 제외 (_lookup 과 FileResponse 가 파일을 여는 사이에 삭제되지 않도록)
+EVICT_GRACE_SECONDS = 60
+
+
+# ✅ 템플릿 버전 (템플릿 + 공통 CSS 내용 해시 → 템플릿 수정 시 캐시 키가 자동으로 바뀜)
+def _template_version(template_name: str) -> str:
+    digest = hashlib.sha256()
+    for path in (os.path.join(TEMPLATE_DIR, template_name), BASE_CSS_PATH):
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class StoredPdf(NamedTuple):
+    path: str
+    etag: str
+    size: int
+
+
+# ✅ 렌더링된 리포트 PDF 저장소 (내용 주소 기반, 디스크 LRU)
+class PdfStore:
+    """
+    리포트 데이터 + 템플릿 버전의 해시를 키로 PDF 파일을 디스크에 보관합니다.
+    - 같은 리포트 재다운로드 시 렌더링 없이 파일 그대로 반환 (TestReport 는 생성 후 불변)
+    - 임시 파일에 쓴 뒤 os.replace 로 교체 → 읽는 쪽은 항상 완성된 파일만 봄
+    - 총 용량이 max_bytes 를 넘으면 접근 시각(mtime)이 오래된 파일부터 삭제 (EVICT_GRACE_SECONDS 이내 접근 파일은 유지)
+    - 시작 시 오래된 *.tmp (렌더링 중 프로세스 종료 등) 정리
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._template_versions: Dict[str, str] = {}
+        self._total_bytes: Optional[int] = None
+        self._evicting = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.orphans_removed = 0
+
+    # ------------------------------------------------------------
+    def key_for(self, template_name: str, context: Dict[str, Any]) -> str:
+        version = self._template_versions.get(template_name)
+        if version is None:
+            version = self._template_versions[template_name] = _template_version(template_name)
+        payload = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(f"{template_name}:{version}:{payload}".encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pdf")
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    # ✅ 최초 사용 시 디스크 스캔 (총 용량 계산 + 고아 임시 파일 정리)
+    def _ensure_scanned(self):
+        with self._lock:
+            if self._total_bytes is not None:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            total = 0
+            now = time.time()
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    if name.endswith(".tmp"):
+                        if now - stat.st_mtime > ORPHAN_TMP_SECONDS:
+                            self._remove(path)
+                            self.orphans_removed += 1
+                        continue
+                    total += stat.st_size
+            self._total_bytes = total
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    # ------------------------------------------------------------
+    def get_or_render(self, template_name: str, context: Dict[str, Any]) -> StoredPdf:
+        """
+        저장된 PDF 를 반환하고, 없으면 렌더링 워커 풀에서 생성 후 저장합니다.
+        - 같은 키의 동시 요청은 키별 잠금으로 한 번만 렌더링
+        """
+        self._ensure_scanned()
+        key = self.key_for(template_name, context)
+        path = self._path_for(key)
+
+        stored = self._lookup(key, path)
+        if stored:
+            return stored
+
+        with self._key_lock(key):
+            stored = self._lookup(key, path)
+            if stored:
+                return stored
+
+            with self._lock:
+                self.misses += 1
+            pdf = render_pdf(render_report_html(template_name, **context))
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(pdf)
+                os.replace(tmp_path, path)
+            finally:
+                self._remove(tmp_path)
+
+            with self._lock:
+                self._total_bytes += len(pdf)
+                self._key_locks.pop(key, None)
+            self._evict_if_needed()
+            return StoredPdf(path=path, etag=f'"{key}"', size=len(pdf))
+
+    def _lookup(self, key: str, path: str) -> Optional[StoredPdf]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # ✅ LRU: 접근 시 mtime 갱신
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            self.hits += 1
+        return StoredPdf(path=path, etag=f'"{key}"', size=stat.st_size)
+
+    # ✅ 용량 초과 시 오래된 파일부터 삭제 (최근 접근 파일은 다음 정리 때까지 유지 → 일시적으로 max_bytes 초과 가능)
+    def _evict_if_needed(self):
+        """
+        디렉터리 스캔 / stat / 삭제는 전역 잠금 밖에서 수행합니다 (그동안 조회 / 저장 요청이 막히지 않도록).
+        - 동시에 한 스레드만 정리 (_evicting), 정리 중 늘어난 용량은 다음 저장 시 다시 확인
+        - 삭제한 바이트만 _total_bytes 에서 빼므로 정리 중에 저장된 파일의 용량도 유지됨
+        """
+        with self._lock:
+            if self._evicting or self._total_bytes <= self.max_bytes:
+                return
+            self._evicting = True
+            excess = self._total_bytes - int(self.max_bytes * EVICT_TARGET_RATIO)
+
+        removed_bytes = 0
+        removed_files = 0
+        try:
+            entries = []
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith(".pdf"):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            grace_cutoff = time.time() - EVICT_GRACE_SECONDS
+            for mtime, size, path in entries:
+                if removed_bytes >= excess or mtime > grace_cutoff:
+                    break
+                try:
+                    if os.stat(path).st_mtime > grace_cutoff:  # ✅ 스캔 이후 접근된 파일은 유지
+                        continue
+                except FileNotFoundError:
+                    continue
+                if self._remove(path):
+                    removed_bytes += size
+                    removed_files += 1
+        finally:
+            with self._lock:
+                self._total_bytes = max(0, self._total_bytes - removed_bytes)
+                self.evictions += removed_files
+                self._evicting = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "directory": self.directory,
+                "max_bytes": self.max_bytes,
+                "total_bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+                "evictions": self.evictions,
+                "orphans_removed": self.orphans_removed,
+            }
+
+
+# ✅ 프로세스 전역 저장소 (같은 디렉터리를 여러 워커가 공유해도 파일 단위로 안전)
+pdf_store = PdfStore(
+    directory=settings.PDF_STORE_DIR,
+    max_bytes=settings.PDF_STORE_MAX_BYTES,
+)
+
+
+# ✅ 라우터 공용: 저장된 PDF 응답 (If-None-Match 일치 시 304, Range 요청은 FileResponse 가 처리)
+def pdf_file_response(stored: StoredPdf, filename: str, if_none_match: Optional[str] = None) -> Response:
+    headers = {"ETag": stored.etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and stored.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        path=stored.path,
+        filename=filename,
+        media_type="application/pdf",
+        headers=headers
+    )
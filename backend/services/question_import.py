@@ -0,0 +1,377 @@
+# backend/services/question_import.py
+
+import csv
+import io
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from backend.core.cache import invalidate_test_caches
+from backend.models.question import Question, QuestionStatus, UsageType
+from backend.models.option import Option
+from backend.models.test import Test
+from backend.schemas.question_create import QuestionCreateRequest
+
+# ✅ 한 트랜잭션으로 묶어 INSERT 할 문항 수 / 한 번에 받을 최대 행 수
+CHUNK_SIZE = 500
+MAX_ROWS = 20000
+
+# ✅ JSON 배열을 나눠 읽을 문자 수 (파일 전체를 한 번에 json.load 하지 않음)
+JSON_READ_SIZE = 64 * 1024
+
+# ✅ 응답에 포함할 최대 오류 행 수 (나머지는 error_count 로만 집계)
+MAX_REPORTED_ERRORS = 1000
+
+# ✅ 지원 형식 (파일 확장자 기준)
+IMPORT_FORMATS = ("csv", "xlsx", "json")
+
+# ✅ CSV/XLSX 선택지 열: option_1, option_2, ... / 정답: correct = "2" 또는 "1,3" (1부터 시작)
+OPTION_COLUMN_PREFIX = "option_"
+CORRECT_COLUMN = "correct"
+
+
+class QuestionImportError(Exception):
+    """
+    파일 자체를 읽을 수 없는 경우 (형식 오류 / openpyxl 미설치 등)
+    """
+
+
+# ✅ 검증 완료된 행 (행 번호 + 요청 스키마)
+class ValidRow(NamedTuple):
+    row: int
+    question: QuestionCreateRequest
+
+
+def xlsx_available() -> bool:
+    try:
+        import openpyxl  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def detect_format(filename: str) -> str:
+    name = (filename or "").lower()
+    for fmt in IMPORT_FORMATS:
+        if name.endswith(f".{fmt}"):
+            return fmt
+    raise QuestionImportError(f"지원하지 않는 파일 형식입니다. ({', '.join(IMPORT_FORMATS)})")
+
+
+# ✅ 형식별 행 읽기 (행 번호, dict) — CSV/XLSX 는 한 행씩 스트리밍
+def _iter_csv(fileobj) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    reader = csv.DictReader(io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=""))
+    for index, row in enumerate(reader, start=2):  # 1행은 헤더
+        yield index, row
+
+
+def _iter_xlsx(fileobj) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    if not xlsx_available():
+        raise QuestionImportError("XLSX 가져오기를 사용하려면 서버에 openpyxl 이 설치되어 있어야 합니다.")
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(h).strip() if h is not None else "" for h in next(rows, [])]
+        for index, values in enumerate(rows, start=2):
+            if values is None or all(v is None for v in values):
+                continue
+            yield index, dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+def _iter_json(fileobj) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    - JSON 배열 또는 JSON Lines (한 줄에 문항 1개)
+    - 행 번호는 배열 순서 / 줄 번호 (1부터)
+    - 배열도 원소 단위로 파싱 → MAX_ROWS 에서 멈추면 나머지는 읽지 않음
+    """
+    head = fileobj.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    fileobj.seek(0)
+
+    if head.startswith(b"["):
+        yield from _iter_json_array(io.TextIOWrapper(fileobj, encoding="utf-8-sig"))
+        return
+
+    for index, line in enumerate(io.TextIOWrapper(fileobj, encoding="utf-8-sig"), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield index, json.loads(line)
+        except ValueError as e:
+            yield index, {"__error__": f"JSON 형식 오류: {e}"}
+
+
+def _iter_json_array(text) -> Iterator[Tuple[int, Any]]:
+    """
+    JSON 배열을 JSON_READ_SIZE 문자씩 읽으며 json.JSONDecoder.raw_decode 로 원소를 하나씩 꺼냅니다.
+    - 버퍼 끝에서 끝난 원소 (잘린 숫자 등) / 파싱 실패는 더 읽은 뒤 다시 시도, 파일 끝이면 오류
+    - 이미 반환한 원소는 버퍼에서 잘라내므로 메모리는 원소 하나 + 읽기 단위 정도
+    """
+    decoder = json.JSONDecoder()
+    buffer = text.read(JSON_READ_SIZE).lstrip()[1:]  # ✅ 여는 '[' 제거 (호출 전에 확인됨)
+    pos = 0
+    eof = False
+    index = 0
+    expect_value = True  # ✅ False 면 ',' 또는 ']' 차례
+
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos >= len(buffer):
+            if eof:
+                raise QuestionImportError("JSON 형식 오류: 배열이 닫히지 않았습니다.")
+            chunk = text.read(JSON_READ_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        char = buffer[pos]
+        if char == "]" and (not expect_value or index == 0):
+            return
+        if not expect_value:
+            if char != ",":
+                raise QuestionImportError(f"JSON 형식 오류: {index}번째 원소 뒤에 ',' 또는 ']' 가 필요합니다.")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            complete = end < len(buffer) or eof
+        except ValueError as e:
+            if eof:
+                raise QuestionImportError(f"JSON 형식 오류: {e}")
+            complete = False
+        if not complete:
+            chunk = text.read(JSON_READ_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        index += 1
+        yield index, item
+        buffer, pos = buffer[end:], 0
+        expect_value = False
+
+
+def iter_rows(fileobj, fmt: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    readers = {"csv": _iter_csv, "xlsx": _iter_xlsx, "json": _iter_json}
+    return readers[fmt](fileobj)
+
+
+def _blank(value) -> bool:
+    return value is None or (isinstance(value, str) and value.strip() == "")
+
+
+# ✅ XLSX 셀 값 정리 (숫자 셀 → 문자열, 2.0 → "2")
+def _cell_text(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+# ✅ CSV/XLSX 평면 행 → QuestionCreateRequest 형태로 변환
+def _flat_to_request(row: Dict[str, Any]) -> Dict[str, Any]:
+    option_columns = sorted(
+        (k for k in row if k and k.startswith(OPTION_COLUMN_PREFIX) and k[len(OPTION_COLUMN_PREFIX):].isdigit()),
+        key=lambda k: int(k[len(OPTION_COLUMN_PREFIX):])
+    )
+    correct = _cell_text(row.get(CORRECT_COLUMN) or "").replace(" ", "")
+    correct_numbers = {int(c) for c in correct.split(",") if c.isdigit()}
+
+    options = []
+    for column in option_columns:
+        if _blank(row[column]):
+            continue
+        number = int(column[len(OPTION_COLUMN_PREFIX):])
+        options.append({"option_text": _cell_text(row[column]), "is_correct": number in correct_numbers})
+
+    data = {
+        k: v if isinstance(v, bool) else _cell_text(v)
+        for k, v in row.items()
+        if k and not k.startswith(OPTION_COLUMN_PREFIX) and k != CORRECT_COLUMN and not _blank(v)
+    }
+    data["options"] = options
+    if isinstance(data.get("is_multiple_choice"), str):
+        data["is_multiple_choice"] = data["is_multiple_choice"].strip().lower() in ("1", "true", "y", "yes")
+    data.setdefault("is_multiple_choice", len(correct_numbers) > 1)
+    return data
+
+
+# ✅ 행 1개 검증 (오류 메시지 목록 반환, 정상이면 빈 목록)
+def validate_row(row: Dict[str, Any], fmt: str) -> Tuple[Optional[QuestionCreateRequest], List[str]]:
+    if not isinstance(row, dict):
+        return None, ["문항은 객체여야 합니다."]
+    if "__error__" in row:
+        return None, [row["__error__"]]
+
+    data = row if fmt == "json" else _flat_to_request(row)
+    try:
+        question = QuestionCreateRequest(**data)
+    except ValidationError as e:
+        return None, [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()]
+
+    errors = []
+    if len(question.options) < 2:
+        errors.append("options: 선택지는 2개 이상이어야 합니다.")
+    if not any(o.is_correct for o in question.options):
+        errors.append("options: 정답 선택지가 없습니다.")
+    if question.question_name and len(question.question_name) > 100:
+        errors.append("question_name: 100자를 넘을 수 없습니다.")
+    return (None, errors) if errors else (question, [])
+
+
+# ✅ 청크에서 참조하는 test_id 중 실제로 존재하는 것 (청크당 조회 1회)
+def existing_test_ids(db: Session, rows: List[ValidRow]) -> set:
+    test_ids = {str(valid.question.test_id) for valid in rows if valid.question.test_id}
+    if not test_ids:
+        return set()
+    return {test_id for (test_id,) in db.query(Test.test_id).filter(Test.test_id.in_(test_ids)).all()}
+
+
+# ✅ 검증된 청크를 한 트랜잭션으로 INSERT (questions / options 각 1문장)
+def insert_chunk(db: Session, rows: List[ValidRow]) -> int:
+    created_at = datetime.utcnow()
+    question_values, option_values = [], []
+    for valid in rows:
+        q = valid.question
+        question_id = str(uuid4())
+        question_values.append({
+            "question_id": question_id,
+            "test_id": str(q.test_id) if q.test_id else None,
+            "question_text": q.question_text,
+            "question_type": q.question_type,
+            "is_multiple_choice": q.is_multiple_choice,
+            "instruction": q.instruction,
+            "correct_explanation": q.correct_explanation,
+            "wrong_explanation": q.wrong_explanation,
+            "question_image_url": q.question_image_url,
+            "question_name": q.question_name,
+            "usage_type": UsageType(q.usage_type.value),
+            "status": QuestionStatus.approved,
+            "created_at": created_at,
+        })
+        for index, opt in enumerate(q.options):
+            option_values.append({
+                "option_id": str(uuid4()),
+                "question_id": question_id,
+                "option_text": opt.option_text,
+                "is_correct": opt.is_correct,
+                "option_image_url": opt.option_image_url,
+                "option_order": index,
+            })
+
+    try:
+        db.execute(insert(Question).values(question_values))
+        db.execute(insert(Option).values(option_values))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # ✅ test_id 가 지정된 문항이 있으면 해당 검사의 정답표 / 문항 페이로드 캐시 무효화
+    invalidate_test_caches({row["test_id"] for row in question_values if row["test_id"]})
+    return len(question_values)
+
+
+# ✅ 파일 전체 가져오기 (청크 단위 검증 + INSERT)
+def import_questions(db: Session, fileobj, fmt: str, dry_run: bool = False, chunk_size: int = CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    - 행을 chunk_size 개씩 읽어 검증하고, 정상 행만 청크마다 한 트랜잭션으로 INSERT
+    - 오류 행은 건너뛰고 행 번호별 오류로 보고 (다른 행의 저장에는 영향 없음)
+    - 존재하지 않는 test_id 는 청크마다 한 번 조회해 해당 행만 오류로 보고
+    - 청크 INSERT 가 실패하면 해당 청크 전체를 오류로 보고하고 다음 청크 계속
+    - MAX_ROWS 를 넘으면 그때까지의 행만 저장하고 truncated=True 로 반환 (이미 커밋된 청크가 있으므로 예외 대신 부분 결과)
+    - dry_run=True 이면 검증만 수행 (DB 변경 없음)
+    """
+    started = time.perf_counter()
+    total = inserted = error_count = 0
+    truncated = False
+    errors: List[Dict[str, Any]] = []
+    chunk: List[ValidRow] = []
+
+    def report(row: int, messages: List[str]):
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"row": row, "errors": messages})
+
+    def flush():
+        nonlocal inserted
+        if not chunk:
+            return
+        known_test_ids = existing_test_ids(db, chunk)
+        missing = [v for v in chunk if v.question.test_id and str(v.question.test_id) not in known_test_ids]
+        for valid in missing:
+            report(valid.row, [f"test_id: 존재하지 않는 검사입니다. ({valid.question.test_id})"])
+        if missing:
+            chunk[:] = [v for v in chunk if not v.question.test_id or str(v.question.test_id) in known_test_ids]
+        if chunk and not dry_run:
+            try:
+                inserted += insert_chunk(db, chunk)
+            except Exception as e:
+                for valid in chunk:
+                    report(valid.row, [f"저장 실패: {e.__class__.__name__}"])
+        chunk.clear()
+
+    for row_number, row in iter_rows(fileobj, fmt):
+        if total >= MAX_ROWS:
+            truncated = True
+            break
+        total += 1
+        question, messages = validate_row(row, fmt)
+        if messages:
+            report(row_number, messages)
+            continue
+        chunk.append(ValidRow(row=row_number, question=question))
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    elapsed = time.perf_counter() - started
+    valid = total - error_count
+    return {
+        "dry_run": dry_run,
+        "format": fmt,
+        "total_rows": total,
+        "valid_rows": valid,
+        "inserted": 0 if dry_run else inserted,
+        "error_count": error_count,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 3),
+        "items_per_second": round(valid / elapsed, 1) if elapsed > 0 else None,
+        "truncated": truncated,
+    }
+
+
+if __name__ == "__main__":
+    # ✅ 처리량 측정: python -m backend.services.question_import [개수] [--insert]
+    #    기본은 검증만 (dry-run), --insert 를 주면 DATABASE_URL 의 DB 에 실제로 저장
+    import sys
+    from backend.database.database import SessionLocal
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 2000
+    dry_run = "--insert" not in sys.argv
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["question_name", "question_text", "question_type", "usage_type", "option_1", "option_2", "option_3", "option_4", "correct"])
+    for i in range(count):
+        writer.writerow([f"bench-{i:05d}", f"벤치마크 문항 {i}", "text", "aptitude", "가", "나", "다", "라", str(i % 4 + 1)])
+    payload = io.BytesIO(buffer.getvalue().encode())
+
+    db = SessionLocal()
+    try:
+        result = import_questions(db, payload, "csv", dry_run=dry_run)
+    finally:
+        db.close()
+    print(f"✅ {result['total_rows']} rows ({'dry-run' if dry_run else 'insert'}) in {result['elapsed_seconds']}s → {result['items_per_second']} items/sec, errors={result['error_count']}")
@@ -0,0 +1,130 @@
+# backend/services/report_prerender.py
+
+import queue
+import threading
+import traceback
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from backend.core.config import settings
+from backend.database.database import SessionLocal
+from backend.models.test import Test, TestReport
+from backend.services.pdf_export import USER_REPORT_TEMPLATE, user_report_context
+from backend.services.pdf_store import pdf_store
+
+
+# ✅ 제출 직후 리포트 PDF 사전 렌더링 (검사별 Test.prerender_reports 가 켜진 경우)
+class ReportPrerenderer:
+    """
+    submit_test 커밋 후 report_id 를 대기열에 넣으면, 백그라운드 스레드가 PDF 저장소에 미리 렌더링합니다.
+    - 대기열은 크기 제한 → 가득 차면 넣지 않고 버림 (다운로드 시점 렌더링으로 자연스럽게 대체)
+    - 프로세스 내 대기열이므로 재시작 시 남은 항목은 사라짐 (역시 다운로드 시 렌더링)
+    - 대기열 깊이/처리량은 stats() 로 노출
+    """
+
+    def __init__(self, name: str, workers: int, max_queue: int):
+        self.name = name
+        self.workers = workers
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.enqueued = 0
+        self.dropped = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.last_error: Optional[str] = None
+        self.last_completed_at: Optional[datetime] = None
+
+    def enqueue(self, report_id: str) -> bool:
+        try:
+            self._queue.put_nowait(report_id)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+        with self._lock:
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    def _render(self, report_id: str):
+        db = SessionLocal()
+        try:
+            row = (
+                db.query(TestReport, Test.test_name)
+                .outerjoin(Test, Test.test_id == TestReport.test_id)
+                .filter(TestReport.report_id == report_id)
+                .first()
+            )
+        finally:
+            db.close()
+        if row:
+            report, test_name = row
+            pdf_store.get_or_render(USER_REPORT_TEMPLATE, user_report_context(report, test_name))
+
+    def _loop(self):
+        while True:
+            report_id = self._queue.get()
+            if report_id is None:
+                break
+            try:
+                self._render(report_id)
+                with self._lock:
+                    self.completed += 1
+                    self.last_completed_at = datetime.utcnow()
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+                    self.last_error = traceback.format_exc(limit=3)
+                print(f"❌ [{self.name}] 리포트 사전 렌더링 실패 ({report_id}):\n{self.last_error}")
+
+    def start(self):
+        if any(t.is_alive() for t in self._threads):
+            return
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break  # 데몬 스레드이므로 프로세스 종료 시 함께 정리됨
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "running": any(t.is_alive() for t in self._threads),
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "max_depth": self.max_depth,
+                "enqueued": self.enqueued,
+                "dropped": self.dropped,
+                "completed": self.completed,
+                "failed": self.failed,
+                "last_completed_at": self.last_completed_at,
+                "last_error": self.last_error,
+            }
+
+
+# ✅ 앱 시작 시 main.py 에서 start() 호출
+report_prerenderer = ReportPrerenderer(
+    name="report-prerender",
+    workers=settings.REPORT_PRERENDER_WORKERS,
+    max_queue=settings.REPORT_PRERENDER_QUEUE_SIZE,
+)
+
+
+# ✅ submit_test 커밋 후 호출 (검사별 토글 + 전역 설정 확인)
+def schedule_prerender(test: Test, report_id: str) -> bool:
+    if not (settings.REPORT_PRERENDER_ENABLED and settings.ENV == "production" and test.prerender_reports):
+        return False
+    return report_prerenderer.enqueue(report_id)
@@ -0,0 +1,139 @@
+# backend/services/scoring.py
+
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple, Any
+from sqlalchemy import insert, or_, and_
+from sqlalchemy.orm import Session
+from datetime import datetime
+import uuid
+
+from backend.models.question import Question
+from backend.models.option import Option
+from backend.models.test_question_links import TestQuestionLink
+from backend.models.response import UserResponse
+from backend.core.cache import VersionedCache
+from backend.core.config import settings
+
+
+# ✅ 검사별 정답표 (캐시 단위)
+class AnswerKey(NamedTuple):
+    test_id: str
+    version: int                              # 캐시 버전 (무효화 시 증가)
+    correct: Dict[str, FrozenSet[str]]        # question_id → 정답 option_id 집합
+    multiple: Dict[str, bool]                 # question_id → 복수 선택 여부
+
+
+# ✅ 검사 전체 정답표 로드 (단일 쿼리)
+def load_answer_key(db: Session, test_id: str, version: int = 0) -> AnswerKey:
+    """
+    검사에 속한 모든 문항의 정답 선택지 ID를 한 번의 쿼리로 불러옵니다.
+    - questions.test_id 로 직접 연결된 문항 + test_question_links 로 연결된 문항 모두 포함
+    - 정답 선택지가 없는 문항도 빈 frozenset 으로 포함 (검사 소속 여부 판단용)
+    """
+    linked_ids = (
+        db.query(TestQuestionLink.question_id)
+        .filter(TestQuestionLink.test_id == test_id)
+    )
+
+    rows = (
+        db.query(Question.question_id, Question.is_multiple_choice, Option.option_id)
+        .outerjoin(
+            Option,
+            and_(Option.question_id == Question.question_id, Option.is_correct == True)
+        )
+        .filter(or_(Question.test_id == test_id, Question.question_id.in_(linked_ids)))
+        .all()
+    )
+
+    correct: Dict[str, set] = {}
+    multiple: Dict[str, bool] = {}
+    for question_id, is_multiple_choice, option_id in rows:
+        qid = str(question_id)
+        ids = correct.setdefault(qid, set())
+        multiple[qid] = bool(is_multiple_choice)
+        if option_id is not None:
+            ids.add(str(option_id))
+
+    return AnswerKey(
+        test_id=str(test_id),
+        version=version,
+        correct={qid: frozenset(ids) for qid, ids in correct.items()},
+        multiple=multiple,
+    )
+
+
+# ✅ 정답표 캐시 (test_id 단위)
+# ✅ 다른 워커에서 수정된 문항은 TTL 안에 반영 (수정한 워커는 invalidate_test_caches 로 즉시)
+answer_key_cache = VersionedCache("answer_key", scope="test", ttl_seconds=settings.TEST_CACHE_TTL_SECONDS)
+
+
+def get_answer_key(db: Session, test_id: str) -> AnswerKey:
+    """
+    캐시된 정답표를 반환합니다. 캐시 적중 시 DB 조회 없음.
+    """
+    test_id = str(test_id)
+    return answer_key_cache.get(test_id, lambda version: load_answer_key(db, test_id, version))
+
+
+# ✅ 문항이 속한 검사 ID 목록 (캐시 무효화 대상 계산용)
+def get_test_ids_for_question(db: Session, question_id: str) -> List[str]:
+    question_id = str(question_id)
+    test_ids = {
+        str(test_id) for (test_id,) in
+        db.query(TestQuestionLink.test_id).filter(TestQuestionLink.question_id == question_id).all()
+    }
+    direct = db.query(Question.test_id).filter(Question.question_id == question_id).first()
+    if direct and direct[0]:
+        test_ids.add(str(direct[0]))
+    return list(test_ids)
+
+
+# ✅ 메모리 내 채점 (집합 비교)
+def score_answers(answer_key: AnswerKey, answers: List[Any]) -> Tuple[float, List[Tuple[Any, bool]]]:
+    """
+    제출된 응답 목록을 정답표와 집합 비교로 채점합니다.
+    - answers: question_id, selected_option_ids 속성을 가진 객체 목록
+    - 검사에 속하지 않은 문항은 결과에서 제외 (기존 submit_test 동작과 동일)
+    - 반환: (총점, [(응답, 정답 여부), ...])
+    """
+    total_score = 0.0
+    scored = []
+    for item in answers:
+        correct_ids = answer_key.correct.get(str(item.question_id))
+        if correct_ids is None:
+            continue
+
+        is_correct = {str(opt_id) for opt_id in item.selected_option_ids} == correct_ids
+        if is_correct:
+            total_score += 1
+        scored.append((item, is_correct))
+
+    return total_score, scored
+
+
+# ✅ 응답 행 일괄 저장 (multi-row INSERT 1회)
+def bulk_insert_responses(db: Session, test_id: str, email: str, scored: List[Tuple[Any, bool]], group_value: str = None) -> int:
+    """
+    채점된 응답을 responses 테이블에 한 번의 INSERT 문으로 저장합니다.
+    - 정답 여부와 소속 그룹을 함께 저장 → 문항 통계는 stats_aggregator 가 비동기로 반영
+    - 커밋은 호출하는 쪽(라우터)에서 리포트와 함께 수행
+    """
+    if not scored:
+        return 0
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "response_id": str(uuid.uuid4()),
+            "email": email,
+            "test_id": test_id,
+            "question_id": str(item.question_id),
+            "selected_option_ids": [str(opt_id) for opt_id in item.selected_option_ids],
+            "response_time_sec": 0.0,
+            "is_correct": is_correct,
+            "group_value": group_value,
+            "created_at": now,
+        }
+        for item, is_correct in scored
+    ]
+    db.execute(insert(UserResponse).values(rows))
+    return len(rows)
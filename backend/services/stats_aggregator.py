@@ -0,0 +1,165 @@
+# backend/services/stats_aggregator.py
+
+from collections import Counter
+from typing import Dict, Tuple
+from sqlalchemy import update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+import json
+import uuid
+
+from backend.core.config import settings
+from backend.database.database import SessionLocal
+from backend.models.response import UserResponse
+from backend.models.question_stats_by_group import QuestionStatsByGroup, GroupTypeEnum
+from backend.crud.aggregation_watermark import lock_watermark, advance_watermark
+from backend.services.background import PeriodicJob
+
+JOB_NAME = "question_stats"
+
+
+# ✅ (문항, 학교, 연, 월) 단위 누적값
+class _Bucket:
+    __slots__ = ("num_responses", "num_correct", "response_time_sum", "options")
+
+    def __init__(self):
+        self.num_responses = 0
+        self.num_correct = 0
+        self.response_time_sum = 0.0
+        self.options = Counter()
+
+
+# ✅ 미반영 응답을 한 배치 집계하여 question_stats_by_group 에 반영
+def aggregate_pending_responses(db: Session, batch_size: int = None) -> int:
+    """
+    아직 반영되지 않은(stats_applied = 0) responses 를 한 배치 읽어 문항별 그룹 통계에 반영합니다.
+    - 워터마크 행 잠금으로 동시에 하나의 집계기만 진행
+    - 시각 기반 워터마크가 아니라 행별 반영 표시 → 늦게 커밋된 행 / 서버 간 시계 차이에도 누락 없음
+    - 통계 반영과 stats_applied 표시를 한 트랜잭션으로 커밋 → 재시작해도 중복/누락 없음
+    - 워터마크의 last_created_at / last_id 는 진행 상황 확인용으로만 갱신
+    - 반환: 이번 배치에서 읽은 응답 수 (0 이면 더 이상 처리할 응답 없음)
+    """
+    batch_size = batch_size or settings.STATS_AGGREGATOR_BATCH_SIZE
+    watermark = lock_watermark(db, JOB_NAME)
+
+    rows = db.query(
+        UserResponse.response_id,
+        UserResponse.question_id,
+        UserResponse.group_value,
+        UserResponse.is_correct,
+        UserResponse.selected_option_ids,
+        UserResponse.response_time_sec,
+        UserResponse.created_at,
+    ).filter(
+        UserResponse.stats_applied == False
+    ).order_by(UserResponse.created_at, UserResponse.response_id).limit(batch_size).all()
+    if not rows:
+        db.rollback()  # 워터마크 잠금 해제
+        return 0
+
+    # ✅ 1. 메모리 내에서 (문항, 학교, 연, 월) 단위로 합산
+    buckets: Dict[Tuple[str, str, int, int], _Bucket] = {}
+    for row in rows:
+        if not row.group_value:
+            continue
+        key = (row.question_id, row.group_value, row.created_at.year, row.created_at.month)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = _Bucket()
+        bucket.num_responses += 1
+        bucket.num_correct += 1 if row.is_correct else 0
+        bucket.response_time_sum += row.response_time_sec or 0.0
+        for opt_id in row.selected_option_ids or []:
+            bucket.options[str(opt_id)] += 1
+
+    # ✅ 2. 기존 통계 행 일괄 잠금 조회 후 병합 → 3. 다중 행 UPSERT 1회
+    if buckets:
+        existing = (
+            db.query(QuestionStatsByGroup)
+            .filter(
+                QuestionStatsByGroup.question_id.in_({k[0] for k in buckets}),
+                QuestionStatsByGroup.group_type == GroupTypeEnum.school,
+                QuestionStatsByGroup.group_value.in_({k[1] for k in buckets}),
+                QuestionStatsByGroup.year.in_({k[2] for k in buckets}),
+                QuestionStatsByGroup.month.in_({k[3] for k in buckets}),
+            )
+            .with_for_update()
+            .all()
+        )
+        stat_map = {(s.question_id, s.group_value, s.year, s.month): s for s in existing}
+
+        values = []
+        for key, bucket in buckets.items():
+            stat = stat_map.get(key)
+            previous_n = (stat.num_responses or 0) if stat else 0
+            total_n = previous_n + bucket.num_responses
+
+            correct_rate = ((stat.correct_rate or 0.0) * previous_n if stat else 0.0) + bucket.num_correct
+            avg_response_time = ((stat.avg_response_time or 0.0) * previous_n if stat else 0.0) + bucket.response_time_sum
+
+            dist = Counter(json.loads(stat.option_distribution_json or "{}")) if stat else Counter()
+            dist.update(bucket.options)
+
+            values.append({
+                "id": stat.id if stat else str(uuid.uuid4()),
+                "question_id": key[0],
+                "group_type": GroupTypeEnum.school,
+                "group_value": key[1],
+                "year": key[2],
+                "month": key[3],
+                "num_responses": total_n,
+                "correct_rate": correct_rate / total_n,
+                "avg_response_time": avg_response_time / total_n,
+                "option_distribution_json": json.dumps(dict(dist)),
+            })
+
+        stmt = mysql_insert(QuestionStatsByGroup.__table__).values(values)
+        stmt = stmt.on_duplicate_key_update(
+            num_responses=stmt.inserted.num_responses,
+            correct_rate=stmt.inserted.correct_rate,
+            avg_response_time=stmt.inserted.avg_response_time,
+            option_distribution_json=stmt.inserted.option_distribution_json,
+        )
+        db.execute(stmt)
+
+    db.execute(
+        update(UserResponse)
+        .where(UserResponse.response_id.in_([row.response_id for row in rows]))
+        .values(stats_applied=True)
+    )
+    last = rows[-1]
+    advance_watermark(watermark, last.created_at, last.response_id)
+    db.commit()
+    return len(rows)
+
+
+# ✅ 백그라운드 스레드에서 1회 실행 (세션 생성/정리 포함)
+def run_once() -> int:
+    db = SessionLocal()
+    try:
+        return aggregate_pending_responses(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# ✅ 앱 시작 시 main.py 에서 start() 호출
+aggregator_job = PeriodicJob(
+    name="question-stats-aggregator",
+    run_once=run_once,
+    interval_seconds=settings.STATS_AGGREGATOR_INTERVAL_SECONDS,
+)
+
+
+# ✅ 단독 실행: python -m backend.services.stats_aggregator (밀린 응답 전체 반영 후 종료)
+if __name__ == "__main__":
+    total = 0
+    while True:
+        processed = run_once()
+        if not processed:
+            break
+        total += processed
+        print(f"⏳ {total} responses aggregated...")
+    print(f"✅ Aggregation finished: {total} responses.")
@@ -0,0 +1,69 @@
+# backend/utils/backfill_blind_index.py
+# ✅ 기존 사용자 블라인드 인덱스 / 검색 토큰 백필
+# 실행: python -m backend.utils.backfill_blind_index
+
+from backend.database.database import SessionLocal
+from backend.core.security import aes_decrypt, aes_decrypt_many
+from backend.core.blind_index import email_index, phone_index
+from backend.crud.user import set_user_search_tokens
+from backend.models.user import User
+
+BATCH_SIZE = 500
+
+
+def backfill(batch_size: int = BATCH_SIZE) -> int:
+    """
+    email_bidx 가 비어 있는 사용자를 user_id 순서(keyset)로 배치 처리합니다.
+    - 배치마다 커밋 → 중단 후 다시 실행하면 남은 사용자부터 이어서 처리
+    - 복호화 실패 사용자는 건너뛰고 로그만 남김
+    """
+    db = SessionLocal()
+    total = 0
+    last_user_id = ""
+    try:
+        while True:
+            users = (
+                db.query(User)
+                .filter(User.email_bidx.is_(None), User.user_id > last_user_id)
+                .order_by(User.user_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not users:
+                break
+
+            # ✅ 배치 단위 일괄 복호화 (실패 시에만 사용자별로 다시 시도해 문제 행을 건너뜀)
+            try:
+                pairs = list(zip(
+                    aes_decrypt_many([u.email for u in users]),
+                    aes_decrypt_many([u.phone or None for u in users]),
+                ))
+            except Exception:
+                pairs = []
+                for user in users:
+                    try:
+                        pairs.append((aes_decrypt(user.email), aes_decrypt(user.phone) if user.phone else None))
+                    except Exception as e:
+                        print(f"❌ 복호화 실패 (user_id={user.user_id}): {e}")
+                        pairs.append((None, None))
+
+            for user, (email, phone) in zip(users, pairs):
+                if email is None:
+                    continue
+                user.email_bidx = email_index(email)
+                user.phone_bidx = phone_index(phone) if phone else None
+                set_user_search_tokens(db, user.user_id, email, phone)
+                total += 1
+
+            last_user_id = users[-1].user_id
+            db.commit()
+            print(f"⏳ {total}명 처리 (마지막 user_id={last_user_id})")
+    finally:
+        db.close()
+    return total
+
+
+if __name__ == "__main__":
+    print("⏳ 블라인드 인덱스 백필 시작...")
+    count = backfill()
+    print(f"✅ 완료: {count}명")
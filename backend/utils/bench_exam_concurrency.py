@@ -0,0 +1,196 @@
+# backend/utils/bench_exam_concurrency.py
+# ✅ 응시 hot path 동시 접속 부하 측정 (표준 라이브러리만 사용)
+# 실행: python -m backend.utils.bench_exam_concurrency http://localhost:8000 <test_id> [동시 응시자 수=500] [응시자당 요청 수=4]
+# 동기/비동기 비교는 같은 명령을 변경 전/후 서버에 각각 실행해 처리량과 지연 분포를 비교
+#
+# ✅ 로그인 vs 토큰 재발급 지연 비교
+# 실행: python -m backend.utils.bench_exam_concurrency http://localhost:8000 auth <email> <password> [횟수=20]
+# /api/login 을 횟수만큼 호출한 뒤, 받은 리프레시 토큰으로 /api/token/refresh 를 같은 횟수만큼 연쇄 호출
+# 계정별 로그인 제한(LOGIN_RATE_PER_ACCOUNT_BURST, 기본 5)에 걸리지 않도록 벤치 서버에서는 횟수 이상으로 설정
+#
+# ✅ 로그인 폭주 부하 테스트 (기본: 60초 동안 2000회를 일정 간격으로 시작)
+# 실행: python -m backend.utils.bench_exam_concurrency http://localhost:8000 login-load <password> [총 로그인 수=2000] [기간 초=60] [계정 수=400] [--signup]
+# 계정은 bench-login-{번호}@example.com (--signup 이면 먼저 /api/signup 으로 생성, 이미 있으면 건너뜀)
+# 요청마다 X-Forwarded-For 로 다른 클라이언트 IP 를 보냄 → 서버 TRUSTED_PROXIES 에 벤치 클라이언트 주소를 넣어야 IP 별 제한이 분산됨
+# 결과는 상태 코드별 건수 (200 / 429 요청 제한 / 503 bcrypt 대기열 초과) 와 성공 요청 지연 분포
+
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+LOGIN_LOAD_EMAIL = "bench-login-{}@example.com"
+LOGIN_LOAD_WORKERS = 300
+
+
+def _request(url: str, body: dict = None) -> float:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    started = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=60) as res:
+        res.read()
+    return time.perf_counter() - started
+
+
+def _post_json(url: str, body: dict, headers: dict = None):
+    """
+    POST 요청 1건 → (HTTP 상태 코드, 지연 초, 응답 JSON 또는 None)
+    - 4xx/5xx 도 예외 대신 상태 코드로 반환 (429 등 집계용)
+    """
+    req = urllib.request.Request(
+        url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json", **(headers or {})}
+    )
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=60) as res:
+            payload = json.loads(res.read())
+            return res.status, time.perf_counter() - started, payload
+    except urllib.error.HTTPError as e:
+        e.read()
+        return e.code, time.perf_counter() - started, None
+
+
+def compare_login_refresh(base_url: str, email: str, password: str, count: int):
+    """
+    순차 호출로 /api/login (bcrypt 검증 포함) 과 /api/token/refresh (토큰 검증 + 행 1건 잠금) 지연을 비교합니다.
+    """
+    login_latencies, refresh_token = [], None
+    for _ in range(count):
+        status, latency, payload = _post_json(f"{base_url}/api/login", {"email": email, "password": password})
+        if status != 200:
+            print(f"❌ /api/login → {status} (계정 / 요청 제한 설정 확인)")
+            return
+        login_latencies.append(latency)
+        refresh_token = payload["refresh_token"]
+
+    refresh_latencies = []
+    for _ in range(count):
+        status, latency, payload = _post_json(f"{base_url}/api/token/refresh", {"refresh_token": refresh_token})
+        if status != 200:
+            print(f"❌ /api/token/refresh → {status}")
+            return
+        refresh_latencies.append(latency)
+        refresh_token = payload["refresh_token"]  # ✅ 회전된 토큰으로 다음 요청
+
+    for label, values in (("/api/login", login_latencies), ("/api/token/refresh", refresh_latencies)):
+        print(
+            f"✅ {label:<20} {count}회 p50={_percentile(values, 0.5) * 1000:.1f}ms"
+            f" p95={_percentile(values, 0.95) * 1000:.1f}ms max={max(values) * 1000:.1f}ms"
+        )
+
+
+def _client_ip(index: int) -> dict:
+    return {"X-Forwarded-For": f"10.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"}
+
+
+def signup_accounts(base_url: str, password: str, accounts: int):
+    def signup(i):
+        status, _, _ = _post_json(f"{base_url}/api/signup", {
+            "email": LOGIN_LOAD_EMAIL.format(i), "password": password, "password_confirm": password,
+            "name": "bench", "phone": f"010-{9000 + i // 10000}-{i % 10000:04d}", "nickname": f"bench-login-{i}",
+        }, _client_ip(i))
+        return status
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        statuses = Counter(pool.map(signup, range(accounts)))
+    print(f"🌱 계정 준비 {accounts}개: {dict(statuses)} (400 = 이미 존재)")
+
+
+def login_load(base_url: str, password: str, total: int, duration: float, accounts: int):
+    """
+    total 회 로그인을 duration 초 동안 일정 간격으로 시작합니다 (계정 / 클라이언트 IP 는 순환).
+    """
+    started = time.perf_counter()
+
+    def login(i):
+        delay = started + i * duration / total - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            return _post_json(
+                f"{base_url}/api/login",
+                {"email": LOGIN_LOAD_EMAIL.format(i % accounts), "password": password},
+                _client_ip(i)
+            )[:2]
+        except Exception:
+            return None, 0.0  # ✅ 연결 실패 / 타임아웃
+
+    with ThreadPoolExecutor(max_workers=LOGIN_LOAD_WORKERS) as pool:
+        results = list(pool.map(login, range(total)))
+    elapsed = time.perf_counter() - started
+
+    statuses = Counter(status for status, _ in results)
+    ok = [latency for status, latency in results if status == 200]
+    print(f"✅ {total} logins in {elapsed:.2f}s → {total / elapsed:.1f} req/sec, 상태 코드 {dict(statuses)}")
+    if ok:
+        print(f"   200 p50={_percentile(ok, 0.5) * 1000:.0f}ms p95={_percentile(ok, 0.95) * 1000:.0f}ms p99={_percentile(ok, 0.99) * 1000:.0f}ms")
+
+
+def candidate(base_url: str, test_id: str, index: int, rounds: int):
+    """
+    응시자 1명: 문항 조회 → 시작 → (rounds-2)회 문항 재조회 → 제출
+    """
+    latencies = []
+    questions = None
+    try:
+        started = time.perf_counter()
+        with urllib.request.urlopen(f"{base_url}/api/tests/{test_id}/questions-public", timeout=60) as res:
+            questions = json.loads(res.read())
+        latencies.append(time.perf_counter() - started)
+
+        latencies.append(_request(f"{base_url}/api/tests/{test_id}/start", {"mode": "bench"}))
+        for _ in range(max(0, rounds - 2)):
+            latencies.append(_request(f"{base_url}/api/tests/{test_id}/questions-public"))
+
+        responses = [
+            {"question_id": q["question_id"], "selected_option_ids": [q["options"][0]["option_id"]] if q["options"] else []}
+            for q in questions["questions"]
+        ]
+        latencies.append(_request(
+            f"{base_url}/api/tests/{test_id}/submit",
+            {"email": f"bench-{index}@example.com", "responses": responses}
+        ))
+        return latencies, None
+    except Exception as e:
+        return latencies, e
+
+
+def _percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+if __name__ == "__main__":
+    base_url = sys.argv[1].rstrip("/")
+    if sys.argv[2] == "auth":
+        compare_login_refresh(base_url, sys.argv[3], sys.argv[4], int(sys.argv[5]) if len(sys.argv) > 5 else 20)
+        sys.exit(0)
+    if sys.argv[2] == "login-load":
+        args = [a for a in sys.argv[3:] if a != "--signup"]
+        password = args[0]
+        total = int(args[1]) if len(args) > 1 else 2000
+        duration = float(args[2]) if len(args) > 2 else 60
+        accounts = int(args[3]) if len(args) > 3 else 400
+        if "--signup" in sys.argv:
+            signup_accounts(base_url, password, accounts)
+        login_load(base_url, password, total, duration, accounts)
+        sys.exit(0)
+
+    test_id = sys.argv[2]
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+    rounds = int(sys.argv[4]) if len(sys.argv) > 4 else 4
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: candidate(base_url, test_id, i, rounds), range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [t for lat, _ in results for t in lat]
+    errors = [e for _, e in results if e is not None]
+    print(f"✅ {concurrency} candidates, {len(latencies)} requests in {elapsed:.2f}s → {len(latencies) / elapsed:.1f} req/sec")
+    print(f"   p50={_percentile(latencies, 0.5) * 1000:.0f}ms p95={_percentile(latencies, 0.95) * 1000:.0f}ms p99={_percentile(latencies, 0.99) * 1000:.0f}ms")
+    if errors:
+        print(f"❌ {len(errors)} candidates failed (예: {errors[0]!r})")
@@ -0,0 +1,149 @@
+# backend/utils/bench_export.py
+# ✅ 학교 단위 결과 내보내기 시드 벤치마크 (표준 라이브러리 + 기존 DB 세션만 사용)
+# 실행: python -m backend.utils.bench_export [학생 수=20000] [검사 수=3] [반복 횟수=3]
+# 벤치마크 전용 학교 학생/프로필/검사/리포트를 시드한 뒤
+#   - 기존 방식: 학생 / 리포트 전체 조회 후 리포트마다 학생 목록 선형 탐색 (학생 수 × 리포트 수 비교)
+#   - 스트리밍 내보내기: services/export 단일 패스 피벗 (csv / csv.gz / parquet, parquet 는 pyarrow 설치 시)
+# 을 비교하고, 종료 시 시드 데이터를 삭제
+
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from backend.core.cache import invalidate_test_catalog
+from backend.database.database import SessionLocal
+from backend.models.test import Test, TestReport, TestTypeEnum
+from backend.models.user import User, UserProfile
+from backend.services import export
+
+SEED_BATCH_SIZE = 5000
+NUM_QUESTIONS = 40
+
+
+def seed(db, num_students: int, num_tests: int):
+    """
+    벤치마크 전용 학교 학생 num_students 명 (사용자 + 프로필) 과 검사 num_tests 개,
+    학생마다 검사별 리포트 1건을 배치 INSERT 합니다.
+    - 점수는 정규분포 근사값, 생성일은 최근 1년 내 임의 분포
+    """
+    run_id = uuid.uuid4().hex[:8]
+    school = f"bench-school-{run_id}"
+    test_ids = [str(uuid.uuid4()) for _ in range(num_tests)]
+    for i, test_id in enumerate(test_ids):
+        db.add(Test(
+            test_id=test_id, test_name=f"bench-export-{run_id}-{i}", test_type=TestTypeEnum.aptitude,
+            version="bench", duration_minutes=60, question_count=NUM_QUESTIONS
+        ))
+    db.commit()
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    user_ids = []
+    seeded = 0
+    while seeded < num_students:
+        users, profiles, reports = [], [], []
+        for i in range(seeded, min(num_students, seeded + SEED_BATCH_SIZE)):
+            user_id = str(uuid.uuid4())
+            email = f"bench-{run_id}-{i}@example.com"
+            users.append({
+                "user_id": user_id, "email": email, "password": "-", "name": "bench",
+                "nickname": f"bench-{i}", "is_active": True, "created_at": now,
+            })
+            profiles.append({"user_id": user_id, "email": email, "school": school})
+            for test_id in test_ids:
+                correct = max(0, min(NUM_QUESTIONS, int(rng.gauss(NUM_QUESTIONS * 0.6, NUM_QUESTIONS * 0.15))))
+                reports.append({
+                    "report_id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "email": email,
+                    "test_id": test_id,
+                    "score_total": float(correct),
+                    "score_standardized": round(correct / NUM_QUESTIONS * 100, 2),
+                    "score_level": "bench",
+                    "report_generated_at": now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600)),
+                })
+            user_ids.append(user_id)
+        db.execute(insert(User), users)
+        db.execute(insert(UserProfile), profiles)
+        db.execute(insert(TestReport), reports)
+        db.commit()
+        seeded += len(users)
+        print(f"🌱 시드 {seeded}/{num_students}명")
+    invalidate_test_catalog()  # ✅ 시드한 검사가 열 구성에 포함되도록
+    return school, test_ids, user_ids
+
+
+def cleanup(db, test_ids, user_ids):
+    for start in range(0, len(user_ids), SEED_BATCH_SIZE):
+        batch = user_ids[start:start + SEED_BATCH_SIZE]
+        db.query(TestReport).filter(TestReport.user_id.in_(batch)).delete(synchronize_session=False)
+        db.query(UserProfile).filter(UserProfile.user_id.in_(batch)).delete(synchronize_session=False)
+        db.query(User).filter(User.user_id.in_(batch)).delete(synchronize_session=False)
+        db.commit()
+    db.query(Test).filter(Test.test_id.in_(test_ids)).delete(synchronize_session=False)
+    db.commit()
+
+
+# ✅ 기존 방식 재현: 리포트마다 next(... for u in users if u.email == r.email) 선형 탐색
+def legacy_export(db, school: str) -> int:
+    users = (
+        db.query(User.user_id, User.nickname, User.created_at, UserProfile.email)
+        .join(UserProfile, UserProfile.user_id == User.user_id)
+        .filter(UserProfile.school == school, User.is_active == True)
+        .all()
+    )
+    emails = [u.email for u in users]
+    reports = db.query(TestReport).filter(TestReport.email.in_(emails)).all()
+    tests = {t.test_id: t.test_name for t in db.query(Test).all()}
+
+    wide = {}
+    for r in reports:
+        user_id = next((u.user_id for u in users if u.email == r.email), "unknown")
+        row = wide.setdefault(user_id, {})
+        row.setdefault(f"{tests.get(r.test_id, 'Unknown')}_score", r.score_total)
+        row.setdefault(f"{tests.get(r.test_id, 'Unknown')}_date", r.report_generated_at.strftime("%Y-%m-%d"))
+    return len(users)
+
+
+# ✅ 스트리밍 내보내기: 본문을 끝까지 소비하고 바이트 수 반환
+def streamed_export(db, school: str, fmt: str) -> int:
+    plan = export.build_export_plan(db, school=school, active_only=True)
+    return sum(len(chunk) for chunk in export.stream_export(plan, fmt))
+
+
+def measure(label: str, fn, repeat: int):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(
+        f"⏱️ {label}: 최소 {timings[0] * 1000:.1f}ms / 중앙값 {timings[len(timings) // 2] * 1000:.1f}ms"
+        f" / 최대 {timings[-1] * 1000:.1f}ms (결과 {result})"
+    )
+
+
+if __name__ == "__main__":
+    num_students = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    num_tests = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    db = SessionLocal()
+    school, test_ids, user_ids = seed(db, num_students, num_tests)
+    try:
+        # ✅ 기존 방식은 학생 수 × 리포트 수 비교라 1회만 측정
+        measure("기존 리포트별 선형 탐색 (학생 수)", lambda: legacy_export(db, school), 1)
+        for fmt in export.EXPORT_FORMATS:
+            if fmt == "parquet" and not export.parquet_available():
+                print("⚠️ pyarrow 미설치 → parquet 건너뜀")
+                continue
+            measure(f"스트리밍 내보내기 {fmt} (바이트)", lambda: streamed_export(db, school, fmt), repeat)
+    finally:
+        cleanup(db, test_ids, user_ids)
+        db.close()
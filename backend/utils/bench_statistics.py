@@ -0,0 +1,92 @@
+# backend/utils/bench_statistics.py
+# ✅ 관리자 통계 집계 쿼리 시드 벤치마크 (표준 라이브러리 + 기존 DB 세션만 사용)
+# 실행: python -m backend.utils.bench_statistics [리포트 수=1000000] [반복 횟수=5]
+# 벤치마크 전용 검사/사용자/리포트를 시드한 뒤 집계 함수별 지연을 측정하고, 종료 시 시드 데이터를 삭제
+
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from backend.database.database import SessionLocal
+from backend.crud import statistics
+from backend.models.test import Test, TestReport, TestTypeEnum
+from backend.models.user import User
+
+SEED_BATCH_SIZE = 10000
+NUM_QUESTIONS = 40
+
+
+def seed(db, num_reports: int):
+    """
+    벤치마크 전용 검사 1개 + 사용자 1명 + 리포트 num_reports 건을 배치 INSERT 합니다.
+    - 점수는 정규분포 근사값, 생성일은 최근 1년 내 임의 분포
+    """
+    test_id = str(uuid.uuid4())
+    user_id = str(uuid.uuid4())
+    db.add(Test(
+        test_id=test_id, test_name="bench-statistics", test_type=TestTypeEnum.aptitude,
+        version="bench", duration_minutes=60, question_count=NUM_QUESTIONS
+    ))
+    db.add(User(user_id=user_id, email=f"bench-{user_id}@example.com", password="-", name="bench"))
+    db.commit()
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    seeded = 0
+    while seeded < num_reports:
+        rows = []
+        for i in range(seeded, min(num_reports, seeded + SEED_BATCH_SIZE)):
+            correct = max(0, min(NUM_QUESTIONS, int(rng.gauss(NUM_QUESTIONS * 0.6, NUM_QUESTIONS * 0.15))))
+            rows.append({
+                "report_id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "email": f"bench-{i}@example.com",
+                "test_id": test_id,
+                "score_total": float(correct),
+                "score_standardized": round(correct / NUM_QUESTIONS * 100, 2),
+                "score_level": "bench",
+                "report_generated_at": now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600)),
+                "num_questions": NUM_QUESTIONS,
+                "num_answered": NUM_QUESTIONS,
+            })
+        db.execute(insert(TestReport), rows)
+        db.commit()
+        seeded += len(rows)
+        print(f"🌱 시드 {seeded}/{num_reports}")
+    return test_id, user_id
+
+
+def cleanup(db, test_id: str, user_id: str):
+    db.query(TestReport).filter(TestReport.test_id == test_id).delete(synchronize_session=False)
+    db.query(Test).filter(Test.test_id == test_id).delete(synchronize_session=False)
+    db.query(User).filter(User.user_id == user_id).delete(synchronize_session=False)
+    db.commit()
+
+
+def measure(label: str, fn, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    print(f"⏱️ {label}: 최소 {timings[0] * 1000:.1f}ms / 중앙값 {timings[len(timings) // 2] * 1000:.1f}ms / 최대 {timings[-1] * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    num_reports = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    db = SessionLocal()
+    test_id, user_id = seed(db, num_reports)
+    try:
+        measure("get_all_test_stats", lambda: statistics.get_all_test_stats(db), repeat)
+        measure("get_test_detail_stats", lambda: statistics.get_test_detail_stats(db, test_id), repeat)
+        measure("get_response_stats", lambda: statistics.get_response_stats(db), repeat)
+    finally:
+        cleanup(db, test_id, user_id)
+        db.close()
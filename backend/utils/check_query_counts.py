@@ -0,0 +1,147 @@
+# backend/utils/check_query_counts.py
+# ✅ hot path 쿼리 수 회귀 확인 (DATABASE_URL 의 DB 에 시드 데이터를 만들고 종료 시 삭제)
+# 실행: python -m backend.utils.check_query_counts [문항 수 ...=20 60 200]
+# 허용 쿼리 수를 넘으면 실행된 SQL 목록과 함께 AssertionError → 종료 코드 1
+
+import asyncio
+import sys
+import time
+import uuid
+from typing import List, NamedTuple
+
+from backend.database.database import SessionLocal, dispose_async_engine, engine, get_async_db, get_async_engine
+from backend.database.query_counter import assert_max_queries
+from backend.crud.test import load_test_with_questions
+from backend.models.option import Option
+from backend.models.question import Question, QuestionStatus
+from backend.models.test import Test, TestTypeEnum
+from backend.models.test_question_links import TestQuestionLink
+from backend.services.exam_payload import exam_payload_cache, get_exam_payload
+from backend.services.scoring import answer_key_cache, bulk_insert_responses, get_answer_key, score_answers
+
+OPTIONS_PER_QUESTION = 4
+
+# ✅ 채점 지연 측정 반복 횟수
+SCORING_REPEAT = 20
+
+
+# ✅ 제출 응답 (AnswerSubmission 과 같은 속성)
+class Answer(NamedTuple):
+    question_id: str
+    selected_option_ids: List[str]
+
+
+def seed_test(db, num_questions: int) -> str:
+    """
+    문항 num_questions 개 (선택지 4개, 첫 번째가 정답) 를 가진 검사를 만듭니다.
+    - questions.test_id 직접 연결 + test_question_links 연결 모두 설정 (두 조회 방식 모두 확인)
+    """
+    test_id = str(uuid.uuid4())
+    db.add(Test(
+        test_id=test_id, test_name=f"query-count-{num_questions}", test_type=TestTypeEnum.aptitude,
+        version="bench", duration_minutes=60, question_count=num_questions
+    ))
+    for index in range(num_questions):
+        question_id = str(uuid.uuid4())
+        db.add(Question(
+            question_id=question_id, test_id=test_id, question_type="text", question_text=f"문항 {index + 1}",
+            order_index=index, status=QuestionStatus.approved
+        ))
+        db.add(TestQuestionLink(test_id=test_id, question_id=question_id, order_index=index))
+        for order in range(OPTIONS_PER_QUESTION):
+            db.add(Option(question_id=question_id, option_text=f"보기 {order + 1}", is_correct=order == 0, option_order=order))
+    db.commit()
+    return test_id
+
+
+def cleanup_test(db, test_id: str):
+    question_ids = [qid for (qid,) in db.query(TestQuestionLink.question_id).filter(TestQuestionLink.test_id == test_id).all()]
+    db.query(TestQuestionLink).filter(TestQuestionLink.test_id == test_id).delete(synchronize_session=False)
+    if question_ids:
+        db.query(Option).filter(Option.question_id.in_(question_ids)).delete(synchronize_session=False)
+        db.query(Question).filter(Question.question_id.in_(question_ids)).delete(synchronize_session=False)
+    db.query(Test).filter(Test.test_id == test_id).delete(synchronize_session=False)
+    db.commit()
+
+
+# ✅ 검사 + 문항 + 선택지 조회: 최대 2회 (문항 수와 무관)
+def check_load_test_with_questions(db, test_id: str, num_questions: int):
+    for linked in (True, False):
+        db.expunge_all()  # 식별자 맵 비움 → 이미 로드된 객체 재사용 없이 측정
+        label = f"load_test_with_questions(linked={linked})"
+        with assert_max_queries(engine, 2, label) as counter:
+            loaded = load_test_with_questions(db, test_id, linked=linked)
+            options = sum(len(q.options) for q in loaded.questions)  # 선택지 접근 시 추가 쿼리 없어야 함
+        assert len(loaded.questions) == num_questions
+        assert options == num_questions * OPTIONS_PER_QUESTION
+        print(f"✅ {label} ({num_questions}문항): {counter.count}회")
+
+
+# ✅ 제출 채점: 정답표 미스 1회 + 응답 INSERT 1회 (문항 수와 무관), 정답표 적중 시 INSERT 1회
+def check_submit_scoring(db, test_id: str, num_questions: int):
+    answers = [
+        Answer(question_id=q.question_id, selected_option_ids=[o.option_id for o in q.options if o.is_correct])
+        for q in load_test_with_questions(db, test_id).questions
+    ]
+    db.expunge_all()
+
+    answer_key_cache.clear()
+    with assert_max_queries(engine, 2, "submit scoring (정답표 미스)") as miss:
+        total_score, scored = score_answers(get_answer_key(db, test_id), answers)
+        bulk_insert_responses(db, test_id, "query-count@example.com", scored)
+    db.rollback()
+    assert total_score == num_questions
+
+    timings = []
+    with assert_max_queries(engine, SCORING_REPEAT, "submit scoring (정답표 적중)") as hit:
+        for _ in range(SCORING_REPEAT):
+            started = time.perf_counter()
+            _, scored = score_answers(get_answer_key(db, test_id), answers)
+            bulk_insert_responses(db, test_id, "query-count@example.com", scored)
+            timings.append(time.perf_counter() - started)
+            db.rollback()
+    timings.sort()
+    print(
+        f"✅ submit scoring ({num_questions}문항): 미스 {miss.count}회 / 적중 {hit.count // SCORING_REPEAT}회, "
+        f"중앙값 {timings[len(timings) // 2] * 1000:.1f}ms / 최대 {timings[-1] * 1000:.1f}ms"
+    )
+
+
+# ✅ 비동기 응시 문항 조회 (questions-public): 캐시 미스 2회, 적중 0회 — 비동기 엔진에서 측정
+async def _check_exam_payload_async(test_id: str, num_questions: int):
+    sync_engine = get_async_engine().sync_engine
+    try:
+        async for db in get_async_db():
+            exam_payload_cache.clear()
+            with assert_max_queries(sync_engine, 2, "questions-public (캐시 미스)") as miss:
+                payload = await db.run_sync(get_exam_payload, test_id)
+            with assert_max_queries(sync_engine, 0, "questions-public (캐시 적중)"):
+                assert await db.run_sync(get_exam_payload, test_id) is payload
+    finally:
+        await dispose_async_engine()
+    print(f"✅ questions-public async ({num_questions}문항): 미스 {miss.count}회 / 적중 0회")
+
+
+def check_exam_payload_async(db, test_id: str, num_questions: int):
+    asyncio.run(_check_exam_payload_async(test_id, num_questions))
+
+
+CHECKS = [check_load_test_with_questions, check_submit_scoring, check_exam_payload_async]
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [20, 60, 200]
+
+    db = SessionLocal()
+    try:
+        for num_questions in sizes:
+            test_id = seed_test(db, num_questions)
+            try:
+                for check in CHECKS:
+                    check(db, test_id, num_questions)
+            finally:
+                db.rollback()
+                cleanup_test(db, test_id)
+    finally:
+        db.close()
+    print("✅ 모든 쿼리 수 검사 통과")
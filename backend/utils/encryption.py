@@ -1,16 +1,19 @@
 # narulab/utils/encryption.py
 
 from Crypto.Cipher import AES
+from typing import List, Optional
 import base64
 import hashlib
 
 # ✅ 실제 사용 중인 암호화 키로 교체해야 함
 SECRET_KEY = "narulab-secret-key"
 
+# ✅ 키 / IV 는 한 번만 계산 (CBC 암호 객체는 체인 상태를 가지므로 호출마다 새로 생성)
+_KEY = hashlib.sha256(SECRET_KEY.encode()).digest()
+_IV = _KEY[:16]
+
 def get_cipher():
-    key = hashlib.sha256(SECRET_KEY.encode()).digest()
-    iv = key[:16]
-    return AES.new(key, AES.MODE_CBC, iv)
+    return AES.new(_KEY, AES.MODE_CBC, _IV)
 
 def aes_decrypt(encrypted_text):
     cipher = get_cipher()
@@ -18,3 +21,7 @@ def aes_decrypt(encrypted_text):
     decrypted = cipher.decrypt(decoded)
     pad = decrypted[-1]
     return decrypted[:-pad].decode('utf-8')
+
+# ✅ 목록 일괄 복호화 (None 은 그대로 유지)
+def aes_decrypt_many(values: List[Optional[str]]) -> List[Optional[str]]:
+    return [aes_decrypt(v) if v is not None else None for v in values]
@@ -7,6 +7,7 @@ from backend.core.config import settings  # ✅ .env 환경설정에서 DATABASE
 # 주의: models/ 디렉토리 내 실제 존재하는 모든 모델을 정확히 import해야 create_all이 정상 작동함
 from backend.models import (
     User, UserProfile, UserDeletionLog,         # ✅ user.py
+    UserSearchToken,                            # ✅ user_search_token.py
     InstitutionAdmin,                           # ✅ institution_admin.py
     ReportRule, ReportSTENDistribution,         # ✅ report_rule.py, report_sten_distribution.py
     UserTestHistory,                                  # ✅ response.py
@@ -19,7 +20,10 @@ from backend.models import (
     TestAnalyticsByGroup,                        # ✅ test_analytics_by_group.py
     Notification,                                # ✅ notification.py
     VerificationCode,                            # ✅ verification_code.py
-    NormGroup                                    # ✅ norm_group.py
+    NormGroup,                                   # ✅ norm_group.py
+    AggregationWatermark,                        # ✅ aggregation_watermark.py
+    PdfExportJob,                                # ✅ pdf_export_job.py
+    RefreshToken                                 # ✅ refresh_token.py
 )
 
 # ✅ 현재 로드된 데이터베이스 URL 출력 (디버깅용)
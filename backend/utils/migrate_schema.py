@@ -0,0 +1,45 @@
+# backend/utils/migrate_schema.py
+# ✅ 기존 DB 스키마를 현재 모델에 맞게 업그레이드 (create_all 은 기존 테이블에 컬럼/인덱스/ENUM 값을 추가하지 않음)
+# 실행: python -m backend.utils.migrate_schema
+# 여러 번 실행해도 안전 — 각 단계가 information_schema 로 현재 상태를 확인하고 빠진 것만 적용
+#
+# 순서
+#   1. 없는 테이블 생성 (새 DB 는 여기서 현재 모델 그대로 만들어지고 이후 단계는 건너뜀)
+#   2. 기능별 업그레이드 단계 (backend/migrations, MIGRATIONS 순서대로 DDL + 백필)
+
+from backend.database.database import Base, engine
+from backend.migrations import (
+    blind_index, export_indexes, institution_admin_approval, pdf_export_jobs, question_list_indexes,
+    question_stats_aggregator, refresh_tokens, report_prerender, response_email, statistics_indexes,
+    test_analytics_materializer,
+)
+import backend.models  # noqa: F401  ✅ 모든 모델을 메타데이터에 등록
+
+# ✅ 기능별 업그레이드 단계 (순서대로 실행, 각 단계는 재실행해도 안전)
+MIGRATIONS = [
+    response_email,
+    question_stats_aggregator,
+    test_analytics_materializer,
+    statistics_indexes,
+    export_indexes,
+    pdf_export_jobs,
+    report_prerender,
+    institution_admin_approval,
+    refresh_tokens,
+    blind_index,
+    question_list_indexes,
+]
+
+
+def migrate():
+    print("⏳ 새 테이블 생성...")
+    Base.metadata.create_all(bind=engine)
+
+    for migration in MIGRATIONS:
+        print(f"⏳ {migration.__name__.rsplit('.', 1)[-1]}...")
+        migration.upgrade()
+
+
+if __name__ == "__main__":
+    migrate()
+    print("✅ 스키마 마이그레이션 완료")
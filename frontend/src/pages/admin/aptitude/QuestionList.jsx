@@ -16,26 +16,36 @@ export default function QuestionList() {
     const [search, setSearch] = useState("");
     const [message, setMessage] = useState("");
     const [editMode, setEditMode] = useState(false);
+    const [nextCursor, setNextCursor] = useState(null); // ✅ 다음 페이지 커서 (없으면 마지막 페이지)
+    const [totalCount, setTotalCount] = useState(0);
 
+    const PAGE_SIZE = 100;
 
-    // ✅ 문항 목록 로드 (최초 실행 시)
-    const fetchQuestions = async () => {
+    // ✅ 문항 목록 로드 (페이지 단위, cursor 가 있으면 이어서 불러오기)
+    const fetchQuestions = async (cursor = null) => {
         try {
+            const params = { limit: PAGE_SIZE };
+            if (examType === "aptitude" || examType === "personality") params.usage_type = examType;
+            if (cursor) params.cursor = cursor;
+
             const res = await axios.get("/api/admin/questions", {
+                params,
                 headers: {
                     Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
                 },
             });
-            setQuestions(res.data);
-            setFiltered(res.data);
+            setQuestions((prev) => (cursor ? [...prev, ...res.data] : res.data));
+            setNextCursor(res.headers["x-next-cursor"] || null);
+            setTotalCount(Number(res.headers["x-total-count"] || 0));
         } catch {
             setMessage("문항 목록을 불러오지 못했습니다.");
         }
     };
 
+    // ✅ 최초 실행 + 검사유형 변경 시 첫 페이지부터 다시 로드
     useEffect(() => {
         fetchQuestions();
-    }, []);
+    }, [examType]);
 
     // ✅ 필터/검색 적용
     useEffect(() => {
@@ -143,6 +153,18 @@ export default function QuestionList() {
                 ))}
             </div>
 
+            {/* ✅ 다음 페이지 불러오기 */}
+            {nextCursor && (
+                <div className="text-center mt-4">
+                    <button
+                        onClick={() => fetchQuestions(nextCursor)}
+                        className="border rounded px-4 py-2 text-sm hover:bg-gray-50"
+                    >
+                        더 보기 ({questions.length} / {totalCount})
+                    </button>
+                </div>
+            )}
+
             {/* ✅ 조건 불만족 시 안내 */}
             {filtered.length === 0 && (
                 <p className="text-gray-500 text-center mt-4">